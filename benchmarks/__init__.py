@@ -0,0 +1,3 @@
+""" TreeScript Files Benchmarks.
+ - Run each module from the repository root, ie: python -m benchmarks.bench_path_stack
+"""
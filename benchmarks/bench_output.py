@@ -0,0 +1,37 @@
+""" Benchmark the path emitter on a million-path tree, against print().
+ - Every separator is written by write_paths, which joins and encodes each chunk of paths once.
+ - Output goes to the null device, so only the cost of formatting and writing is measured.
+"""
+from os import devnull
+from timeit import repeat
+
+from treescript_files.output_writer import write_paths
+
+
+_SEPARATORS = (('newline', '\n'), ('space', ' '), ('null', '\0'))
+
+
+def million_paths(count: int = 1_000_000) -> list[str]:
+    """ Paths in a few thousand directories, like the output of a large Tree file.
+    """
+    return [f'project/src/package_{i // 1000}/module_{i // 50 % 20}/file_{i}.py' for i in range(count)]
+
+
+def _time(write, number: int = 3) -> float:
+    with open(devnull, 'w') as output:
+        return min(repeat(lambda: write(output), number=number, repeat=3)) / number
+
+
+def main():
+    paths = million_paths()
+    per_path = _time(lambda output: [print(path, file=output) for path in paths], number=1)
+    print(f'{len(paths)} paths, print() per path: {per_path * 1000:.0f} ms')
+    for name, separator in _SEPARATORS:
+        joined = _time(lambda output: print(separator.join(paths), file=output))
+        emitted = _time(lambda output: write_paths(iter(paths), output.buffer, separator))
+        print(f'{name}: print(join) {joined * 1000:.0f} ms, write_paths {emitted * 1000:.0f} ms, '
+              f'{per_path / emitted:.1f}x faster than print() per path, {joined / emitted:.2f}x faster than print(join)')
+
+
+if __name__ == '__main__':
+    main()
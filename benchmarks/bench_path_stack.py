@@ -0,0 +1,75 @@
+""" Benchmark the PathStack prefix cache on deep and wide synthetic trees.
+ - Compares against a reference stack that joins every directory name for each file.
+"""
+from timeit import repeat
+
+from treescript_files.path_stack import PathStack
+from treescript_files.tree_data import TreeData
+from treescript_files.tree_reader import _process_tree_data
+
+
+class _JoiningPathStack(PathStack):
+    """ The previous PathStack behaviour: join the whole stack for every file.
+    """
+
+    def join_stack(self) -> str:
+        if len(self._stack) == 0:
+            return self._prefixes[0]
+        return self._prefixes[0] + self._separator.join(self._stack) + self._separator
+
+
+def deep_tree(depth: int = 64, files_per_dir: int = 32) -> list[TreeData]:
+    """ A single chain of directories, with files at every level.
+    """
+    nodes = []
+    line_number = 0
+    for level in range(depth):
+        line_number += 1
+        nodes.append(TreeData(line_number, level, True, f'directory_{level}'))
+        for i in range(files_per_dir):
+            line_number += 1
+            nodes.append(TreeData(line_number, level + 1, False, f'file_{i}.py'))
+    return nodes
+
+
+def wide_tree(dirs: int = 2000, depth: int = 6, files_per_dir: int = 8) -> list[TreeData]:
+    """ Many sibling directories at a moderate depth, each with a few files.
+    """
+    nodes = []
+    line_number = 0
+    for level in range(depth - 1):
+        line_number += 1
+        nodes.append(TreeData(line_number, level, True, f'package_{level}'))
+    for d in range(dirs):
+        line_number += 1
+        nodes.append(TreeData(line_number, depth - 1, True, f'module_{d}'))
+        for i in range(files_per_dir):
+            line_number += 1
+            nodes.append(TreeData(line_number, depth, False, f'file_{i}.py'))
+    return nodes
+
+
+def _time_stack(stack_type: type, nodes: list[TreeData]) -> float:
+    import treescript_files.tree_reader as tree_reader
+    original = tree_reader.PathStack
+    tree_reader.PathStack = stack_type
+    try:
+        return min(repeat(
+            lambda: sum(1 for _ in _process_tree_data(iter(nodes), 'parent/')),
+            number=3,
+            repeat=5,
+        )) / 3
+    finally:
+        tree_reader.PathStack = original
+
+
+def main():
+    for name, nodes in (('deep', deep_tree()), ('wide', wide_tree())):
+        joined = _time_stack(_JoiningPathStack, nodes)
+        cached = _time_stack(PathStack, nodes)
+        print(f'{name}: {len(nodes)} nodes, join per file {joined * 1000:.2f} ms, '
+              f'cached prefix {cached * 1000:.2f} ms, speedup {joined / cached:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+""" Start Up Regression Check.
+ - Runs the command line program on a small TreeScript file with -X importtime.
+ - Reports the modules and import time added on top of a bare interpreter, and the wall time.
+ - Fails when a deferred module is imported, or the import time exceeds the target.
+
+**Usage:**
+ python -m benchmarks.bench_startup --target-ms 30
+"""
+import subprocess
+import sys
+from argparse import ArgumentParser
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+
+# Modules that the single file invocation must not import
+DEFERRED_MODULES = ('argparse', 'dataclasses', 'pathlib')
+
+_PACKAGE_ROOT = os_path.dirname(os_path.dirname(os_path.abspath(__file__)))
+
+
+def import_times(
+    arguments: list[str],
+) -> dict[str, int]:
+    """ Run the interpreter with -X importtime, and collect the self time of each imported module.
+
+**Parameters:**
+ - arguments (list[str]): The interpreter arguments following -X importtime.
+
+**Returns:**
+ dict[str, int] - The self import time in microseconds, by module name.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *arguments],
+        capture_output=True, text=True, cwd=_PACKAGE_ROOT, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or len(fields := line[12:].split('|')) != 3:
+            continue
+        if not (self_time := fields[0].strip()).isdigit():
+            continue # The header line
+        times[fields[2].strip()] = int(self_time)
+    return times
+
+
+def measure_startup(
+    tree_file: str,
+    repeat: int = 10,
+) -> dict:
+    """ Measure the modules, import time, and wall time that the program adds to a bare interpreter.
+
+**Parameters:**
+ - tree_file (str): The TreeScript file to run the program on.
+ - repeat (int): The number of runs; the best is reported.
+
+**Returns:**
+ dict - The added modules, the added import time, and the added wall time in milliseconds.
+    """
+    program = ['-m', 'treescript_files', tree_file]
+    baseline = import_times(['-c', 'pass'])
+    best_import = float('inf')
+    for _ in range(repeat):
+        added = {k: v for k, v in import_times(program).items() if k not in baseline}
+        best_import = min(best_import, sum(added.values()) / 1000)
+    return {
+        'modules': sorted(added),
+        'import_ms': best_import,
+        'wall_ms': _best_wall_time(program, repeat) - _best_wall_time(['-c', 'pass'], repeat),
+    }
+
+
+def _best_wall_time(
+    arguments: list[str],
+    repeat: int,
+) -> float:
+    """ The best wall time of the interpreter with the arguments, in milliseconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        subprocess.run([sys.executable, *arguments], stdout=subprocess.DEVNULL, cwd=_PACKAGE_ROOT, check=True)
+        best = min(best, perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = ArgumentParser(description='TreeScript Files Start Up Check')
+    parser.add_argument('--target-ms', type=float, default=30.0, help='The maximum added import time. Default: 30.')
+    parser.add_argument('--repeat', type=int, default=10, help='Runs per measurement; the best is reported.')
+    args = parser.parse_args()
+    with TemporaryDirectory() as temp_dir:
+        with open(tree_file := os_path.join(temp_dir, 'startup.tree'), 'w') as file:
+            file.write('src/\n  main.py\n  util/\n    helpers.py\nREADME.md\n')
+        result = measure_startup(tree_file, args.repeat)
+    print(f"import: {result['import_ms']:.2f} ms (target {args.target_ms:.2f} ms)  wall: {result['wall_ms']:.2f} ms")
+    print('modules:', ', '.join(result['modules']))
+    failures = [f'{m} is imported' for m in DEFERRED_MODULES if m in result['modules']]
+    if result['import_ms'] > args.target_ms:
+        failures.append(f"import time {result['import_ms']:.2f} ms exceeds the target")
+    if len(failures) > 0:
+        print('Start up regressions:', *failures, sep='\n - ')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
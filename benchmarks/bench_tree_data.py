@@ -0,0 +1,56 @@
+""" Benchmark the TreeData node type against the previous frozen dataclass.
+ - Reports per-node memory, construction time, and the memory of one million nodes.
+"""
+import tracemalloc
+from dataclasses import dataclass
+from sys import getsizeof
+from timeit import repeat
+
+from treescript_files.tree_data import TreeData
+
+
+@dataclass(frozen=True)
+class _DataclassTreeData:
+    """ The previous TreeData representation.
+    """
+    line_number: int
+    depth: int
+    is_dir: bool
+    name: str
+
+
+def _node_size(node) -> int:
+    size = getsizeof(node)
+    if hasattr(node, '__dict__'):
+        size += getsizeof(node.__dict__)
+    return size
+
+
+def _construction_ns(node_type: type) -> float:
+    number = 200_000
+    return min(repeat(
+        lambda: node_type(1, 2, False, 'file.py'),
+        number=number,
+        repeat=5,
+    )) / number * 1e9
+
+
+def _million_nodes_mb(node_type: type) -> float:
+    tracemalloc.start()
+    nodes = [node_type(i, 2, False, 'file.py') for i in range(1_000_000)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del nodes
+    return size / 1024**2
+
+
+def main():
+    for node_type in (_DataclassTreeData, TreeData):
+        node = node_type(1, 2, False, 'file.py')
+        print(f'{node_type.__name__}: {_node_size(node)} bytes/node, '
+              f'{_construction_ns(node_type):.0f} ns/node, '
+              f'{_million_nodes_mb(node_type):.1f} MB per million nodes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+""" TreeScript Files Benchmark Suite.
+ - Measures throughput, peak memory, and time to first output on synthetic TreeScript shapes.
+ - Writes machine-readable JSON, and can compare against a previous run to detect regressions.
+
+**Usage:**
+ python -m benchmarks.run_benchmarks --lines 200000 --output bench.json
+ python -m benchmarks.run_benchmarks --compare baseline.json --output bench.json
+"""
+import json
+import platform
+import subprocess
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Iterator
+
+from benchmarks.treescript_generator import SHAPES, generate_treescript
+from treescript_files import ts_files, write_ts_files
+from treescript_files.bytes_reader import read_mapped_tree
+from treescript_files.input_data import InputData
+from treescript_files.line_reader import read_input_tree
+from treescript_files.tree_reader import generate_treescript_files
+
+
+_RESULTS_FORMAT_VERSION = 1
+# The throughput metrics compared between runs
+_THROUGHPUT_METRICS = ('lines_per_second', 'paths_per_second')
+# The benchmarks that yield output while parsing, so that the time to first output is meaningful
+_STREAMING_BENCHMARKS = ('read_input_tree', 'generate_treescript_files')
+
+
+def _library_benchmarks(
+    text: str,
+    tree_file: Path,
+) -> dict[str, Callable[[], Iterator]]:
+    """ The in-process benchmarks, each returning an Iterator over its output.
+    """
+    lines = text.splitlines()
+    return {
+        'read_input_tree': lambda: read_input_tree(lines),
+        'read_mapped_tree': lambda: read_mapped_tree(str(tree_file), None),
+        'generate_treescript_files': lambda: generate_treescript_files(lines, 'parent'),
+        'ts_files': lambda: iter((ts_files(InputData(tree_input=lines, parallel_threshold=None)),)),
+        'write_ts_files': lambda: iter((write_ts_files(InputData(tree_input=lines, parallel_threshold=None), BytesIO()),)),
+        'write_ts_files_jsonl': lambda: iter((write_ts_files(
+            InputData(tree_input=lines, parallel_threshold=None, output_format='jsonl'), BytesIO(),
+        ),)),
+    }
+
+
+def _measure_iterator(
+    create: Callable[[], Iterator],
+    repeat: int,
+    streaming: bool,
+) -> dict:
+    """ Measure the best total time, the time to the first item, the item count, and the peak memory.
+ - The time to the first item is None when the benchmark is not streaming, and returns its output at the end.
+    """
+    best_seconds = best_first = float('inf')
+    count = 0
+    for _ in range(repeat):
+        start = perf_counter()
+        iterator = create()
+        first = None
+        count = 0
+        for _ in iterator:
+            if first is None:
+                first = perf_counter() - start
+            count += 1
+        best_seconds = min(best_seconds, perf_counter() - start)
+        best_first = min(best_first, first if first is not None else best_seconds)
+    # Peak memory is measured separately, because tracing slows the benchmark
+    tracemalloc.start()
+    for _ in create():
+        pass
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'seconds': best_seconds,
+        'first_output_seconds': best_first if streaming else None,
+        'items': count,
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def _measure_cli(
+    tree_file: Path,
+    repeat: int,
+    *options: str,
+) -> dict:
+    """ Measure the full command line program, in a subprocess reading a Tree file.
+ - Peak memory is the largest max resident set size of the runs, each measured for its own child, where available.
+    """
+    command = [sys.executable, '-m', 'treescript_files', str(tree_file), '--size-limit', '0', *options]
+    best_seconds = best_first = float('inf')
+    paths = 0
+    peak_memory = None
+    for _ in range(repeat):
+        start = perf_counter()
+        with subprocess.Popen(command, stdout=subprocess.PIPE, cwd=Path(__file__).parent.parent) as process:
+            first_chunk = process.stdout.read1(1)
+            first = perf_counter() - start
+            paths = (first_chunk + process.stdout.read()).count(b'\n')
+            if (max_rss := _wait_max_rss(process)) is not None:
+                peak_memory = max(peak_memory or 0, max_rss)
+        best_seconds = min(best_seconds, perf_counter() - start)
+        best_first = min(best_first, first)
+    return {
+        'seconds': best_seconds,
+        'first_output_seconds': best_first,
+        'items': paths,
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def _wait_max_rss(
+    process: subprocess.Popen,
+) -> int | None:
+    """ Wait for the child process, and return its own max resident set size in bytes, or None if unavailable.
+ - The resource usage of all children is a running maximum, so the child is reaped with wait4 to measure it alone.
+    """
+    try:
+        from os import wait4, waitstatus_to_exitcode
+    except ImportError:
+        process.wait()
+        return None
+    _, status, usage = wait4(process.pid, 0)
+    # The child is reaped, so Popen must not wait for it again
+    process.returncode = waitstatus_to_exitcode(status)
+    # Linux reports kilobytes, macOS reports bytes
+    return usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+
+
+def run_benchmarks(
+    line_count: int,
+    repeat: int,
+    shapes: list[str],
+    seed: int = 0,
+) -> dict:
+    """ Run every benchmark on every shape.
+
+**Parameters:**
+ - line_count (int): The number of lines in each synthetic TreeScript.
+ - repeat (int): The number of timed runs; the best is reported.
+ - shapes (list[str]): The shapes to generate.
+ - seed (int): The generator seed.
+
+**Returns:**
+ dict - The JSON-serializable results.
+    """
+    results = []
+    with TemporaryDirectory() as temp_dir:
+        for shape in shapes:
+            text = generate_treescript(shape, line_count, seed)
+            (tree_file := Path(temp_dir) / f'{shape}.tree').write_text(text)
+            path_count = sum(1 for _ in generate_treescript_files(text, None))
+            measurements = {
+                name: _measure_iterator(create, repeat, name in _STREAMING_BENCHMARKS)
+                for name, create in _library_benchmarks(text, tree_file).items()
+            }
+            measurements['cli'] = _measure_cli(tree_file, repeat)
+            measurements['cli_bytes'] = _measure_cli(tree_file, repeat, '--engine', 'bytes')
+            for name, measurement in measurements.items():
+                seconds = measurement.pop('seconds')
+                measurement.pop('items')
+                results.append({
+                    'shape': shape,
+                    'benchmark': name,
+                    'lines': line_count,
+                    'paths': path_count,
+                    'seconds': seconds,
+                    'lines_per_second': line_count / seconds,
+                    'paths_per_second': path_count / seconds,
+                    **measurement,
+                })
+    return {
+        'format_version': _RESULTS_FORMAT_VERSION,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'line_count': line_count,
+        'repeat': repeat,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def compare_results(
+    baseline: dict,
+    current: dict,
+    tolerance: float,
+) -> list[str]:
+    """ Find benchmarks whose throughput dropped by more than the tolerance.
+
+**Parameters:**
+ - baseline (dict): The results of a previous run.
+ - current (dict): The results of this run.
+ - tolerance (float): The allowed fractional drop, ie: 0.2 for 20%.
+
+**Returns:**
+ list[str] - A description of each regression.
+    """
+    previous = {(r['shape'], r['benchmark']): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        if (old := previous.get((result['shape'], result['benchmark']))) is None:
+            continue
+        for metric in _THROUGHPUT_METRICS:
+            if result[metric] < old[metric] * (1 - tolerance):
+                regressions.append(
+                    f"{result['shape']}/{result['benchmark']} {metric}: "
+                    f"{old[metric]:,.0f} -> {result[metric]:,.0f} ({result[metric] / old[metric] - 1:+.1%})"
+                )
+    return regressions
+
+
+def main():
+    parser = ArgumentParser(description='TreeScript Files Benchmarks')
+    parser.add_argument('--lines', type=int, default=100_000, help='Lines per synthetic TreeScript.')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per benchmark; the best is reported.')
+    parser.add_argument('--shape', action='append', choices=sorted(SHAPES), help='Limit to these shapes.')
+    parser.add_argument('--seed', type=int, default=0, help='The generator seed.')
+    parser.add_argument('--output', type=str, default=None, help='Write the JSON results to this file.')
+    parser.add_argument('--compare', type=str, default=None, help='A previous JSON results file to compare against.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='The allowed throughput drop. Default: 0.2.')
+    args = parser.parse_args()
+    results = run_benchmarks(args.lines, args.repeat, args.shape or list(SHAPES), args.seed)
+    for r in results['results']:
+        first = 'n/a' if (first_seconds := r['first_output_seconds']) is None else f'{first_seconds * 1000:.2f}'
+        print(f"{r['shape']:>14} {r['benchmark']:>26}: {r['lines_per_second']:>12,.0f} lines/s "
+              f"{r['paths_per_second']:>12,.0f} paths/s  first {first:>8} ms  "
+              f"peak {(r['peak_memory_bytes'] or 0) / 1024**2:8.1f} MB")
+    if args.output is not None:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    if args.compare is not None:
+        if len(regressions := compare_results(json.loads(Path(args.compare).read_text()), results, args.tolerance)) > 0:
+            print('Regressions:', *regressions, sep='\n - ')
+            sys.exit(1)
+        print('No regressions.')
+
+
+if __name__ == '__main__':
+    main()
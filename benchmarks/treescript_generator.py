@@ -0,0 +1,100 @@
+""" Synthetic TreeScript Generator.
+ - Produces deterministic TreeScript in several shapes, for benchmarks.
+ - The same shape, line count, and seed always produce the same TreeScript.
+"""
+from random import Random
+from typing import Generator, NamedTuple
+
+
+class TreeShape(NamedTuple):
+    """ The parameters controlling the shape of a synthetic Tree.
+
+**Fields:**
+ - max_depth (int): The maximum directory depth.
+ - dir_ratio (float): The probability that a node is a directory, while below the max depth.
+ - files_per_dir (int): The average number of files before returning to a shallower depth.
+ - comment_ratio (float): The probability of a comment or blank line.
+ - name_length (int): The approximate length of each name.
+ - dir_styles (tuple[str, ...]): The directory formats, where {} is replaced by the name.
+ - label_ratio (float): The probability that a node has trailing words after its name.
+    """
+    max_depth: int
+    dir_ratio: float
+    files_per_dir: int
+    comment_ratio: float = 0.0
+    name_length: int = 12
+    dir_styles: tuple[str, ...] = ('{}/',)
+    label_ratio: float = 0.0
+
+
+SHAPES: dict[str, TreeShape] = {
+    'wide': TreeShape(max_depth=3, dir_ratio=0.05, files_per_dir=60),
+    'deep': TreeShape(max_depth=40, dir_ratio=0.4, files_per_dir=4),
+    'comments': TreeShape(max_depth=6, dir_ratio=0.1, files_per_dir=12, comment_ratio=0.5, label_ratio=0.5),
+    'long_names': TreeShape(max_depth=6, dir_ratio=0.1, files_per_dir=12, name_length=90),
+    'mixed_slashes': TreeShape(max_depth=6, dir_ratio=0.15, files_per_dir=8, dir_styles=('{}/', '/{}', '{}\\', '\\{}')),
+}
+
+
+def generate_treescript(
+    shape: str,
+    line_count: int,
+    seed: int = 0,
+) -> str:
+    """ Generate a synthetic TreeScript.
+
+**Parameters:**
+ - shape (str): The name of a shape in SHAPES.
+ - line_count (int): The number of lines to generate.
+ - seed (int): The random seed. Default: 0.
+
+**Returns:**
+ str - The TreeScript text, ending with a newline.
+    """
+    return '\n'.join(iter_treescript_lines(shape, line_count, seed)) + '\n'
+
+
+def iter_treescript_lines(
+    shape: str,
+    line_count: int,
+    seed: int = 0,
+) -> Generator[str, None, None]:
+    """ Generate the lines of a synthetic TreeScript.
+ - Directories are only entered one level at a time, so the TreeScript is always valid.
+
+**Parameters:**
+ - shape (str): The name of a shape in SHAPES.
+ - line_count (int): The number of lines to generate.
+ - seed (int): The random seed. Default: 0.
+
+**Yields:**
+ str - Each line of TreeScript, without a line ending.
+    """
+    params = SHAPES[shape]
+    rng = Random(seed)
+    depth = 0
+    for line_number in range(line_count):
+        indent = '  ' * depth
+        if rng.random() < params.comment_ratio:
+            yield indent + '# comment' if rng.random() < 0.5 else ''
+            continue
+        name = _make_name(rng, line_number, params.name_length)
+        label = ' DataLabel' if rng.random() < params.label_ratio else ''
+        if depth < params.max_depth and rng.random() < params.dir_ratio:
+            yield indent + rng.choice(params.dir_styles).format(name) + label
+            depth += 1
+        else:
+            yield indent + name + '.py' + label
+            if rng.random() < 1 / params.files_per_dir:
+                depth = rng.randint(0, depth)
+
+
+def _make_name(
+    rng: Random,
+    line_number: int,
+    name_length: int,
+) -> str:
+    """ Create a unique name, of approximately the given length.
+    """
+    stem = f'n{line_number}_'
+    return stem + ''.join(rng.choices('abcdefghijklmnopqrstuvwxyz_', k=max(1, name_length - len(stem))))
@@ -16,7 +16,7 @@ setup(
         "Source Code": "https://github.com/DK96-OS/treescript-files/"
     },
     license="GPLv3",
-    packages=find_packages(exclude=['test', 'test.*']),
+    packages=find_packages(exclude=['test', 'test.*', 'benchmarks', 'benchmarks.*']),
     entry_points={
         'console_scripts': [
             'treescript-files=treescript_files.__main__:main',
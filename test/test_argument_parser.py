@@ -31,6 +31,8 @@ def test_parse_arguments_parent_path_returns_data():
         (['script.tree', '--comma'], ArgumentData('script.tree', None, ',')),
         (['script.tree', '-c'], ArgumentData('script.tree', None, ',')),
         (['script.tree', '--tab'], ArgumentData('script.tree', None, '\t')),
+        (['script.tree', '--null'], ArgumentData('script.tree', None, '\0')),
+        (['script.tree', '-0'], ArgumentData('script.tree', None, '\0')),
         (['script.tree', '-t'], ArgumentData('script.tree', None, '\t')),
     ]
 )
@@ -38,6 +40,109 @@ def test_parse_arguments_output_separator_options(test_input,expect):
     assert expect == parse_arguments(test_input)
 
 
+@pytest.mark.parametrize(
+    "test_input,expect",
+    [
+        (['script.tree', '--size-limit', '1'], 1024**2),
+        (['script.tree', '--size-limit', '64'], 64 * 1024**2),
+        (['script.tree', '--size-limit', '0'], None),
+    ]
+)
+def test_parse_arguments_size_limit_returns_bytes(test_input, expect):
+    assert parse_arguments(test_input).file_size_limit == expect
+
+
+def test_parse_arguments_batch_returns_data():
+    result = parse_arguments(['--batch', 'a.tree', 'trees/', '--jobs', '4', '--parent-from-file'])
+    assert result.tree_file is None
+    assert result.batch_files == ('a.tree', 'trees/')
+    assert result.jobs == 4
+    assert result.parent_from_file
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        (['script.tree', '--batch', 'a.tree']),
+        (['--batch', 'a.tree', '--jobs', '0']),
+        (['--batch', ' ']),
+    ]
+)
+def test_parse_arguments_invalid_batch_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
+
+
+def test_parse_arguments_serve_returns_data():
+    result = parse_arguments(['--serve', 'daemon.sock', '--idle-timeout', '30'])
+    assert result.tree_file is None
+    assert result.serve_socket == 'daemon.sock'
+    assert result.idle_timeout == 30
+
+
+def test_parse_arguments_connect_returns_data():
+    result = parse_arguments(['script.tree', '--connect', 'daemon.sock'])
+    assert result.tree_file == 'script.tree'
+    assert result.connect_socket == 'daemon.sock'
+    result = parse_arguments(['script.tree', '--connect', 'daemon.sock', '--parent', 'module', '--exclude', 'build/', '--comma'])
+    assert result.connect_socket == 'daemon.sock'
+    assert result.exclude == ('build/',)
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        (['script.tree', '--serve', 'daemon.sock']),
+        (['--serve', 'daemon.sock', '--batch', 'a.tree']),
+        (['--serve', 'daemon.sock', '--connect', 'daemon.sock']),
+        (['--serve', ' ']),
+        (['--serve', 'daemon.sock', '--idle-timeout', '0']),
+        (['script.tree', '--connect', ' ']),
+        (['--serve', 'daemon.sock', '--materialize', 'project']),
+        (['--serve', 'daemon.sock', '--verify', 'project']),
+        (['--serve', 'daemon.sock', '--diff', 'old.tree', 'new.tree']),
+        (['--serve', 'daemon.sock', '--format', 'jsonl']),
+        (['--serve', 'daemon.sock', '--parent', 'module']),
+        (['--serve', 'daemon.sock', '--exclude', 'build/']),
+        (['--serve', 'daemon.sock', '--comma']),
+        (['--batch', 'a.tree', '--connect', 'daemon.sock']),
+        (['--diff', 'old.tree', 'new.tree', '--connect', 'daemon.sock']),
+        (['--from-dir', 'src', '--connect', 'daemon.sock']),
+        (['-', '--connect', 'daemon.sock']),
+        (['script.tree', '--connect', 'daemon.sock', '--materialize', 'project']),
+        (['script.tree', '--connect', 'daemon.sock', '--verify', 'project']),
+        (['script.tree', '--connect', 'daemon.sock', '--fingerprint']),
+        (['script.tree', '--connect', 'daemon.sock', '--format', 'jsonl']),
+    ]
+)
+def test_parse_arguments_invalid_daemon_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
+
+
+def test_parse_arguments_include_exclude_returns_data():
+    result = parse_arguments(['script.tree', '--include', '*.py', '--exclude', 'build/', '--exclude', 'test_*'])
+    assert result.include == ('*.py',)
+    assert result.exclude == ('build/', 'test_*')
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        (['script.tree', '--include', ' ']),
+        (['script.tree', '--exclude', '']),
+    ]
+)
+def test_parse_arguments_invalid_filter_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
+
+
+def test_parse_arguments_negative_size_limit_raises_exit():
+    with pytest.raises(SystemExit, match='The Size Limit argument was invalid.'):
+        parse_arguments(['script.tree', '--size-limit', '-1'])
+
+
 @pytest.mark.parametrize(
     "test_input",
     [
@@ -85,3 +190,252 @@ def test_validate_arguments_empty_tree_file_name_raises_type_error():
 def test_validate_arguments_empty_parent_path_raises_type_error():
     with pytest.raises(TypeError):
         _validate_arguments('tree', '')
+
+
+def test_parse_arguments_materialize_returns_data():
+    result = parse_arguments(['script.tree', '--materialize', 'out', '--skip-existing', '--dry-run'])
+    assert result.materialize_root == 'out'
+    assert result.skip_existing
+    assert result.dry_run
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        (['script.tree', '--materialize', ' ']),
+        (['--batch', 'a.tree', '--materialize', 'out']),
+        (['script.tree', '--dry-run']),
+        (['script.tree', '--skip-existing']),
+    ]
+)
+def test_parse_arguments_invalid_materialize_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
+
+
+def test_parse_arguments_verify_returns_data():
+    result = parse_arguments(['script.tree', '--verify', 'out', '--extra'])
+    assert result.verify_root == 'out'
+    assert result.check_extra
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        (['script.tree', '--verify', ' ']),
+        (['--batch', 'a.tree', '--verify', 'out']),
+        (['script.tree', '--verify', 'out', '--materialize', 'out']),
+        (['script.tree', '--extra']),
+    ]
+)
+def test_parse_arguments_invalid_verify_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
+
+
+def test_parse_arguments_from_dir_returns_data():
+    result = parse_arguments(['--from-dir', 'project', '--exclude', '.git'])
+    assert result.tree_file is None
+    assert result.from_dir == 'project'
+    assert result.exclude == ('.git',)
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        (['--from-dir', ' ']),
+        (['script.tree', '--from-dir', 'project']),
+        (['--from-dir', 'project', '--parent', 'src']),
+        (['--from-dir', 'project', '--batch', 'a.tree']),
+        (['--from-dir', 'project', '--serve', 'daemon.sock']),
+        (['--from-dir', 'project', '--verify', 'project']),
+        (['--from-dir', 'project', '--space']),
+        (['--from-dir', 'project', '--comma']),
+        (['--from-dir', 'project', '--tab']),
+        (['--from-dir', 'project', '-0']),
+        (['--from-dir', 'project', '--format', 'jsonl']),
+    ]
+)
+def test_parse_arguments_invalid_from_dir_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
+
+
+def test_parse_arguments_diff_returns_data():
+    result = parse_arguments(['--diff', 'old.tree', 'new.tree'])
+    assert result.tree_file is None
+    assert result.diff_files == ('old.tree', 'new.tree')
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        (['--diff', 'old.tree', ' ']),
+        (['--diff', 'old.tree']),
+        (['script.tree', '--diff', 'old.tree', 'new.tree']),
+        (['--diff', 'old.tree', 'new.tree', '--batch', 'a.tree']),
+        (['--diff', 'old.tree', 'new.tree', '--verify', 'project']),
+        (['--diff', 'old.tree', 'new.tree', '--from-dir', 'project']),
+    ]
+)
+def test_parse_arguments_invalid_diff_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
+
+
+def test_parse_arguments_fingerprint_returns_data():
+    result = parse_arguments(['script.tree', '--fingerprint', '--dir-fingerprints'])
+    assert result.fingerprint
+    assert result.dir_fingerprints
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        (['--batch', 'a.tree', '--fingerprint']),
+        (['--diff', 'old.tree', 'new.tree', '--fingerprint']),
+        (['script.tree', '--fingerprint', '--verify', 'project']),
+        (['script.tree', '--dir-fingerprints']),
+        (['script.tree', '--fingerprint', '--null']),
+        (['script.tree', '--fingerprint', '-0']),
+        (['script.tree', '--fingerprint', '--space']),
+    ]
+)
+def test_parse_arguments_invalid_fingerprint_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
+
+
+def test_parse_arguments_engine_returns_data():
+    assert parse_arguments(['script.tree']).engine == 'text'
+    assert parse_arguments(['script.tree', '--engine', 'bytes']).engine == 'bytes'
+
+
+@pytest.mark.parametrize(
+    'test_input',
+    [
+        ['script.tree', '--engine', 'utf8'],
+        ['-', '--engine', 'bytes'],
+        ['--batch', 'a.tree', '--engine', 'bytes'],
+        ['--diff', 'a.tree', 'b.tree', '--engine', 'bytes'],
+        ['--from-dir', 'src', '--engine', 'bytes'],
+        ['--serve', 'tree.sock', '--engine', 'bytes'],
+        ['script.tree', '--materialize', 'out', '--engine', 'bytes'],
+        ['script.tree', '--verify', 'out', '--engine', 'bytes'],
+        ['script.tree', '--fingerprint', '--engine', 'bytes'],
+        ['script.tree', '--format', 'jsonl', '--engine', 'bytes'],
+        ['script.tree', '--stats', '--engine', 'bytes'],
+        ['script.tree', '--connect', 'tree.sock', '--engine', 'bytes'],
+    ]
+)
+def test_parse_arguments_invalid_engine_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
+
+
+def test_parse_arguments_stdin_returns_data():
+    assert parse_arguments(['-', '--parent', 'module']).tree_file == '-'
+    assert parse_arguments(['--diff', '-', 'new.tree']).diff_files == ('-', 'new.tree')
+
+
+def test_parse_arguments_diff_stdin_twice_raises_exit():
+    with pytest.raises(SystemExit):
+        parse_arguments(['--diff', '-', '-'])
+
+
+def test_parse_arguments_format_returns_data():
+    assert parse_arguments(['script.tree']).output_format == 'text'
+    assert parse_arguments(['script.tree', '--format', 'jsonl']).output_format == 'jsonl'
+    assert parse_arguments(['-', '--format', 'json', '--parent', 'module']).output_format == 'json'
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        (['script.tree', '--format', 'xml']),
+        (['--batch', 'a.tree', '--format', 'jsonl']),
+        (['--diff', 'old.tree', 'new.tree', '--format', 'jsonl']),
+        (['script.tree', '--format', 'jsonl', '--verify', 'project']),
+        (['script.tree', '--format', 'jsonl', '--fingerprint']),
+        (['script.tree', '--format', 'jsonl', '--stats']),
+        (['script.tree', '--format', 'json', '--comma']),
+        (['script.tree', '--format', 'jsonl', '-0']),
+    ]
+)
+def test_parse_arguments_invalid_format_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
+
+
+def test_parse_arguments_null_short_option_keeps_negative_values():
+    assert parse_arguments(['script.tree', '-0']).separator == '\0'
+    with pytest.raises(SystemExit, match='The Size Limit argument was invalid.'):
+        parse_arguments(['script.tree', '-0', '--size-limit', '-1'])
+
+
+@pytest.mark.parametrize(
+    "test_input,expect",
+    [
+        (['script.tree', '--size-limit', '-0'], ArgumentData('script.tree', None, '\n', file_size_limit=None)),
+        (['script.tree', '--parent', '-0'], ArgumentData('script.tree', '-0', '\n')),
+        (['script.tree', '--parent', '-0', '-0'], ArgumentData('script.tree', '-0', '\0')),
+        (['--', '-0'], ArgumentData('-0', None, '\n')),
+        (['-0', '--', '-0'], ArgumentData('-0', None, '\0')),
+    ]
+)
+def test_parse_arguments_null_short_option_value_is_not_replaced(test_input, expect):
+    assert parse_arguments(test_input) == expect
+
+
+def test_parse_arguments_diff_values_are_not_replaced():
+    assert parse_arguments(['--diff', 'old.tree', '-0']).diff_files == ('old.tree', '-0')
+    assert parse_arguments(['--diff', '-0', 'new.tree', '-0']).diff_files == ('-0', 'new.tree')
+
+
+def test_option_value_counts_match_parser():
+    from treescript_files.argument_parser import _OPTION_VALUE_COUNTS, _define_arguments
+    value_options = {
+        option: 2 if action.nargs == 2 else 1
+        for action in _define_arguments()._actions if action.option_strings and action.nargs != 0
+        for option in action.option_strings
+    }
+    assert _OPTION_VALUE_COUNTS == value_options
+
+
+def test_parse_arguments_text_path_options_return_data():
+    assert parse_arguments(['script.tree', '--parallel-threshold', '0']).parallel_threshold is None
+    assert parse_arguments(['script.tree']).parallel_threshold == 4 * 1024**2
+    assert parse_arguments(['script.tree', '--cache-dir', 'cache', '--parallel-threshold', '2']).parallel_threshold == 2 * 1024**2
+    assert parse_arguments(['script.tree', '--cache-dir', 'cache', '--engine', 'bytes']).cache_dir == 'cache'
+    assert parse_arguments(['-', '--stats']).stats
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        (['--batch', 'a.tree', '--stats']),
+        (['--diff', 'old.tree', 'new.tree', '--stats']),
+        (['--from-dir', 'src', '--stats']),
+        (['script.tree', '--materialize', 'project', '--stats']),
+        (['script.tree', '--verify', 'project', '--stats']),
+        (['script.tree', '--fingerprint', '--stats']),
+        (['script.tree', '--connect', 'daemon.sock', '--stats']),
+        (['--batch', 'a.tree', '--cache-dir', 'cache']),
+        (['--serve', 'daemon.sock', '--cache-dir', 'cache']),
+        (['-', '--cache-dir', 'cache']),
+        (['script.tree', '--verify', 'project', '--cache-dir', 'cache']),
+        (['script.tree', '--format', 'jsonl', '--cache-dir', 'cache']),
+        (['script.tree', '--stats', '--cache-dir', 'cache']),
+        (['--diff', 'old.tree', 'new.tree', '--parallel-threshold', '1']),
+        (['-', '--parallel-threshold', '1']),
+        (['script.tree', '--materialize', 'project', '--parallel-threshold', '1']),
+        (['script.tree', '--fingerprint', '--parallel-threshold', '1']),
+        (['script.tree', '--stats', '--parallel-threshold', '1']),
+        (['script.tree', '--engine', 'bytes', '--parallel-threshold', '1']),
+        (['script.tree', '--parent-from-file']),
+        (['--diff', 'old.tree', 'new.tree', '--parent-from-file']),
+    ]
+)
+def test_parse_arguments_ignored_option_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_arguments(test_input)
@@ -0,0 +1,202 @@
+""" Testing Async Reader Methods.
+"""
+import asyncio
+import threading
+from contextlib import aclosing
+
+import pytest
+
+from treescript_files import async_reader, generate_treescript_files
+from treescript_files.async_reader import agenerate_treescript_files
+from treescript_files.tree_filter import TreeFilter
+
+
+def _write_tree(tmp_path, name: str, dir_count: int, files_per_dir: int) -> str:
+    tree_file = tmp_path / name
+    tree_file.write_text(''.join(
+        f'dir_{d}/\n' + ''.join(f'  file_{f}.py\n' for f in range(files_per_dir))
+        for d in range(dir_count)
+    ))
+    return str(tree_file)
+
+
+async def _collect(tree_file: str, **kwargs) -> list[str]:
+    return [path async for path in agenerate_treescript_files(tree_file, **kwargs)]
+
+
+def test_agenerate_treescript_files_matches_sync(tmp_path):
+    tree_file = _write_tree(tmp_path, 'a.tree', 20, 30)
+    with open(tree_file) as file:
+        expected = list(generate_treescript_files(file, 'module'))
+    assert asyncio.run(_collect(tree_file, parent_path='module', batch_size=7)) == expected
+    assert asyncio.run(_collect(tree_file, parent_path='module', batch_size=600)) == expected
+
+
+def test_agenerate_treescript_files_filter(tmp_path):
+    tree_file = _write_tree(tmp_path, 'a.tree', 3, 2)
+    result = asyncio.run(_collect(tree_file, tree_filter=TreeFilter(exclude=('dir_1/', 'file_0.py'))))
+    assert [path.replace('\\', '/') for path in result] == ['dir_0/file_1.py', 'dir_2/file_1.py']
+
+
+def test_agenerate_treescript_files_parses_in_worker_threads(tmp_path, monkeypatch):
+    tree_file = _write_tree(tmp_path, 'a.tree', 5, 5)
+    threads = set()
+    next_batch = async_reader._next_batch
+    monkeypatch.setattr(async_reader, '_next_batch', lambda paths, size: threads.add(threading.get_ident()) or next_batch(paths, size))
+    asyncio.run(_collect(tree_file, batch_size=3))
+    assert len(threads) > 0
+    assert threading.get_ident() not in threads
+
+
+def test_agenerate_treescript_files_concurrent_trees_do_not_block_loop(tmp_path):
+    tree_files = [_write_tree(tmp_path, f'{i}.tree', 50, 40) for i in range(8)]
+
+    async def run() -> tuple[list[list[str]], int]:
+        ticks = 0
+        finished = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not finished.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+        ticker_task = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(_collect(tree_file, batch_size=100) for tree_file in tree_files))
+        finished.set()
+        await ticker_task
+        return results, ticks
+    results, ticks = asyncio.run(run())
+    assert [len(result) for result in results] == [2000] * 8
+    # The ticker runs between the batches of every Tree
+    assert ticks >= 20
+
+
+def test_agenerate_treescript_files_cancellation_closes_file(tmp_path, monkeypatch):
+    tree_file = _write_tree(tmp_path, 'a.tree', 100, 100)
+    closed = threading.Event()
+    open_paths = async_reader._open_paths
+
+    def tracked_open_paths(*args):
+        paths = open_paths(*args)
+
+        def generator():
+            try:
+                yield from paths
+            finally:
+                closed.set()
+        return generator()
+    monkeypatch.setattr(async_reader, '_open_paths', tracked_open_paths)
+
+    async def run():
+        started = asyncio.Event()
+
+        async def consume():
+            async with aclosing(agenerate_treescript_files(tree_file, batch_size=10)) as paths:
+                async for _ in paths:
+                    started.set()
+                    await asyncio.sleep(0)
+        task = asyncio.create_task(consume())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Wait for a batch still running in the worker thread
+        await asyncio.get_running_loop().run_in_executor(None, closed.wait, 5)
+    asyncio.run(run())
+    assert closed.is_set()
+
+
+def test_agenerate_treescript_files_break_closes_file(tmp_path):
+    tree_file = _write_tree(tmp_path, 'a.tree', 10, 10)
+
+    async def run() -> list[str]:
+        first = []
+        async with aclosing(agenerate_treescript_files(tree_file, batch_size=5)) as paths:
+            async for path in paths:
+                first.append(path)
+                if len(first) == 3:
+                    break
+        return first
+    assert len(asyncio.run(run())) == 3
+
+
+@pytest.mark.parametrize(
+    'tree_input',
+    [
+        '',
+        'src/\n   file.py',
+        'a/b/\n',
+    ]
+)
+def test_agenerate_treescript_files_invalid_input_raises_value_error(tmp_path, tree_input):
+    (tmp_path / 'a.tree').write_text(tree_input)
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(str(tmp_path / 'a.tree')))
+
+
+def test_agenerate_treescript_files_missing_file_raises_value_error(tmp_path):
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(str(tmp_path / 'missing.tree')))
+
+
+def test_agenerate_treescript_files_invalid_batch_size_raises_value_error(tmp_path):
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(_write_tree(tmp_path, 'a.tree', 1, 1), batch_size=0))
+
+
+def test_agenerate_treescript_files_cancellation_during_batch_closes_file(tmp_path, monkeypatch):
+    tree_file = _write_tree(tmp_path, 'a.tree', 10, 10)
+    in_batch = threading.Event()
+    release = threading.Event()
+    closed = threading.Event()
+    open_paths = async_reader._open_paths
+
+    def blocking_open_paths(*args):
+        paths = open_paths(*args)
+
+        def generator():
+            try:
+                for count, path in enumerate(paths):
+                    if count == 15:
+                        # Hold the worker thread inside the second batch
+                        in_batch.set()
+                        release.wait(5)
+                    yield path
+            finally:
+                closed.set()
+        return generator()
+    monkeypatch.setattr(async_reader, '_open_paths', blocking_open_paths)
+
+    async def run():
+        async def consume():
+            async with aclosing(agenerate_treescript_files(tree_file, batch_size=10)) as paths:
+                async for _ in paths:
+                    pass
+        loop = asyncio.get_running_loop()
+        task = asyncio.create_task(consume())
+        assert await loop.run_in_executor(None, in_batch.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not closed.is_set()
+        release.set()
+        return await loop.run_in_executor(None, closed.wait, 5)
+    assert asyncio.run(run())
+
+
+def test_agenerate_treescript_files_invalid_input_yields_partial_batch(tmp_path):
+    tree_input = 'src/\n  a.py\n  b.py\n     c.py\n'
+    (tmp_path / 'a.tree').write_text(tree_input)
+    expected = []
+    with pytest.raises(SystemExit):
+        for path in generate_treescript_files(tree_input, None):
+            expected.append(path)
+
+    async def run() -> list[str]:
+        result = []
+        with pytest.raises(ValueError, match='Line: 4'):
+            async for path in agenerate_treescript_files(str(tmp_path / 'a.tree'), batch_size=100):
+                result.append(path)
+        return result
+    assert len(expected) == 2
+    assert asyncio.run(run()) == expected
@@ -0,0 +1,134 @@
+""" Testing Batch Processor Methods.
+"""
+import os
+from io import StringIO
+
+import pytest
+
+from treescript_files.batch_processor import BatchResult, expand_batch_inputs, process_batch, write_batch_files
+from treescript_files.input_data import InputData
+
+
+def _sep(path: str) -> str:
+    return path.replace('/', os.sep)
+
+
+@pytest.fixture
+def batch_dir(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'pkg_a').mkdir()
+    (tmp_path / 'pkg_b' / 'nested').mkdir(parents=True)
+    (tmp_path / 'pkg_a' / 'a.tree').write_text('src/\n  a.py\n')
+    (tmp_path / 'pkg_b' / 'b.tree').write_text('src/\n  b.py\n  b2.py\n')
+    (tmp_path / 'pkg_b' / 'nested' / 'c.tree').write_text('c.py\n')
+    (tmp_path / 'pkg_b' / 'notes.txt').write_text('not a tree\n')
+    (tmp_path / 'broken.tree').write_text('src/\n file.py\n')
+    return tmp_path
+
+
+def test_expand_batch_inputs_directory_returns_sorted_tree_files(batch_dir):
+    assert expand_batch_inputs(['pkg_b']) == (
+        os.path.join('pkg_b', 'b.tree'),
+        os.path.join('pkg_b', 'nested', 'c.tree'),
+    )
+
+
+def test_expand_batch_inputs_glob_returns_sorted_tree_files(batch_dir):
+    assert expand_batch_inputs(['pkg_*/*.tree']) == (
+        os.path.join('pkg_a', 'a.tree'),
+        os.path.join('pkg_b', 'b.tree'),
+    )
+
+
+def test_expand_batch_inputs_files_keep_given_order(batch_dir):
+    assert expand_batch_inputs(['broken.tree', 'pkg_a/a.tree']) == ('broken.tree', 'pkg_a/a.tree')
+
+
+def test_expand_batch_inputs_no_matches_raises_exit(batch_dir):
+    with pytest.raises(SystemExit, match='No TreeScript files were found'):
+        expand_batch_inputs(['missing_*.tree'])
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_process_batch_returns_results_in_input_order(batch_dir, max_workers):
+    results = list(process_batch(
+        ['pkg_b/b.tree', 'broken.tree', 'pkg_a/a.tree'],
+        max_workers=max_workers,
+    ))
+    assert [r.tree_file for r in results] == ['pkg_b/b.tree', 'broken.tree', 'pkg_a/a.tree']
+    assert results[0] == BatchResult('pkg_b/b.tree', [_sep('src/b.py'), _sep('src/b2.py')], None)
+    assert results[1].files is None
+    assert results[1].error.startswith('Invalid Indentation')
+    assert results[2] == BatchResult('pkg_a/a.tree', [_sep('src/a.py')], None)
+
+
+def test_process_batch_missing_file_returns_error(batch_dir):
+    results = list(process_batch(['missing.tree']))
+    assert results == [BatchResult('missing.tree', None, 'The File does not Exist.')]
+
+
+def test_process_batch_parent_from_file_prefixes_file_directory(batch_dir):
+    results = list(process_batch(
+        [os.path.join('pkg_a', 'a.tree'), 'broken.tree'],
+        parent_path='root',
+        parent_from_file=True,
+        max_workers=1,
+    ))
+    assert results[0].files == [os.path.join('root', 'pkg_a', 'src', 'a.py')]
+
+
+def test_process_batch_parent_from_file_absolute_directory_raises_exit(batch_dir):
+    tree_files = expand_batch_inputs([str(batch_dir / 'pkg_b')])
+    with pytest.raises(SystemExit, match='Use relative Batch paths with --parent-from-file'):
+        list(process_batch(tree_files, parent_path='root', parent_from_file=True, max_workers=1))
+    # Without --parent-from-file, the absolute paths are read as given
+    results = list(process_batch(tree_files, parent_path='root', max_workers=1))
+    assert [r.files for r in results] == [[_sep('root/src/b.py'), _sep('root/src/b2.py')], [_sep('root/c.py')]]
+
+
+def test_process_batch_bounds_pending_files(batch_dir, monkeypatch):
+    from concurrent.futures import Future
+    submitted = []
+
+    class _Executor:
+        def __init__(self, max_workers):
+            pass
+
+        def submit(self, function, *args):
+            submitted.append(future := Future())
+            future.set_result(function(*args))
+            return future
+
+        def shutdown(self, wait, cancel_futures):
+            pass
+    monkeypatch.setattr('concurrent.futures.ProcessPoolExecutor', _Executor)
+    pending_counts = [
+        len(submitted) - taken
+        for taken, _ in enumerate(process_batch(['pkg_a/a.tree'] * 20, max_workers=2), start=1)
+    ]
+    assert len(pending_counts) == 20
+    assert max(pending_counts) <= 2 * 2
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_process_batch_tree_filter_applies_to_each_file(batch_dir, max_workers):
+    from treescript_files.tree_filter import TreeFilter
+    results = list(process_batch(
+        ['pkg_b/b.tree', 'pkg_a/a.tree'],
+        max_workers=max_workers,
+        tree_filter=TreeFilter(exclude=('b2.py',)),
+    ))
+    assert [r.files for r in results] == [[_sep('src/b.py')], [_sep('src/a.py')]]
+
+
+def test_write_batch_files_failure_writes_other_results_and_exits(batch_dir, capsys):
+    output = StringIO()
+    input_data = InputData(
+        tree_input=None,
+        batch_files=('pkg_a/a.tree', 'broken.tree', 'pkg_b/nested/c.tree'),
+        jobs=2,
+    )
+    with pytest.raises(SystemExit, match='TreeScript files failed to process: 1'):
+        write_batch_files(input_data, output)
+    assert output.getvalue() == _sep('src/a.py') + '\nc.py\n'
+    assert capsys.readouterr().err.startswith('broken.tree: Invalid Indentation')
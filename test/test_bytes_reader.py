@@ -0,0 +1,145 @@
+""" Testing Bytes Reader Methods.
+"""
+from functools import partial
+from mmap import ACCESS_READ, mmap
+
+import pytest
+
+from treescript_files import bytes_reader
+from treescript_files.bytes_reader import _split_blocks, generate_mapped_files, read_mapped_tree
+from treescript_files.file_validation import read_input_lines
+from treescript_files.line_reader import read_input_tree
+from treescript_files.tree_filter import TreeFilter
+from treescript_files.tree_reader import generate_treescript_files
+
+
+def _read_str_engine(tree_file: str) -> tuple[list, str | None]:
+    result = []
+    try:
+        result.extend(read_input_tree(read_input_lines(tree_file)))
+    except SystemExit as e:
+        return result, e.code
+    return result, None
+
+
+def _read_bytes_engine(tree_file: str) -> tuple[list, str | None]:
+    result = []
+    try:
+        result.extend(read_mapped_tree(tree_file))
+    except SystemExit as e:
+        return result, e.code
+    return result, None
+
+
+@pytest.mark.parametrize(
+    'tree_input',
+    [
+        b'src/\n  api/\n    routes.py\n  main.py\nREADME.md\n',
+        b'src/\n  main.py',
+        b'# The project\n\nsrc/  The sources\n  main.py   # The entry point\n   \n#\n',
+        b'\\src\n  api\\\n    routes.py\n/docs\n',
+        # Line endings
+        b'src/\r\n  main.py\r\n\r\n  util.py\r\n',
+        b'src/\r  main.py\r\r  util.py\r',
+        b'src/\r\r\n  main.py\n\r  util.py',
+        # Tabs, control characters, and non-ASCII names
+        b'src/\n\tmain.py\n',
+        b'src/\n  main.py\t# The entry point\n',
+        b'src/\n  main.py\x0b\n',
+        'src/\n  caf\u00e9.py\n  \u65e5\u672c/\n    \u8a9e.py\n'.encode(),
+        '\u00e9/\n  a.py\n'.encode(),
+        b'\xef\xbb\xbfsrc/\n  main.py\n',
+        # Name lengths
+        b'a' * 99 + b'\n',
+        b'a' * 100 + b'\n',
+        b'src/\n  ' + b'a' * 98 + b'/\n',
+        # Invalid names
+        b'src/\n  a/b\n',
+        b'src/\n  a/b/\n',
+        b'src/\n  /a/\n',
+        b'src/\n  \\a/\n',
+        b'src/\n  ./\n',
+        b'src/\n  ../\n',
+        b'src/\n  //\n',
+        b'src/\n  /\n',
+        b'\xc3\xa9/b\n',
+        # Invalid depth
+        b'src/\n   main.py\n',
+        b'src/\n  api/\n\t   routes.py\n',
+        # Blank files
+        b'\n\n   \n',
+        b'# Only a comment\n',
+        b' \r\n\r',
+    ]
+)
+def test_read_mapped_tree_matches_line_reader(tmp_path, tree_input):
+    (tree_file := tmp_path / 'a.tree').write_bytes(tree_input)
+    assert _read_bytes_engine(str(tree_file)) == _read_str_engine(str(tree_file))
+
+
+def test_read_mapped_tree_generated_tree_matches_line_reader(tmp_path):
+    lines = []
+    for d in range(50):
+        lines.append(f'dir_{d}/')
+        for s in range(d % 4):
+            lines.append(f'  sub_{s}/  # Sub directory')
+            lines.extend(f'    file_{f}.py' for f in range(d % 7))
+        lines.append(f'  top_{d}.txt')
+    (tree_file := tmp_path / 'a.tree').write_text('\n'.join(lines))
+    result, error = _read_bytes_engine(str(tree_file))
+    assert error is None
+    assert result == _read_str_engine(str(tree_file))[0]
+
+
+@pytest.mark.parametrize('block_size', [1, 3, 8])
+def test_read_mapped_tree_small_blocks_match_line_reader(tmp_path, monkeypatch, block_size):
+    tree_input = 'src/\r\n  api/\r\r\n    caf\u00e9.py\n\n  main.py\r  # Comment\r\nREADME.md'.encode()
+    (tree_file := tmp_path / 'a.tree').write_bytes(tree_input)
+    monkeypatch.setattr(bytes_reader, '_split_blocks', partial(_split_blocks, block_size=block_size))
+    assert _read_bytes_engine(str(tree_file)) == _read_str_engine(str(tree_file))
+
+
+def test_split_blocks_end_at_line_feed(tmp_path):
+    (tree_file := tmp_path / 'a.tree').write_bytes(b'src/\r\n  main.py\r\n  util.py\rREADME.md')
+    with open(tree_file, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+        blocks = list(_split_blocks(data, block_size=4))
+    assert blocks == [b'src/\r\n', b'  main.py\r\n', b'  util.py\rREADME.md']
+
+
+def test_read_mapped_tree_error_line_number(tmp_path):
+    (tree_file := tmp_path / 'a.tree').write_bytes(b'src/\r\n  main.py\r\n\r\n   util.py\r\n')
+    with pytest.raises(SystemExit, match='4$'):
+        list(read_mapped_tree(str(tree_file)))
+
+
+def test_read_mapped_tree_empty_file_raises_exit(tmp_path):
+    (tree_file := tmp_path / 'a.tree').write_bytes(b'')
+    with pytest.raises(SystemExit):
+        list(read_mapped_tree(str(tree_file)))
+
+
+def test_read_mapped_tree_missing_file_raises_exit(tmp_path):
+    with pytest.raises(SystemExit):
+        read_mapped_tree(str(tmp_path / 'missing.tree'))
+
+
+def test_read_mapped_tree_size_limit_raises_exit(tmp_path):
+    (tree_file := tmp_path / 'a.tree').write_bytes(b'src/\n  main.py\n')
+    with pytest.raises(SystemExit):
+        read_mapped_tree(str(tree_file), file_size_limit=4)
+
+
+@pytest.mark.parametrize(
+    'parent_path, tree_filter',
+    [
+        (None, None),
+        ('module', None),
+        ('module/', TreeFilter(exclude=('api/',))),
+        (None, TreeFilter(include=('*.md',))),
+    ]
+)
+def test_generate_mapped_files_matches_tree_reader(tmp_path, parent_path, tree_filter):
+    tree_input = 'src/\n  api/\n    routes.py\n  main.py\ndocs/\n  index.md\nREADME.md\n'
+    (tree_file := tmp_path / 'a.tree').write_text(tree_input)
+    expected = list(generate_treescript_files(tree_input, parent_path, tree_filter))
+    assert list(generate_mapped_files(str(tree_file), parent_path, tree_filter)) == expected
@@ -0,0 +1,209 @@
+""" Testing Daemon Mode Methods.
+"""
+import json
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+
+import pytest
+
+from treescript_files import daemon, file_validation
+from treescript_files.daemon import get_socket_path, request_files, serve
+from treescript_files.tree_reader import generate_treescript_files
+
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='Unix domain sockets are not available.')
+
+_SOCKET_NAME = 'daemon.sock'
+_TREE_INPUT = 'src/\n  main.py\n  util/\n    helpers.py\nREADME.md\n'
+
+
+@pytest.fixture
+def server(tmp_path):
+    """ Runs a server in a background thread, with the socket in the working directory.
+    """
+    os.chdir(tmp_path)
+    (tmp_path / 'input.tree').write_text(_TREE_INPUT)
+    thread = threading.Thread(target=serve, args=(_SOCKET_NAME, 0.5), daemon=True)
+    thread.start()
+    for _ in range(200):
+        if os.path.exists(_SOCKET_NAME):
+            break
+        threading.Event().wait(0.01)
+    yield thread
+    thread.join(5)
+
+
+def _expected_output(parent_path=None, separator='\n') -> str:
+    return separator.join(generate_treescript_files(_TREE_INPUT, parent_path)) + '\n'
+
+
+def test_request_files_returns_output(server):
+    output = BytesIO()
+    assert request_files(_SOCKET_NAME, 'input.tree', output) == 3
+    assert output.getvalue().decode() == _expected_output()
+
+
+def test_request_files_text_stream_options(server):
+    output = StringIO()
+    assert request_files(_SOCKET_NAME, 'input.tree', output, parent_path='root', separator=',') == 3
+    assert output.getvalue() == _expected_output('root', ',')
+
+
+def test_request_files_concurrent_clients(server):
+    def _request(_):
+        output = BytesIO()
+        request_files(_SOCKET_NAME, 'input.tree', output)
+        return output.getvalue().decode()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert set(executor.map(_request, range(32))) == {_expected_output()}
+
+
+def test_request_files_tree_filter(server):
+    from treescript_files.tree_filter import TreeFilter
+    output = StringIO()
+    assert request_files(_SOCKET_NAME, 'input.tree', output, separator=' ', tree_filter=TreeFilter(('*.py',), ('util/',))) == 1
+    assert output.getvalue() == os.path.join('src', 'main.py') + '\n'
+
+
+def test_request_files_cache_hit_skips_parsing(server, monkeypatch):
+    request_files(_SOCKET_NAME, 'input.tree', BytesIO())
+    monkeypatch.setattr(daemon, '_process_request', lambda *_: pytest.fail('The cache was not used.'))
+    output = BytesIO()
+    assert request_files(_SOCKET_NAME, 'input.tree', output) == 3
+    assert output.getvalue().decode() == _expected_output()
+
+
+def test_request_files_changed_file_is_parsed_again(server, tmp_path):
+    request_files(_SOCKET_NAME, 'input.tree', BytesIO())
+    (tmp_path / 'input.tree').write_text('other.py\n')
+    output = BytesIO()
+    assert request_files(_SOCKET_NAME, 'input.tree', output) == 1
+    assert output.getvalue() == b'other.py\n'
+
+
+def _request(tree_file, **options) -> dict:
+    return {
+        'tree_file': os.path.abspath(tree_file), 'parent_path': None, 'separator': '\n',
+        'file_size_limit': None, 'encoding': 'utf-8', **options,
+    }
+
+
+def test_output_cache_evicts_least_recently_used_by_size(tmp_path, monkeypatch):
+    os.chdir(tmp_path)
+    (tmp_path / 'input.tree').write_text(_TREE_INPUT)
+    output_size = len(_expected_output())
+    output_cache = daemon._OutputCache(size_limit=output_size * 3)
+    for parent_path in (None, 'a', None, 'b'):
+        output_cache.write_output(_request('input.tree', parent_path=parent_path), BytesIO())
+    assert len(output_cache._entries) == 2
+    monkeypatch.setattr(daemon, '_process_request', lambda *_: pytest.fail('The cache was not used.'))
+    output = BytesIO()
+    assert output_cache.write_output(_request('input.tree'), output) == 3
+    assert output.getvalue().decode() == _expected_output()
+
+
+def test_output_cache_large_output_is_streamed_without_caching(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'input.tree').write_text(''.join(f'file_{i}.py\n' for i in range(5000)))
+    output_cache = daemon._OutputCache(size_limit=1024)
+    output = BytesIO()
+    assert output_cache.write_output(_request('input.tree'), output) == 5000
+    assert len(output.getvalue()) > 1024
+    assert output_cache._entries == {}
+    assert output_cache._size == 0
+
+
+def test_request_files_large_output_arrives_in_frames(server, tmp_path):
+    (tmp_path / 'large.tree').write_text(''.join(f'file_{i}.py\n' for i in range(5000)))
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(_SOCKET_NAME)
+        client.sendall(json.dumps(_request('large.tree')).encode() + b'\n')
+        response = client.makefile('rb')
+        frames = []
+        while (status := response.readline()).startswith(b'data '):
+            frames.append(response.read(int(status.split()[1])))
+    assert len(frames) > 1
+    assert status == b'ok 5000\n'
+    assert b''.join(frames).decode().splitlines() == [f'file_{i}.py' for i in range(5000)]
+
+
+def test_request_files_incomplete_response_raises_exit(tmp_path):
+    os.chdir(tmp_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(_SOCKET_NAME)
+        listener.listen()
+        def _respond():
+            connection, _ = listener.accept()
+            with connection:
+                connection.makefile('rb').readline()
+                connection.sendall(b'data 8\nsrc/a.py\n')
+        thread = threading.Thread(target=_respond, daemon=True)
+        thread.start()
+        output = BytesIO()
+        with pytest.raises(SystemExit, match=daemon._INCOMPLETE_RESPONSE_MSG):
+            request_files(_SOCKET_NAME, 'input.tree', output)
+        thread.join(5)
+    assert output.getvalue() == b'src/a.py'
+
+
+def test_request_files_missing_file_raises_exit(server):
+    with pytest.raises(SystemExit, match=file_validation._FILE_DOES_NOT_EXIST_MSG):
+        request_files(_SOCKET_NAME, 'missing.tree', BytesIO())
+
+
+def test_request_files_invalid_tree_raises_exit(server, tmp_path):
+    (tmp_path / 'invalid.tree').write_text('src/\n      deep.py\n')
+    with pytest.raises(SystemExit, match='You have jumped 2 steps in the tree on line: 2'):
+        request_files(_SOCKET_NAME, 'invalid.tree', BytesIO())
+
+
+def test_request_files_no_server_returns_none(tmp_path):
+    os.chdir(tmp_path)
+    assert request_files(_SOCKET_NAME, 'input.tree', BytesIO()) is None
+
+
+def test_serve_exits_when_idle(server):
+    server.join(5)
+    assert not server.is_alive()
+    assert not os.path.exists(_SOCKET_NAME)
+
+
+def test_serve_socket_in_use_raises_exit(server):
+    with pytest.raises(SystemExit, match=daemon._SERVER_ALREADY_RUNNING_MSG):
+        serve(_SOCKET_NAME, 0.1)
+
+
+def test_serve_removes_stale_socket(tmp_path):
+    os.chdir(tmp_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(_SOCKET_NAME)
+    serve(_SOCKET_NAME, 0.1)
+    assert not os.path.exists(_SOCKET_NAME)
+
+
+def test_get_socket_path_environment_variable(monkeypatch):
+    monkeypatch.setenv(daemon._SOCKET_ENV_VAR, 'env.sock')
+    assert get_socket_path(None) == 'env.sock'
+    assert get_socket_path('arg.sock') == 'arg.sock'
+    monkeypatch.setenv(daemon._SOCKET_ENV_VAR, ' ')
+    assert get_socket_path(None) is None
+
+
+@pytest.mark.parametrize(
+    "request_line",
+    [
+        b'not json\n',
+        b'[]\n',
+        b'{"tree_file": "relative.tree"}\n',
+        b'{"tree_file": "/input.tree", "parent_path": null, "separator": 1, "file_size_limit": null, "encoding": "utf-8"}\n',
+        b'{"tree_file": "/input.tree", "parent_path": null, "separator": "\\n", "file_size_limit": null, "encoding": "none"}\n',
+    ]
+)
+def test_serve_invalid_request_returns_error(server, request_line):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(_SOCKET_NAME)
+        client.sendall(request_line)
+        assert client.makefile('rb').readline().startswith(b'error ')
@@ -0,0 +1,143 @@
+""" Testing Directory Reader Methods.
+"""
+import os
+from io import BytesIO, StringIO
+from re import escape
+
+import pytest
+
+from treescript_files import dir_reader, generate_treescript_files
+from treescript_files.dir_reader import generate_dir_treescript, write_dir_treescript
+from treescript_files.input_data import InputData
+from treescript_files.line_reader import read_input_tree
+from treescript_files.materializer import materialize_tree
+from treescript_files.tree_filter import TreeFilter
+
+
+_TREE_INPUT = """src/
+  api/
+    routes.py
+  main.py
+.git/
+  HEAD
+README.md
+docs/
+"""
+
+
+@pytest.fixture
+def tree_root(tmp_path) -> str:
+    root = str(tmp_path / 'root')
+    materialize_tree(read_input_tree(_TREE_INPUT), root)
+    return root
+
+
+def test_generate_dir_treescript_sorted_lines(tree_root):
+    assert list(generate_dir_treescript(tree_root)) == [
+        '.git/',
+        '  HEAD',
+        'README.md',
+        'docs/',
+        'src/',
+        '  api/',
+        '    routes.py',
+        '  main.py',
+    ]
+
+
+def test_generate_dir_treescript_exclude_git(tree_root):
+    lines = list(generate_dir_treescript(tree_root, TreeFilter(exclude=('.git',)), max_workers=2))
+    assert lines == ['README.md', 'docs/', 'src/', '  api/', '    routes.py', '  main.py']
+
+
+@pytest.mark.parametrize(
+    'tree_filter,expected',
+    [
+        (TreeFilter(include=('*.py',)), ['.git/', 'docs/', 'src/', '  api/', '    routes.py', '  main.py']),
+        (TreeFilter(exclude=('src/api/', '.git/')), ['README.md', 'docs/', 'src/', '  main.py']),
+        (TreeFilter(exclude=('src/m*.py', '.git/', 'docs/')), ['README.md', 'src/', '  api/', '    routes.py']),
+    ]
+)
+def test_generate_dir_treescript_filter(tree_root, tree_filter, expected):
+    assert list(generate_dir_treescript(tree_root, tree_filter)) == expected
+
+
+@pytest.mark.parametrize(
+    'name',
+    [
+        'two words',
+        '#comment',
+        'back\\slash',
+        'x' * 100,
+    ]
+)
+def test_generate_dir_treescript_skips_unrepresentable_names(tmp_path, name):
+    if os.sep == '\\' and '\\' in name:
+        pytest.skip('The name is a path on Windows.')
+    (tmp_path / name).touch()
+    (tmp_path / 'valid.txt').touch()
+    skipped = []
+    assert list(generate_dir_treescript(str(tmp_path), skipped=skipped)) == ['valid.txt']
+    assert skipped == [os.path.join(str(tmp_path), name)]
+
+
+def test_generate_dir_treescript_symlink_is_a_file(tree_root):
+    try:
+        os.symlink(os.path.join(tree_root, 'src'), os.path.join(tree_root, 'link'), target_is_directory=True)
+    except OSError:
+        pytest.skip('Symbolic links are not available.')
+    assert 'link' in list(generate_dir_treescript(tree_root))
+
+
+def test_generate_dir_treescript_missing_root_raises_exit(tmp_path):
+    with pytest.raises(SystemExit, match=escape(dir_reader._SCAN_FAILED_MSG)):
+        list(generate_dir_treescript(str(tmp_path / 'missing')))
+
+
+@pytest.mark.parametrize("shape", ['wide', 'comments', 'mixed_slashes'])
+def test_generate_dir_treescript_round_trip_reproduces_files(tmp_path, shape):
+    from benchmarks.treescript_generator import generate_treescript
+    tree_input = generate_treescript(shape, 500)
+    root = str(tmp_path / 'root')
+    materialize_tree(read_input_tree(tree_input), root)
+    treescript = '\n'.join(generate_dir_treescript(root, max_workers=4))
+    assert sorted(generate_treescript_files(treescript, None)) == sorted(set(generate_treescript_files(tree_input, None)))
+
+
+def test_write_dir_treescript_binary_stream(tree_root):
+    output = BytesIO()
+    assert write_dir_treescript(InputData(tree_input=None, from_dir=tree_root), output) == 8
+    assert output.getvalue() == b'.git/\n  HEAD\nREADME.md\ndocs/\nsrc/\n  api/\n    routes.py\n  main.py\n'
+
+
+def test_write_dir_treescript_reports_skipped_on_stderr(capsys, tmp_path):
+    (tmp_path / 'two words').touch()
+    output = StringIO()
+    assert write_dir_treescript(InputData(tree_input=None, from_dir=str(tmp_path)), output) == 0
+    assert output.getvalue() == '\n'
+    assert capsys.readouterr().err == dir_reader._SKIPPED_NAME_MSG + os.path.join(str(tmp_path), 'two words') + '\n'
+
+
+def test_generate_dir_treescript_bounds_prefetch(tmp_path, monkeypatch):
+    from concurrent.futures import Future
+    submitted = []
+
+    class _Executor:
+        def __init__(self, max_workers):
+            pass
+
+        def submit(self, function, *args):
+            submitted.append(future := Future())
+            future.set_result(function(*args))
+            return future
+
+        def shutdown(self, wait, cancel_futures):
+            pass
+    monkeypatch.setattr('concurrent.futures.ThreadPoolExecutor', _Executor)
+    monkeypatch.setattr(dir_reader, '_PREFETCH_LIMIT', 2)
+    for d in range(20):
+        (tmp_path / f'dir_{d:02}' / 'sub').mkdir(parents=True)
+    lines = generate_dir_treescript(str(tmp_path))
+    assert next(lines) == 'dir_00/'
+    assert len(submitted) == 2
+    assert len(list(lines)) == 39
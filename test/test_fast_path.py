@@ -0,0 +1,109 @@
+""" Testing Command Line Fast Path Methods.
+"""
+import os
+import subprocess
+import sys
+import threading
+from io import BytesIO, TextIOWrapper
+
+import pytest
+
+from treescript_files import file_validation, parse_cache, tree_reader
+from treescript_files.fast_path import write_single_file
+
+
+@pytest.fixture
+def tree_file(tmp_path, monkeypatch):
+    monkeypatch.delenv(parse_cache._CACHE_DIR_ENV_VAR, raising=False)
+    os.chdir(tmp_path)
+    (tmp_path / 'input.tree').write_text('src/\n  main.py\n  util/\n    helpers.py\nREADME.md\n')
+    return 'input.tree'
+
+
+def test_write_single_file_writes_files(tree_file):
+    output = BytesIO()
+    assert write_single_file([tree_file], output) == 3
+    assert output.getvalue().decode().replace('\\', '/') == 'src/main.py\nsrc/util/helpers.py\nREADME.md\n'
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        [],
+        ['--parent', 'root'],
+        ['input.tree', '--stats'],
+        ['-s'],
+        ['  '],
+    ]
+)
+def test_write_single_file_options_return_none(tree_file, arguments):
+    assert write_single_file(arguments, BytesIO()) is None
+
+
+def test_write_single_file_stdin_writes_files(tree_file, monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', TextIOWrapper(BytesIO(b'src/\n  main.py\nREADME.md\n'), encoding='utf-8'))
+    output = BytesIO()
+    assert write_single_file(['-'], output) == 2
+    assert output.getvalue().decode().replace('\\', '/') == 'src/main.py\nREADME.md\n'
+
+
+def test_write_single_file_stdin_streams_output(tree_file):
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'treescript_files', '-'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    # Fail instead of waiting forever, if the output is only written at the end of the input
+    timer = threading.Timer(30, process.kill)
+    timer.start()
+    try:
+        process.stdin.write(b'src/\n' + b''.join(b'  file_%d.py\n' % i for i in range(5000)))
+        process.stdin.flush()
+        first_line = process.stdout.readline()
+        process.stdin.close()
+        remaining = process.stdout.read()
+        process.wait()
+    finally:
+        timer.cancel()
+    assert first_line.decode().replace('\\', '/') == 'src/file_0.py\n'
+    assert len(remaining.splitlines()) == 4999
+    assert process.returncode == 0
+
+
+def test_write_single_file_cache_environment_returns_none(tree_file, monkeypatch):
+    monkeypatch.setenv(parse_cache._CACHE_DIR_ENV_VAR, 'cache')
+    assert write_single_file([tree_file], BytesIO()) is None
+
+
+def test_write_single_file_parallel_input_returns_none(tree_file, monkeypatch):
+    monkeypatch.setattr(tree_reader, '_PARALLEL_THRESHOLD', 1)
+    assert write_single_file([tree_file], BytesIO()) is None
+
+
+def test_write_single_file_missing_file_returns_none(tree_file):
+    assert write_single_file(['missing.tree'], BytesIO()) is None
+
+
+def test_write_single_file_empty_file_raises_exit(tree_file, tmp_path):
+    (tmp_path / 'empty.tree').touch()
+    with pytest.raises(SystemExit, match=file_validation._FILE_EMPTY_MSG):
+        write_single_file(['empty.tree'], BytesIO())
+
+
+def _imported_modules(arguments: list[str]) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *arguments],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    return {line.split('|')[-1].strip() for line in result.stderr.splitlines() if line.startswith('import time:')}
+
+
+@pytest.mark.parametrize("module", ['argparse', 'dataclasses', 'pathlib'])
+def test_single_file_start_up_defers_module(tree_file, tmp_path, module):
+    program = f"import sys; sys.argv = ['treescript-files', {str(tmp_path / tree_file)!r}]; " \
+        "from treescript_files.__main__ import main; main()"
+    if module in _imported_modules(['-c', 'pass']):
+        pytest.skip(f'{module} is imported by the interpreter start up.')
+    assert module not in _imported_modules(['-c', program])
@@ -1,13 +1,16 @@
 """ Testing File Validation Methods.
 """
 import os
+import sys
+from io import BytesIO, TextIOWrapper
 
 import pytest
 from pathlib import Path
 
-from test.conftest import raise_exception
 from treescript_files import file_validation
-from treescript_files.file_validation import validate_input_file
+from test.conftest import raise_exception
+from treescript_files.file_validation import read_input_lines, read_stream_lines, validate_input_file
+from treescript_files.line_reader import read_input_tree
 
 
 @pytest.mark.parametrize(
@@ -39,17 +42,225 @@ def test_validate_input_file_is_empty_raises_exit(tmp_path):
 
 def test_validate_input_file_io_error_raises_exit(tmp_path):
     os.chdir(tmp_path)
+    (tmp_path / 'file_name').write_text('file_data')
     with pytest.MonkeyPatch().context() as c:
-        c.setattr(Path, 'exists', lambda _: True)
-        c.setattr(Path, 'read_text', lambda _: raise_exception('ioerror'))
+        c.setattr(file_validation, 'open', lambda *_, **__: raise_exception('ioerror'), raising=False)
         with pytest.raises(SystemExit, match=file_validation._FILE_READ_OSERROR_MSG):
             validate_input_file("file_name")
 
 
 def test_validate_input_file_os_error_raises_exit(tmp_path):
     os.chdir(tmp_path)
+    (tmp_path / 'file_name').write_text('file_data')
     with pytest.MonkeyPatch().context() as c:
-        c.setattr(Path, 'exists', lambda _: True)
-        c.setattr(Path, 'read_text', lambda _: raise_exception('oserror'))
+        c.setattr(file_validation, 'open', lambda *_, **__: raise_exception('oserror'), raising=False)
         with pytest.raises(SystemExit, match=file_validation._FILE_READ_OSERROR_MSG):
             validate_input_file("file_name")
+
+
+def test_validate_input_file_over_size_limit_raises_exit(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'file_name').write_text('file_data')
+    with pytest.raises(SystemExit, match=file_validation._FILE_SIZE_LIMIT_ERROR_MSG):
+        validate_input_file("file_name", file_size_limit=4)
+
+
+def test_read_input_lines_yields_lines(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'file_name').write_text('src/\n  file.py\n')
+    assert list(read_input_lines('file_name')) == ['src/\n', '  file.py\n']
+
+
+def test_read_input_lines_does_not_exist_raises_exit(tmp_path):
+    os.chdir(tmp_path)
+    with pytest.raises(SystemExit, match=file_validation._FILE_DOES_NOT_EXIST_MSG):
+        read_input_lines("file_name")
+
+
+def test_read_input_lines_symlink_raises_exit(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'file_name').write_text('src/\n')
+    try:
+        (tmp_path / 'link_name').symlink_to(tmp_path / 'file_name')
+    except OSError:
+        pytest.skip('Symlinks are not available.')
+    with pytest.raises(SystemExit, match=file_validation._FILE_SYMLINK_DISABLED_MSG):
+        read_input_lines("link_name")
+
+
+@pytest.mark.parametrize(
+    "file_data", ['', '\n', '   \n  \n']
+)
+def test_read_input_lines_blank_raises_exit(tmp_path, file_data):
+    os.chdir(tmp_path)
+    (tmp_path / 'file_name').write_text(file_data)
+    with pytest.raises(SystemExit, match=file_validation._FILE_EMPTY_MSG):
+        list(read_input_lines("file_name"))
+
+
+def test_read_input_lines_read_error_raises_exit(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'dir_name').mkdir()
+    with pytest.raises(SystemExit, match=file_validation._FILE_READ_OSERROR_MSG):
+        list(read_input_lines("dir_name"))
+
+
+def test_read_input_lines_over_size_limit_raises_exit(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'file_name').write_text('src/\n  file.py\n')
+    with pytest.raises(SystemExit, match=file_validation._FILE_SIZE_LIMIT_ERROR_MSG):
+        read_input_lines("file_name", file_size_limit=4)
+
+
+def test_read_input_lines_no_size_limit_yields_lines(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'file_name').write_text('src/\n' + '  file.py\n' * 1000)
+    assert len(list(read_input_lines("file_name", file_size_limit=None))) == 1001
+
+
+class _ChunkStream:
+    """ A binary stream that returns one chunk per read1 call, and records the number of calls.
+    """
+
+    def __init__(self, *chunks: bytes):
+        self.chunks = list(chunks)
+        self.reads = 0
+
+    def read1(self, size: int = -1) -> bytes:
+        self.reads += 1
+        return self.chunks.pop(0) if len(self.chunks) > 0 else b''
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        (b'src/\n  file.py\n',),
+        (b'src/\n  fi', b'le.py'),
+        (b'src/\r', b'\n  file.py\r\n\r\n  main.py\r'),
+        (b'src/\r  file.py\r\r  main.py',),
+        (b'src/\n  caf\xc3', b'\xa9.py\n'),
+        (b'# Comment\n\nsrc/  Sources\n', b'\n', b'  file.py\n'),
+    ]
+)
+def test_read_stream_lines_matches_text_file(tmp_path, chunks):
+    (tmp_path / 'file_name').write_bytes(b''.join(chunks))
+    with open(tmp_path / 'file_name', encoding='utf-8') as file:
+        expected = list(read_input_tree(file))
+    assert list(read_input_tree(read_stream_lines(_ChunkStream(*chunks)))) == expected
+
+
+def test_read_stream_lines_yields_lines_before_end_of_stream():
+    stream = _ChunkStream(b'src/\n  file.py\n', b'  main.py\n')
+    lines = read_stream_lines(stream)
+    assert next(lines) == 'src/\n'
+    assert stream.reads == 1
+    assert list(lines) == ['  file.py\n', '  main.py\n']
+
+
+def test_read_stream_lines_over_size_limit_raises_exit():
+    lines = read_stream_lines(_ChunkStream(b'src/\n', b'  file.py\n'), file_size_limit=8)
+    assert next(lines) == 'src/\n'
+    with pytest.raises(SystemExit, match=file_validation._FILE_SIZE_LIMIT_ERROR_MSG):
+        next(lines)
+
+
+@pytest.mark.parametrize(
+    "chunks", [(), (b'\n',), (b'  \r\n', b'\t')]
+)
+def test_read_stream_lines_blank_raises_exit(chunks):
+    with pytest.raises(SystemExit, match=file_validation._FILE_EMPTY_MSG):
+        list(read_stream_lines(_ChunkStream(*chunks)))
+
+
+def test_read_input_lines_stdin_yields_lines(monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', TextIOWrapper(BytesIO(b'src/\n  file.py\n'), encoding='utf-8'))
+    assert list(read_input_lines('-')) == ['src/\n', '  file.py\n']
+
+
+def test_read_input_lines_stdin_over_size_limit_raises_exit(monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', TextIOWrapper(BytesIO(b'src/\n  file.py\n'), encoding='utf-8'))
+    with pytest.raises(SystemExit, match=file_validation._FILE_SIZE_LIMIT_ERROR_MSG):
+        list(read_input_lines('-', file_size_limit=4))
+
+
+_COMPRESSORS = {'gzip': '.gz', 'bz2': '.bz2', 'lzma': '.xz'}
+
+
+def _write_compressed(path: Path, module_name: str, data: bytes):
+    from importlib import import_module
+    with import_module(module_name).open(path, 'wb') as file:
+        file.write(data)
+
+
+@pytest.mark.parametrize("module_name", list(_COMPRESSORS))
+@pytest.mark.parametrize("use_suffix", [True, False])
+def test_read_input_lines_compressed_yields_lines(tmp_path, module_name, use_suffix):
+    file_name = str(tmp_path / ('input.tree' + (_COMPRESSORS[module_name] if use_suffix else '')))
+    _write_compressed(Path(file_name), module_name, b'src/\n  file.py\r\n  caf\xc3\xa9.py')
+    assert list(read_input_tree(read_input_lines(file_name))) == list(read_input_tree('src/\n  file.py\n  café.py'))
+
+
+@pytest.mark.parametrize("module_name", list(_COMPRESSORS))
+def test_read_input_lines_compressed_size_limit_counts_decompressed_bytes(tmp_path, module_name):
+    file_name = str(tmp_path / ('input.tree' + _COMPRESSORS[module_name]))
+    _write_compressed(Path(file_name), module_name, b'src/\n' + b'  file.py\n' * 10_000)
+    assert os.path.getsize(file_name) < 4096
+    with pytest.raises(SystemExit, match=file_validation._FILE_SIZE_LIMIT_ERROR_MSG):
+        list(read_input_lines(file_name, file_size_limit=4096))
+
+
+@pytest.mark.parametrize("module_name", list(_COMPRESSORS))
+def test_read_input_lines_compressed_size_limit_ignores_compressed_size(tmp_path, module_name):
+    file_name = str(tmp_path / ('input.tree' + _COMPRESSORS[module_name]))
+    _write_compressed(Path(file_name), module_name, b'src/\n  file.py\n')
+    assert os.path.getsize(file_name) > 20
+    assert list(read_input_lines(file_name, file_size_limit=20)) == ['src/\n', '  file.py\n']
+
+
+@pytest.mark.parametrize("text", ['BZh_docs/\n  a.md\n', 'BZh9/\n  a.md\n', 'BZh91AY/\n  a.md\n'])
+def test_read_input_lines_text_starting_with_bz2_magic_yields_lines(tmp_path, text):
+    (tree_file := tmp_path / 'input.tree').write_text(text)
+    assert list(read_input_lines(str(tree_file))) == text.splitlines(keepends=True)
+
+
+@pytest.mark.parametrize("module_name", list(_COMPRESSORS))
+def test_read_input_lines_truncated_compressed_raises_exit(tmp_path, module_name):
+    file_name = str(tmp_path / ('input.tree' + _COMPRESSORS[module_name]))
+    _write_compressed(Path(file_name), module_name, b'src/\n' + b''.join(b'  file_%d.py\n' % i for i in range(1000)))
+    with open(file_name, 'rb') as file:
+        data = file.read()
+    Path(file_name).write_bytes(data[:len(data) // 2])
+    with pytest.raises(SystemExit, match=file_validation._FILE_READ_OSERROR_MSG):
+        list(read_input_lines(file_name))
+
+
+@pytest.mark.parametrize("suffix", list(_COMPRESSORS.values()))
+def test_read_input_lines_invalid_compressed_raises_exit(tmp_path, suffix):
+    (tmp_path / ('input.tree' + suffix)).write_text('src/\n  file.py\n')
+    with pytest.raises(SystemExit, match=file_validation._FILE_READ_OSERROR_MSG):
+        list(read_input_lines(str(tmp_path / ('input.tree' + suffix))))
+
+
+def test_read_input_lines_compressed_blank_raises_exit(tmp_path):
+    _write_compressed(tmp_path / 'input.tree.gz', 'gzip', b'\n  \n')
+    with pytest.raises(SystemExit, match=file_validation._FILE_EMPTY_MSG):
+        list(read_input_lines(str(tmp_path / 'input.tree.gz')))
+
+
+def test_read_input_lines_compression_unavailable_raises_exit(tmp_path, monkeypatch):
+    _write_compressed(tmp_path / 'input.tree.xz', 'lzma', b'src/\n  file.py\n')
+    monkeypatch.setitem(sys.modules, 'lzma', None)
+    with pytest.raises(SystemExit, match=file_validation._COMPRESSION_UNAVAILABLE_MSG):
+        list(read_input_lines(str(tmp_path / 'input.tree.xz')))
+
+
+def test_read_input_lines_compressed_memory_is_bounded(tmp_path):
+    import tracemalloc
+    _write_compressed(tmp_path / 'input.tree.gz', 'gzip', b'src/\n' + b'  file.py\n' * 500_000)
+    tracemalloc.start()
+    try:
+        assert sum(1 for _ in read_input_lines(str(tmp_path / 'input.tree.gz'), file_size_limit=None)) == 500_001
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 2 * 1024**2
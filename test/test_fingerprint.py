@@ -0,0 +1,94 @@
+""" Testing Fingerprint Methods.
+"""
+import os
+from io import BytesIO, StringIO
+
+import pytest
+
+from treescript_files.fingerprint import build_fingerprint_tree, compute_fingerprint, iter_dir_fingerprints, write_fingerprint
+from treescript_files.input_data import InputData
+from treescript_files.tree_filter import TreeFilter
+
+
+_TREE_INPUT = """src/
+  api/
+    routes.py
+  main.py
+docs/
+README.md
+"""
+
+
+@pytest.mark.parametrize(
+    'equivalent_input',
+    [
+        # Comments, blank lines, and trailing words
+        "# The project\nsrc/  The sources\n\n  api/\n    routes.py  # The routes\n  main.py\ndocs/\nREADME.md\n",
+        # Line order and slash style
+        "README.md\n\\src\n  main.py\n  api\\\n    routes.py\n",
+        # Repeated Directories and Files
+        "src/\n  main.py\nsrc/\n  api/\n    routes.py\n  main.py\nREADME.md\nREADME.md\n",
+        # Empty Directories
+        "src/\n  api/\n    routes.py\n    v2/\n  main.py\nREADME.md\nbuild/\n  out/\n",
+    ]
+)
+def test_compute_fingerprint_normalized_structure_is_equal(equivalent_input):
+    assert compute_fingerprint(equivalent_input) == compute_fingerprint(_TREE_INPUT)
+
+
+@pytest.mark.parametrize(
+    'changed_input',
+    [
+        "src/\n  api/\n    routes.py\n  main.py\nREADME.rst\n",
+        "src/\n  api/\n    routes.py\n    models.py\n  main.py\nREADME.md\n",
+        "src/\n  main.py\n  routes.py\nREADME.md\n",
+        "src/\n  api/\n    routes.py\nmain.py\nREADME.md\n",
+    ]
+)
+def test_compute_fingerprint_changed_files_differ(changed_input):
+    assert compute_fingerprint(changed_input) != compute_fingerprint(_TREE_INPUT)
+
+
+def test_compute_fingerprint_filter():
+    assert compute_fingerprint(_TREE_INPUT, TreeFilter(include=('*.py',))) == compute_fingerprint('src/\n  api/\n    routes.py\n  main.py')
+
+
+def test_compute_fingerprint_is_hex():
+    fingerprint = compute_fingerprint(_TREE_INPUT)
+    assert len(fingerprint) == 32
+    int(fingerprint, 16)
+
+
+def test_iter_dir_fingerprints_locates_changed_subtree():
+    old = dict((path, digest) for digest, path in iter_dir_fingerprints(build_fingerprint_tree(_TREE_INPUT)))
+    new = dict((path, digest) for digest, path in iter_dir_fingerprints(build_fingerprint_tree(
+        _TREE_INPUT.replace('routes.py', 'urls.py')
+    )))
+    assert list(old) == ['', 'src' + os.sep, os.path.join('src', 'api', '')]
+    assert [path for path in old if old[path] != new[path]] == list(old)
+    assert new[''] == compute_fingerprint(_TREE_INPUT.replace('routes.py', 'urls.py'))
+    # A change in one subtree leaves its siblings unchanged
+    other = dict((path, digest) for digest, path in iter_dir_fingerprints(build_fingerprint_tree(
+        _TREE_INPUT + 'lib/\n  util.py\n'
+    )))
+    assert other['src' + os.sep] == old['src' + os.sep]
+    assert other[''] != old['']
+
+
+def test_iter_dir_fingerprints_parent_path():
+    paths = [path for _, path in iter_dir_fingerprints(build_fingerprint_tree(_TREE_INPUT), 'module/')]
+    assert paths == ['module' + os.sep, os.path.join('module', 'src', ''), os.path.join('module', 'src', 'api', '')]
+
+
+def test_write_fingerprint_root_only():
+    output = BytesIO()
+    assert write_fingerprint(InputData(tree_input=_TREE_INPUT, fingerprint=True), output) == 1
+    assert output.getvalue() == compute_fingerprint(_TREE_INPUT).encode() + b'\n'
+
+
+def test_write_fingerprint_dir_fingerprints():
+    output = StringIO()
+    assert write_fingerprint(InputData(tree_input=_TREE_INPUT, fingerprint=True, dir_fingerprints=True), output) == 3
+    lines = output.getvalue().splitlines()
+    assert lines[0] == compute_fingerprint(_TREE_INPUT) + '  .' + os.sep
+    assert lines[1].endswith('  src' + os.sep)
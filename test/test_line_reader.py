@@ -1,12 +1,14 @@
 """ Testing Line Reader Methods.
 """
 from re import escape
+from sys import exit
 
 import pytest
 
 from test.conftest import create_depth
 from treescript_files import line_reader
-from treescript_files.line_reader import _calculate_depth, _process_line, _validate_node_name, read_input_tree
+from treescript_files.line_reader import _process_line, _tokenize_line, read_input_tree
+from treescript_files.string_validation import validate_dir_name, validate_name
 from treescript_files.tree_data import TreeData
 
 
@@ -14,6 +16,10 @@ from treescript_files.tree_data import TreeData
 dir_variants = ('/dir', 'dir/', '\\dir', 'dir\\')
 
 
+def _tokenize(line: str) -> TreeData:
+    return _tokenize_line(1, line, line.lstrip())
+
+
 @pytest.mark.parametrize(
     "test_input,expect",
     [
@@ -21,8 +27,8 @@ dir_variants = ('/dir', 'dir/', '\\dir', 'dir\\')
         for depth in range(0, 9)
     ]
 )
-def test_calculate_depth_file_returns_expected(test_input, expect):
-    assert _calculate_depth(1, test_input) == expect
+def test_tokenize_line_depth_file_returns_expected(test_input, expect):
+    assert _tokenize(test_input).depth == expect
 
 
 @pytest.mark.parametrize(
@@ -32,9 +38,9 @@ def test_calculate_depth_file_returns_expected(test_input, expect):
         for depth in range(0, 9)
     ]
 )
-def test_calculate_depth_file_odd_spaces_raises_exit(test_input):
+def test_tokenize_line_depth_file_odd_spaces_raises_exit(test_input):
     with pytest.raises(SystemExit, match=escape(line_reader._INVALID_DEPTH_ERROR_MSG)):
-        _calculate_depth(1, test_input)
+        _tokenize(test_input)
 
 
 @pytest.mark.parametrize(
@@ -45,8 +51,8 @@ def test_calculate_depth_file_odd_spaces_raises_exit(test_input):
         for depth in range(0, 9)
     ]
 )
-def test_calculate_depth_dir_returns_expected(test_input, expect):
-    assert _calculate_depth(1, test_input) == expect
+def test_tokenize_line_depth_dir_returns_expected(test_input, expect):
+    assert _tokenize(test_input).depth == expect
 
 
 @pytest.mark.parametrize(
@@ -57,9 +63,9 @@ def test_calculate_depth_dir_returns_expected(test_input, expect):
         for depth in range(0, 9)
     ]
 )
-def test_calculate_depth_dir_odd_spaces_raises_exit(test_input):
+def test_tokenize_line_depth_dir_odd_spaces_raises_exit(test_input):
     with pytest.raises(SystemExit, match=escape(line_reader._INVALID_DEPTH_ERROR_MSG)):
-        _calculate_depth(1, test_input)
+        _tokenize(test_input)
 
 
 @pytest.mark.parametrize(
@@ -170,8 +176,8 @@ def test_process_line_current_dir_raise_exit(test_input):
         '\\a',
     ]
 )
-def test_validate_node_name_valid_dir_returns_tuple(test_input):
-    assert _validate_node_name(1, test_input) == (True, 'a')
+def test_tokenize_line_name_valid_dir_returns_tuple(test_input):
+    assert _tokenize(test_input)[2:] == (True, 'a')
 
 
 @pytest.mark.parametrize(
@@ -183,8 +189,8 @@ def test_validate_node_name_valid_dir_returns_tuple(test_input):
         '\\.a',
     ]
 )
-def test_validate_node_name_valid_hidden_dir_returns_tuple(test_input):
-    assert _validate_node_name(1, test_input) == (True, '.a')
+def test_tokenize_line_name_valid_hidden_dir_returns_tuple(test_input):
+    assert _tokenize(test_input)[2:] == (True, '.a')
 
 
 @pytest.mark.parametrize(
@@ -195,8 +201,8 @@ def test_validate_node_name_valid_hidden_dir_returns_tuple(test_input):
         'a.txt',
     ]
 )
-def test_validate_node_name_valid_file_returns_tuple(test_input):
-    assert _validate_node_name(1, test_input) == (False, test_input)
+def test_tokenize_line_name_valid_file_returns_tuple(test_input):
+    assert _tokenize(test_input)[2:] == (False, test_input)
 
 
 @pytest.mark.parametrize(
@@ -208,9 +214,9 @@ def test_validate_node_name_valid_file_returns_tuple(test_input):
         "././",
     ]
 )
-def test_validate_node_name_invalid_dir_raises_exit(test_input):
+def test_tokenize_line_name_invalid_dir_raises_exit(test_input):
     with pytest.raises(SystemExit):
-        _validate_node_name(1, test_input)
+        _tokenize(test_input)
 
 
 @pytest.mark.parametrize(
@@ -220,9 +226,9 @@ def test_validate_node_name_invalid_dir_raises_exit(test_input):
         "a" * 101,
     ]
 )
-def test_validate_node_name_invalid_file_returns_none(test_input):
+def test_tokenize_line_name_invalid_file_returns_none(test_input):
     with pytest.raises(SystemExit):
-        _validate_node_name(1, test_input)
+        _tokenize(test_input)
 
 
 def test_read_input_tree_all_dirs():
@@ -296,3 +302,54 @@ def test_read_input_tree_odd_spaces_raises_exit(test_input):
     assert next(generator) == TreeData(1, 0, True, 'src')
     with pytest.raises(SystemExit):
         next(generator)
+
+
+def test_read_input_tree_iterable_of_lines_yields_data():
+    test_input = ['src/\n', '  data.txt\n', '  # comment\n', '\n', '  more_data.txt Label\n']
+    generator = read_input_tree(iter(test_input))
+    assert next(generator) == TreeData(1, 0, True, 'src')
+    assert next(generator) == TreeData(2, 1, False, 'data.txt')
+    assert next(generator) == TreeData(5, 1, False, 'more_data.txt')
+    with pytest.raises(StopIteration):
+        next(generator)
+
+
+def _reference_process_line(line_number: int, line: str) -> TreeData:
+    # The multi-scan validation chain that the tokenizer replaces
+    args = line.strip()
+    name = args.split(chr(32))[0] if chr(32) in args else args
+    try:
+        if (dir_name := validate_dir_name(name)) is not None:
+            is_dir, name = True, dir_name
+        elif validate_name(name):
+            is_dir = False
+        else:
+            raise ValueError
+    except ValueError:
+        exit(line_reader._INVALID_NODE_NAME_ERROR_MSG + str(line_number))
+    space_count = len(line) - len(line.lstrip())
+    if space_count % 2 != 0:
+        exit(line_reader._INVALID_DEPTH_ERROR_MSG + str(line_number))
+    return TreeData(line_number, space_count // 2, is_dir, name)
+
+
+def _exit_message(method, *args) -> str | TreeData:
+    try:
+        return method(*args)
+    except SystemExit as e:
+        return str(e.code)
+
+
+@pytest.mark.parametrize(
+    'name',
+    [
+        'file', 'file.txt', '.a', 'dir/', '/dir', 'dir\\', '\\dir', '/dir/', '//dir//', '\\dir\\',
+        'a/b', 'a\\b', 'a/b/', '/a\\', 'a\\/', '/', '\\', '//', './', '../', '/./', '.../', '.',
+        'file\t', 'a\tb', 'a\tb/', 'x' * 99, 'x' * 100, 'x' * 98 + '/', 'x' * 99 + '/', 'naïve/', 'naïve.txt',
+    ]
+)
+@pytest.mark.parametrize('indent', ['', ' ', '  ', '   ', '    ', '\t', ' \t'])
+@pytest.mark.parametrize('suffix', ['', ' ', ' DataLabel', '\t', '\n', '\r\n', ' # comment'])
+def test_process_line_matches_reference_validation_chain(name, indent, suffix):
+    line = indent + name + suffix
+    assert _exit_message(_process_line, 7, line) == _exit_message(_reference_process_line, 7, line)
@@ -0,0 +1,146 @@
+""" Testing Materializer Methods.
+"""
+from io import BytesIO, StringIO
+from re import escape
+
+import pytest
+
+from treescript_files import materializer
+from treescript_files.input_data import InputData
+from treescript_files.line_reader import read_input_tree
+from treescript_files.materializer import MaterializeResult, materialize_tree, write_materialize_report
+from treescript_files.tree_filter import TreeFilter
+
+
+_TREE_INPUT = """src/
+  api/
+    routes.py
+  main.py
+  api/
+    models.py
+docs/
+README.md
+"""
+
+
+def _list_tree(root) -> list[str]:
+    return sorted(
+        path.relative_to(root).as_posix() + ('/' if path.is_dir() else '')
+        for path in root.rglob('*')
+    )
+
+
+def test_materialize_tree_creates_dirs_and_files(tmp_path):
+    result = materialize_tree(read_input_tree(_TREE_INPUT), str(tmp_path / 'out'))
+    assert result == MaterializeResult(dirs_created=3, dirs_existing=0, files_created=4, files_existing=0)
+    assert _list_tree(tmp_path / 'out') == [
+        'README.md', 'docs/', 'src/', 'src/api/', 'src/api/models.py', 'src/api/routes.py', 'src/main.py',
+    ]
+    assert (tmp_path / 'out' / 'src' / 'main.py').read_bytes() == b''
+
+
+def test_materialize_tree_repeated_dir_is_created_once(tmp_path, monkeypatch):
+    import os
+    calls = []
+    mkdir = os.mkdir
+    monkeypatch.setattr(os, 'mkdir', lambda path, *args: calls.append(path) or mkdir(path, *args))
+    materialize_tree(read_input_tree(_TREE_INPUT), str(tmp_path / 'out'))
+    # The root is created first, then each Directory once
+    assert calls == [str(tmp_path / 'out')] + [
+        str(tmp_path / 'out' / 'src') + os.sep,
+        str(tmp_path / 'out' / 'src' / 'api') + os.sep,
+        str(tmp_path / 'out' / 'docs') + os.sep,
+    ]
+
+
+def test_materialize_tree_second_run_counts_existing(tmp_path):
+    materialize_tree(read_input_tree(_TREE_INPUT), str(tmp_path))
+    (tmp_path / 'src' / 'main.py').write_text('content')
+    result = materialize_tree(read_input_tree(_TREE_INPUT), str(tmp_path))
+    assert result == MaterializeResult(dirs_created=0, dirs_existing=3, files_created=0, files_existing=4)
+    # Existing files are never truncated
+    assert (tmp_path / 'src' / 'main.py').read_text() == 'content'
+
+
+def test_materialize_tree_existing_file_is_touched(tmp_path):
+    import os
+    (tmp_path / 'README.md').touch()
+    os.utime(tmp_path / 'README.md', (0, 0))
+    materialize_tree(read_input_tree('README.md'), str(tmp_path))
+    assert (tmp_path / 'README.md').stat().st_mtime > 0
+
+
+def test_materialize_tree_skip_existing_leaves_file_unchanged(tmp_path):
+    import os
+    (tmp_path / 'README.md').touch()
+    os.utime(tmp_path / 'README.md', (0, 0))
+    result = materialize_tree(read_input_tree('README.md'), str(tmp_path), skip_existing=True)
+    assert result.files_existing == 1
+    assert (tmp_path / 'README.md').stat().st_mtime == 0
+
+
+def test_materialize_tree_dry_run_does_not_write(tmp_path):
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'main.py').touch()
+    result = materialize_tree(read_input_tree(_TREE_INPUT), str(tmp_path / 'missing'), dry_run=True)
+    assert result == MaterializeResult(dirs_created=3, dirs_existing=0, files_created=4, files_existing=0)
+    assert not (tmp_path / 'missing').exists()
+    result = materialize_tree(read_input_tree(_TREE_INPUT), str(tmp_path), dry_run=True)
+    assert result == MaterializeResult(dirs_created=2, dirs_existing=1, files_created=3, files_existing=1)
+    assert _list_tree(tmp_path) == ['src/', 'src/main.py']
+
+
+@pytest.mark.parametrize("max_workers", [None, 3])
+def test_materialize_tree_many_files_in_batches(tmp_path, monkeypatch, max_workers):
+    monkeypatch.setattr(materializer, '_FILE_BATCH_SIZE', 7)
+    tree_input = 'data/\n' + ''.join(f'  file_{i}.txt\n' for i in range(100))
+    result = materialize_tree(read_input_tree(tree_input), str(tmp_path), max_workers=max_workers)
+    assert result.files_created == 100
+    assert len(list((tmp_path / 'data').iterdir())) == 100
+
+
+def test_materialize_tree_dir_is_a_file_raises_exit(tmp_path):
+    (tmp_path / 'src').touch()
+    with pytest.raises(SystemExit, match=escape(materializer._CREATE_FAILED_MSG)):
+        materialize_tree(read_input_tree(_TREE_INPUT), str(tmp_path))
+
+
+def test_materialize_tree_file_is_a_dir_raises_exit(tmp_path):
+    (tmp_path / 'README.md').mkdir()
+    with pytest.raises(SystemExit, match=escape(materializer._CREATE_FAILED_MSG)):
+        materialize_tree(read_input_tree('README.md'), str(tmp_path), skip_existing=True)
+
+
+def test_materialize_tree_jump_raises_exit(tmp_path):
+    tree_data = list(read_input_tree('src/\n  main.py'))
+    with pytest.raises(SystemExit, match='You have jumped 1 steps in the tree on line: 2'):
+        materialize_tree([tree_data[0]._replace(depth=0), tree_data[1]._replace(depth=2)], str(tmp_path))
+
+
+def test_write_materialize_report_applies_parent_and_filter(tmp_path):
+    input_data = InputData(
+        tree_input=_TREE_INPUT,
+        parent_path='module\\',
+        materialize_root=str(tmp_path),
+        tree_filter=TreeFilter(exclude=('api/',)),
+    )
+    output = BytesIO()
+    assert write_materialize_report(input_data, output) == 2
+    assert _list_tree(tmp_path) == ['module/', 'module/README.md', 'module/docs/', 'module/src/', 'module/src/main.py']
+    assert output.getvalue().decode().startswith('Created 2 directories and 2 files in ')
+
+
+@pytest.mark.parametrize('parent_path', ['/module', '\\module\\'])
+def test_write_materialize_report_absolute_parent_raises_exit(tmp_path, parent_path):
+    input_data = InputData(tree_input=_TREE_INPUT, parent_path=parent_path, materialize_root=str(tmp_path / 'out'))
+    with pytest.raises(SystemExit, match='The Parent Path must be relative to the root'):
+        write_materialize_report(input_data, BytesIO())
+    assert not (tmp_path / 'out').exists()
+
+
+def test_write_materialize_report_dry_run_text_stream(tmp_path):
+    input_data = InputData(tree_input=_TREE_INPUT, materialize_root=str(tmp_path), dry_run=True)
+    output = StringIO()
+    assert write_materialize_report(input_data, output) == 4
+    assert output.getvalue() == f'Would create 3 directories and 4 files in {tmp_path} ' \
+        '(0 directories and 0 files already existed).\n'
@@ -0,0 +1,69 @@
+""" Testing Output Writer Methods.
+"""
+from io import BytesIO, StringIO
+
+import pytest
+
+from treescript_files.output_writer import write_paths
+
+
+@pytest.mark.parametrize(
+    "paths,separator",
+    [
+        ([], '\n'),
+        (['a'], '\n'),
+        (['a', 'b', 'c'], '\n'),
+        (['a', 'b', 'c'], ' '),
+        (['a', 'b', 'c'], ','),
+        (['a', 'b', 'c'], '\t'),
+    ]
+)
+def test_write_paths_text_stream_matches_join(paths, separator):
+    output = StringIO()
+    assert write_paths(paths, output, separator) == len(paths)
+    assert output.getvalue() == separator.join(paths) + '\n'
+
+
+@pytest.mark.parametrize(
+    "chunk_size", [1, 2, 3, 4, 100]
+)
+def test_write_paths_binary_stream_chunked_matches_join(chunk_size):
+    paths = [f'src/file{i}.py' for i in range(7)]
+    output = BytesIO()
+    assert write_paths(paths, output, ' ', chunk_size=chunk_size) == 7
+    assert output.getvalue() == (' '.join(paths) + '\n').encode()
+
+
+def test_write_paths_binary_stream_encodes_utf8():
+    output = BytesIO()
+    write_paths(['dir/naïve.txt'], output)
+    assert output.getvalue() == 'dir/naïve.txt\n'.encode('utf-8')
+
+
+def test_write_paths_generator_is_consumed_lazily():
+    output = BytesIO()
+    written = []
+    def paths():
+        for i in range(4):
+            # The previous chunk must have been written before the next path is produced
+            written.append(output.getvalue())
+            yield str(i)
+    write_paths(paths(), output, chunk_size=2)
+    assert written[2] == b'0\n1'
+    assert output.getvalue() == b'0\n1\n2\n3\n'
+
+
+@pytest.mark.parametrize(
+    "chunk_size", [1, 2, 3, 7, 100]
+)
+def test_write_paths_null_separator_terminates_each_path(chunk_size):
+    paths = [f'src/my file{i}.py' for i in range(7)]
+    output = BytesIO()
+    assert write_paths(paths, output, '\0', chunk_size=chunk_size) == 7
+    assert output.getvalue() == b''.join(path.encode() + b'\0' for path in paths)
+
+
+def test_write_paths_null_separator_no_paths_writes_nothing():
+    output = BytesIO()
+    assert write_paths([], output, '\0') == 0
+    assert output.getvalue() == b''
@@ -0,0 +1,223 @@
+""" Testing Parse Cache Methods.
+"""
+import os
+from io import BytesIO, StringIO
+
+import pytest
+
+from test.conftest import raise_exception
+from treescript_files import parse_cache, tree_reader
+from treescript_files.input_data import InputData
+from treescript_files.parse_cache import get_cache_dir, write_cached_files
+
+
+def _input_data(tree_file, cache_dir, separator='\n', cache_size_limit=1024**2) -> InputData:
+    with open(tree_file) as f:
+        tree_input = f.read()
+    return InputData(
+        tree_input=tree_input,
+        separator=separator,
+        tree_file=str(tree_file),
+        cache_dir=str(cache_dir),
+        cache_size_limit=cache_size_limit,
+    )
+
+
+def _input_lines_data(tree_file, cache_dir) -> InputData:
+    from treescript_files.file_validation import read_input_lines
+    return InputData(
+        tree_input=read_input_lines(str(tree_file)),
+        tree_file=str(tree_file),
+        cache_dir=str(cache_dir),
+    )
+
+
+def _entries(cache_dir) -> list[str]:
+    entry_dir = cache_dir / f'v{parse_cache._CACHE_FORMAT_VERSION}'
+    return sorted(os.listdir(entry_dir)) if entry_dir.exists() else []
+
+
+@pytest.fixture
+def tree_file(tmp_path):
+    (tree_file := tmp_path / 'input.tree').write_text('src/\n  a.py\n  b.py\n')
+    return tree_file
+
+
+def test_write_cached_files_miss_stores_entry(tmp_path, tree_file):
+    output = BytesIO()
+    assert write_cached_files(_input_data(tree_file, tmp_path / 'cache'), output) == 2
+    assert output.getvalue() == os.path.join('src', 'a.py\n').encode() + os.path.join('src', 'b.py\n').encode()
+    assert len(_entries(tmp_path / 'cache')) == 1
+
+
+def test_write_cached_files_hit_skips_parsing(monkeypatch, tmp_path, tree_file):
+    first_output = BytesIO()
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), first_output)
+    monkeypatch.setattr(tree_reader, 'read_input_tree', lambda *_: raise_exception('valueerror'))
+    output = BytesIO()
+    assert write_cached_files(_input_data(tree_file, tmp_path / 'cache'), output) == 2
+    assert output.getvalue() == first_output.getvalue()
+
+
+def test_write_cached_files_hit_text_stream_returns_same_output(tmp_path, tree_file):
+    first_output = StringIO()
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), first_output)
+    output = StringIO()
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), output)
+    assert output.getvalue() == first_output.getvalue()
+    assert len(_entries(tmp_path / 'cache')) == 1
+
+
+def test_write_cached_files_content_and_separator_change_key(tmp_path, tree_file):
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO())
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache', separator=' '), BytesIO())
+    tree_file.write_text('src/\n  c.py\n')
+    output = BytesIO()
+    assert write_cached_files(_input_data(tree_file, tmp_path / 'cache'), output) == 1
+    assert output.getvalue() == os.path.join('src', 'c.py\n').encode()
+    assert len(_entries(tmp_path / 'cache')) == 3
+
+
+def test_write_cached_files_filter_changes_key(tmp_path, tree_file):
+    from dataclasses import replace
+    from treescript_files.tree_filter import TreeFilter
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO())
+    output = BytesIO()
+    input_data = replace(_input_data(tree_file, tmp_path / 'cache'), tree_filter=TreeFilter(exclude=('b.py',)))
+    assert write_cached_files(input_data, output) == 1
+    assert output.getvalue() == os.path.join('src', 'a.py\n').encode()
+    assert len(_entries(tmp_path / 'cache')) == 2
+
+
+def test_write_cached_files_version_change_invalidates_entries(monkeypatch, tmp_path, tree_file):
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO())
+    monkeypatch.setattr(parse_cache, '_CACHE_FORMAT_VERSION', parse_cache._CACHE_FORMAT_VERSION + 1)
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO())
+    assert len(os.listdir(tmp_path / 'cache')) == 2
+
+
+def test_write_cached_files_evicts_least_recently_used(tmp_path, tree_file):
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO())
+    (oldest,) = _entries(tmp_path / 'cache')
+    entry_size = os.path.getsize(tmp_path / 'cache' / f'v{parse_cache._CACHE_FORMAT_VERSION}' / oldest)
+    os.utime(tmp_path / 'cache' / f'v{parse_cache._CACHE_FORMAT_VERSION}' / oldest, (0, 0))
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache', ' ', cache_size_limit=entry_size), BytesIO())
+    entries = _entries(tmp_path / 'cache')
+    assert len(entries) == 1
+    assert oldest not in entries
+
+
+def test_write_cached_files_parse_error_leaves_no_entry(tmp_path):
+    (tree_file := tmp_path / 'input.tree').write_text('src/\n   a.py\n')
+    with pytest.raises(SystemExit):
+        write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO())
+    assert _entries(tmp_path / 'cache') == []
+
+
+def test_write_cached_files_unusable_cache_dir_writes_output(tmp_path, tree_file):
+    (cache_file := tmp_path / 'cache').write_text('not a directory')
+    output = BytesIO()
+    assert write_cached_files(_input_data(tree_file, cache_file), output) == 2
+
+
+def test_get_cache_dir_environment_variable(monkeypatch):
+    monkeypatch.setenv(parse_cache._CACHE_DIR_ENV_VAR, 'env_cache')
+    assert get_cache_dir('arg_cache') == 'arg_cache'
+    assert get_cache_dir(None) == 'env_cache'
+    monkeypatch.setenv(parse_cache._CACHE_DIR_ENV_VAR, ' ')
+    assert get_cache_dir(None) is None
+
+
+def test_write_cached_files_blank_input_leaves_no_entry(tmp_path):
+    (tree_file := tmp_path / 'input.tree').write_text('\n\n')
+    with pytest.raises(SystemExit):
+        write_cached_files(_input_lines_data(tree_file, tmp_path / 'cache'), BytesIO())
+    assert _entries(tmp_path / 'cache') == []
+
+
+@pytest.mark.parametrize('header', [b'treescript-files-cache 1 abc\n', b'treescript-files-cache 1 '])
+def test_write_cached_files_corrupt_header_is_miss(tmp_path, tree_file, header):
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO())
+    (entry,) = _entries(tmp_path / 'cache')
+    (tmp_path / 'cache' / f'v{parse_cache._CACHE_FORMAT_VERSION}' / entry).write_bytes(header)
+    output = BytesIO()
+    assert write_cached_files(_input_data(tree_file, tmp_path / 'cache'), output) == 2
+    assert output.getvalue() == os.path.join('src', 'a.py\n').encode() + os.path.join('src', 'b.py\n').encode()
+    assert _entries(tmp_path / 'cache') == [entry]
+
+
+def test_write_cached_files_file_changed_while_parsing_stores_no_entry(monkeypatch, tmp_path, tree_file):
+    read_hashed_lines = parse_cache._read_hashed_lines
+
+    def change_then_read(file_name, *args):
+        # The File changes after its key was hashed, and before it is parsed
+        tree_file.write_text('lib/\n  x.py\n')
+        return read_hashed_lines(file_name, *args)
+    monkeypatch.setattr(parse_cache, '_read_hashed_lines', change_then_read)
+    output = BytesIO()
+    assert write_cached_files(_input_data(tree_file, tmp_path / 'cache'), output) == 1
+    assert output.getvalue() == os.path.join('lib', 'x.py\n').encode()
+    assert _entries(tmp_path / 'cache') == []
+    monkeypatch.setattr(parse_cache, '_read_hashed_lines', read_hashed_lines)
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO())
+    assert len(_entries(tmp_path / 'cache')) == 1
+
+
+def test_write_cached_files_miss_leaves_no_temp_files(monkeypatch, tmp_path):
+    (tree_file := tmp_path / 'input.tree').write_bytes(b'src/\r\n' + b''.join(b'  file_%d.py\r\n' % i for i in range(100)))
+    monkeypatch.setattr(parse_cache, '_READ_CHUNK_SIZE', 64)
+    output = BytesIO()
+    assert write_cached_files(_input_data(tree_file, tmp_path / 'cache'), output) == 100
+    assert output.getvalue().splitlines()[-1] == os.path.join('src', 'file_99.py').encode()
+    assert len(entries := _entries(tmp_path / 'cache')) == 1
+    assert not entries[0].startswith('.tmp-')
+    cached_output = BytesIO()
+    assert write_cached_files(_input_data(tree_file, tmp_path / 'cache'), cached_output) == 100
+    assert cached_output.getvalue() == output.getvalue()
+
+
+def test_write_cached_files_hit_does_not_read_lines(monkeypatch, tmp_path, tree_file):
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO())
+    monkeypatch.setattr(parse_cache, '_read_hashed_lines', lambda *_: raise_exception('valueerror'))
+    assert write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO()) == 2
+
+
+def test_write_cached_files_compressed_file(tmp_path):
+    import gzip
+    with gzip.open(tree_file := tmp_path / 'input.tree.gz', 'wb') as file:
+        file.write(b'src/\n  a.py\n')
+    for _ in range(2):
+        output = BytesIO()
+        assert write_cached_files(_input_lines_data(tree_file, tmp_path / 'cache'), output) == 1
+        assert output.getvalue() == os.path.join('src', 'a.py\n').encode()
+    assert len(_entries(tmp_path / 'cache')) == 1
+
+
+def test_write_cached_files_bytes_engine(tmp_path, tree_file):
+    from dataclasses import replace
+    input_data = replace(_input_data(tree_file, tmp_path / 'cache'), engine='bytes')
+    output = BytesIO()
+    assert write_cached_files(input_data, output) == 2
+    assert len(_entries(tmp_path / 'cache')) == 1
+    cached_output = BytesIO()
+    assert write_cached_files(_input_data(tree_file, tmp_path / 'cache'), cached_output) == 2
+    assert cached_output.getvalue() == output.getvalue()
+
+
+def test_write_cached_files_hash_error_writes_output(monkeypatch, tmp_path, tree_file):
+    monkeypatch.setattr(parse_cache, '_hash_file', lambda *_: raise_exception('oserror'))
+    output = BytesIO()
+    assert write_cached_files(_input_data(tree_file, tmp_path / 'cache'), output) == 2
+    assert _entries(tmp_path / 'cache') == []
+
+
+def test_write_cached_files_removes_stale_temp_files(tmp_path, tree_file):
+    entry_dir = tmp_path / 'cache' / f'v{parse_cache._CACHE_FORMAT_VERSION}'
+    entry_dir.mkdir(parents=True)
+    (entry_dir / '.tmp-stale').write_bytes(b'x' * 100)
+    os.utime(entry_dir / '.tmp-stale', (0, 0))
+    (entry_dir / '.tmp-running').write_bytes(b'x' * 100)
+    write_cached_files(_input_data(tree_file, tmp_path / 'cache'), BytesIO())
+    entries = _entries(tmp_path / 'cache')
+    assert '.tmp-stale' not in entries
+    assert '.tmp-running' in entries
@@ -36,3 +36,28 @@ def test_reduce_depth_single_item_less_depth_returns_true(stack):
     stack.push('src')
     assert stack.reduce_depth(0)
     assert stack.get_depth() == 0
+
+
+def test_join_stack_nested_items_returns_stack(stack):
+    stack.push('src')
+    stack.push('main')
+    assert stack.join_stack() in ['src/main/', 'src\\main\\']
+
+
+def test_join_stack_after_reduce_depth_returns_parent(stack):
+    stack.push('src')
+    stack.push('main')
+    stack.push('java')
+    assert stack.reduce_depth(1)
+    assert stack.join_stack() in ['src/', 'src\\']
+    stack.push('test')
+    assert stack.join_stack() in ['src/test/', 'src\\test\\']
+
+
+def test_join_stack_with_root_returns_root_prefix():
+    stack = PathStack('module/', '/')
+    assert stack.join_stack() == 'module/'
+    stack.push('src')
+    assert stack.join_stack() == 'module/src/'
+    assert stack.reduce_depth(0)
+    assert stack.join_stack() == 'module/'
@@ -0,0 +1,96 @@
+""" Testing Record Writer Methods.
+"""
+import json
+import os
+from io import BytesIO, StringIO
+
+import pytest
+
+from treescript_files.input_data import InputData
+from treescript_files.line_reader import read_input_tree
+from treescript_files.record_writer import generate_tree_records, write_tree_records
+from treescript_files.tree_data import TreeData
+from treescript_files.tree_filter import TreeFilter
+
+
+_TREE_INPUT = """src/
+  api/
+    routes.py
+  main.py
+README.md
+"""
+
+
+def test_generate_tree_records_fields():
+    records = [json.loads(record) for record in generate_tree_records(read_input_tree(_TREE_INPUT), 'module/', '/')]
+    assert records == [
+        {'path': 'module/src', 'name': 'src', 'parent': 'module', 'is_dir': True, 'depth': 0, 'line_number': 1},
+        {'path': 'module/src/api', 'name': 'api', 'parent': 'module/src', 'is_dir': True, 'depth': 1, 'line_number': 2},
+        {'path': 'module/src/api/routes.py', 'name': 'routes.py', 'parent': 'module/src/api', 'is_dir': False, 'depth': 2, 'line_number': 3},
+        {'path': 'module/src/main.py', 'name': 'main.py', 'parent': 'module/src', 'is_dir': False, 'depth': 1, 'line_number': 4},
+        {'path': 'module/README.md', 'name': 'README.md', 'parent': 'module', 'is_dir': False, 'depth': 0, 'line_number': 5},
+    ]
+
+
+def test_generate_tree_records_no_root():
+    records = [json.loads(record) for record in generate_tree_records(read_input_tree('src/\n  main.py'), '', '/')]
+    assert [(record['path'], record['parent']) for record in records] == [('src', ''), ('src/main.py', 'src')]
+
+
+@pytest.mark.parametrize(
+    'name',
+    ['"quoted".py', 'back\\slash', 'café.py', '日本語.md', 'tab\tname', 'line sep'],
+)
+def test_generate_tree_records_escapes_names(name):
+    tree_data = [TreeData(1, 0, True, 'dir"1'), TreeData(2, 1, False, name)]
+    record = json.loads(list(generate_tree_records(tree_data, 'a\\b/', '/'))[-1])
+    assert record['name'] == name
+    assert record['path'] == 'a\\b/dir"1/' + name
+    assert record['parent'] == 'a\\b/dir"1'
+
+
+def test_generate_tree_records_matches_paths():
+    from treescript_files.tree_reader import generate_treescript_files
+    tree_input = ''.join(f'd{d}/\n' + ''.join(f'  s{s}/\n    f{f}.py\n' for s in range(3) for f in range(2)) for d in range(4))
+    records = [json.loads(record) for record in generate_tree_records(read_input_tree(tree_input), 'p' + os.sep)]
+    assert [record['path'] for record in records if not record['is_dir']] == list(generate_treescript_files(tree_input, 'p'))
+
+
+def test_generate_tree_records_depth_jump_raises_exit():
+    with pytest.raises(SystemExit, match='line: 2'):
+        list(generate_tree_records(read_input_tree('src/\n    main.py\n')))
+
+
+def test_write_tree_records_jsonl():
+    output = BytesIO()
+    assert write_tree_records(InputData(tree_input=_TREE_INPUT, output_format='jsonl'), output) == 5
+    lines = output.getvalue().decode().splitlines()
+    assert len(lines) == 5
+    assert json.loads(lines[2])['name'] == 'routes.py'
+
+
+def test_write_tree_records_json_array():
+    output = StringIO()
+    assert write_tree_records(InputData(tree_input=_TREE_INPUT, output_format='json'), output) == 5
+    records = json.loads(output.getvalue())
+    assert [record['name'] for record in records] == ['src', 'api', 'routes.py', 'main.py', 'README.md']
+
+
+def test_write_tree_records_json_single_record():
+    output = StringIO()
+    assert write_tree_records(InputData(tree_input='README.md', output_format='json'), output) == 1
+    assert json.loads(output.getvalue())[0]['path'] == 'README.md'
+
+
+def test_write_tree_records_filter():
+    output = StringIO()
+    input_data = InputData(tree_input=_TREE_INPUT, output_format='json', tree_filter=TreeFilter(exclude=('api/',)))
+    assert write_tree_records(input_data, output) == 3
+    assert [record['name'] for record in json.loads(output.getvalue())] == ['src', 'main.py', 'README.md']
+
+
+def test_write_tree_records_json_empty_array():
+    output = StringIO()
+    input_data = InputData(tree_input=_TREE_INPUT, output_format='json', tree_filter=TreeFilter(exclude=('src/', 'README.md')))
+    assert write_tree_records(input_data, output) == 0
+    assert json.loads(output.getvalue()) == []
@@ -0,0 +1,48 @@
+""" Testing Run Statistics Methods.
+"""
+from io import BytesIO, StringIO
+
+import pytest
+
+from treescript_files.input_data import InputData
+from treescript_files.run_stats import RunStats, write_ts_files_with_stats
+
+
+_TREE_INPUT = 'src/\n  # comment\n\n  main/\n    a.py\n  b.py DataLabel\nc.py\n'
+
+
+@pytest.mark.parametrize("output", [BytesIO(), StringIO()])
+def test_write_ts_files_with_stats_counts_tree(output):
+    stats = write_ts_files_with_stats(InputData(tree_input=_TREE_INPUT), output)
+    assert stats.lines == 7
+    assert stats.comments == 1
+    assert stats.blank_lines == 1
+    assert stats.dirs == 2
+    assert stats.files == 3
+    assert stats.paths == 3
+    assert stats.max_depth == 2
+    assert stats.bytes_read == len(''.join(_TREE_INPUT.splitlines()))
+    assert stats.bytes_written == len(output.getvalue())
+
+
+def test_write_ts_files_with_stats_output_matches_paths():
+    output = StringIO()
+    write_ts_files_with_stats(InputData(tree_input='src/\n  a.py\n  b.py', parent_path='root', separator=' '), output)
+    assert output.getvalue() in [
+        'root/src/a.py root/src/b.py\n',
+        'root\\src\\a.py root\\src\\b.py\n',
+    ]
+
+
+def test_write_ts_files_with_stats_stage_times_sum_to_total():
+    stats = write_ts_files_with_stats(InputData(tree_input=_TREE_INPUT * 100), BytesIO())
+    assert all(seconds >= 0 for seconds in stats.stage_seconds.values())
+    assert sum(stats.stage_seconds.values()) == pytest.approx(stats.total_seconds)
+
+
+def test_run_stats_format_report_lists_stages_and_counters():
+    report = RunStats(lines=1234, peak_memory=None).format_report()
+    for label in ('read:', 'parse:', 'build:', 'write:', 'total:', 'comments:', 'max depth:', 'bytes written:'):
+        assert label in report
+    assert '1,234' in report
+    assert 'n/a' in report
@@ -0,0 +1,28 @@
+""" Testing Tree Data.
+"""
+import pytest
+
+from treescript_files.tree_data import TreeData
+
+
+def test_tree_data_fields_returns_values():
+    node = TreeData(3, 1, True, 'src')
+    assert node.line_number == 3
+    assert node.depth == 1
+    assert node.is_dir
+    assert node.name == 'src'
+
+
+def test_tree_data_equality_compares_fields():
+    assert TreeData(1, 0, False, 'a') == TreeData(line_number=1, depth=0, is_dir=False, name='a')
+    assert TreeData(1, 0, False, 'a') != TreeData(2, 0, False, 'a')
+
+
+def test_tree_data_is_immutable_raises_attribute_error():
+    node = TreeData(1, 0, False, 'a')
+    with pytest.raises(AttributeError):
+        node.name = 'b'
+
+
+def test_tree_data_has_no_instance_dict():
+    assert not hasattr(TreeData(1, 0, False, 'a'), '__dict__')
@@ -0,0 +1,143 @@
+""" Testing Tree Diff Methods.
+"""
+import os
+from io import BytesIO, StringIO
+
+import pytest
+
+from treescript_files import generate_treescript_files
+from treescript_files.input_data import InputData
+from treescript_files.line_reader import read_input_tree
+from treescript_files.tree_diff import build_diff_tree, diff_trees, write_tree_diff
+from treescript_files.tree_filter import TreeFilter
+
+
+_OLD_TREE = """src/
+  api/
+    routes.py
+    models.py
+  main.py
+docs/
+  index.md
+README.md
+"""
+
+_NEW_TREE = """README.md
+docs/
+  index.md
+src/
+  main.py
+  app.py
+  api/
+    routes.py
+tests/
+  test_main.py
+"""
+
+
+def _diff(old_input: str, new_input: str, parent_path: str | None = None) -> list[tuple[bool, str]]:
+    old_root = build_diff_tree(read_input_tree(old_input))
+    new_root = build_diff_tree(read_input_tree(new_input))
+    return [(is_added, path.replace(os.sep, '/')) for is_added, path in diff_trees(old_root, new_root, parent_path)]
+
+
+def test_build_diff_tree_sorts_and_merges():
+    root = build_diff_tree(read_input_tree('src/\n  b.py\n  a.py\nsrc/\n  a.py\n  c.py'))
+    assert root.files == ()
+    assert root.dirs['src'].files == ('a.py', 'b.py', 'c.py')
+
+
+def test_build_diff_tree_same_files_same_digest():
+    assert build_diff_tree(read_input_tree(_OLD_TREE)).digest == build_diff_tree(read_input_tree("""README.md
+docs/
+  index.md
+src/
+  main.py
+  api/
+    models.py
+    routes.py
+""")).digest
+
+
+@pytest.mark.parametrize(
+    'old_input,new_input',
+    [
+        ('a/\n  b.py', 'a/\n  c.py'),
+        ('a/\n  b.py', 'b/\n  b.py'),
+        ('a/\n  b.py', 'a/\n  b/\n    b.py'),
+        ('a/\n  b.py', 'a/\n  b.py\n  c/\n    d.py'),
+        ('a.py', 'a/\n  a.py'),
+    ]
+)
+def test_build_diff_tree_different_trees_different_digest(old_input, new_input):
+    assert build_diff_tree(read_input_tree(old_input)).digest != build_diff_tree(read_input_tree(new_input)).digest
+
+
+def test_build_diff_tree_empty_dirs_do_not_change_digest():
+    assert build_diff_tree(read_input_tree('a/\n  b.py')).digest == \
+        build_diff_tree(read_input_tree('a/\n  b.py\n  c/\n    d/\ne/')).digest
+
+
+def test_build_diff_tree_jump_raises_exit():
+    tree_data = list(read_input_tree('src/\n  main.py'))
+    with pytest.raises(SystemExit, match='You have jumped 1 steps in the tree on line: 2'):
+        build_diff_tree([tree_data[0]._replace(depth=0), tree_data[1]._replace(depth=2)])
+
+
+def test_diff_trees_added_and_removed():
+    assert _diff(_OLD_TREE, _NEW_TREE) == [
+        (True, 'src/app.py'),
+        (False, 'src/api/models.py'),
+        (True, 'tests/test_main.py'),
+    ]
+
+
+def test_diff_trees_identical_is_empty():
+    assert _diff(_OLD_TREE, _OLD_TREE) == []
+
+
+def test_diff_trees_skips_identical_subtrees(monkeypatch):
+    from treescript_files import tree_diff
+    merged = []
+    merge_files = tree_diff._merge_files
+    monkeypatch.setattr(tree_diff, '_merge_files', lambda old, new, prefix: merged.append(prefix) or merge_files(old, new, prefix))
+    _diff(_OLD_TREE, _NEW_TREE)
+    assert [prefix.replace(os.sep, '/') for prefix in merged] == ['', 'src/', 'src/api/']
+
+
+def test_diff_trees_parent_path():
+    assert _diff('a.py', 'b.py', 'module\\') == [(False, 'module/a.py'), (True, 'module/b.py')]
+
+
+@pytest.mark.parametrize(
+    'old_lines,new_lines',
+    [
+        (2000, 1900),
+        (1900, 2000),
+    ]
+)
+@pytest.mark.parametrize("shape", ['wide', 'deep', 'mixed_slashes'])
+def test_diff_trees_matches_set_difference(shape, old_lines, new_lines):
+    from benchmarks.treescript_generator import generate_treescript
+    old_input = generate_treescript(shape, old_lines, seed=1)
+    new_input = generate_treescript(shape, new_lines, seed=1)
+    old_files = set(generate_treescript_files(old_input, None))
+    new_files = set(generate_treescript_files(new_input, None))
+    old_root = build_diff_tree(read_input_tree(old_input))
+    new_root = build_diff_tree(read_input_tree(new_input))
+    changes = list(diff_trees(old_root, new_root))
+    assert sorted(path for is_added, path in changes if is_added) == sorted(new_files - old_files)
+    assert sorted(path for is_added, path in changes if not is_added) == sorted(old_files - new_files)
+
+
+def test_write_tree_diff_binary_stream():
+    output = BytesIO()
+    assert write_tree_diff(InputData(tree_input=_OLD_TREE, diff_input=_NEW_TREE), output) == 3
+    assert output.getvalue().decode().replace(os.sep, '/') == '+ src/app.py\n- src/api/models.py\n+ tests/test_main.py\n'
+
+
+def test_write_tree_diff_filter_and_separator():
+    input_data = InputData(tree_input=_OLD_TREE, diff_input=_NEW_TREE, separator=' ', tree_filter=TreeFilter(exclude=('tests/',)))
+    output = StringIO()
+    assert write_tree_diff(input_data, output) == 2
+    assert output.getvalue().replace(os.sep, '/') == '+ src/app.py - src/api/models.py\n'
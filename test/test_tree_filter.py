@@ -0,0 +1,93 @@
+""" Testing Tree Filter Methods.
+"""
+import pickle
+
+import pytest
+
+from treescript_files.line_reader import read_input_tree
+from treescript_files.path_stack import PathStack
+from treescript_files.tree_filter import TreeFilter, filter_tree_data
+
+
+_TREE_INPUT = """src/
+  api/
+    routes.py
+    v2/
+      routes.py
+  main.py
+  test/
+    test_main.py
+node_modules/
+  lib/
+    index.js
+setup.py
+"""
+
+
+def _relative_stack(*names: str) -> PathStack:
+    path_stack = PathStack(path_separator='/')
+    for name in names:
+        path_stack.push(name)
+    return path_stack
+
+
+@pytest.mark.parametrize(
+    "include,exclude,name,parents,expected",
+    [
+        ((), (), 'main.py', (), True),
+        (('*.py',), (), 'main.py', (), True),
+        (('*.py',), (), 'index.js', (), False),
+        (('main.py',), (), 'main.py', ('src',), True),
+        (('m?in.*',), (), 'main.py', ('src',), True),
+        (('src/api/*',), (), 'routes.py', ('src', 'api'), True),
+        (('src/api/*',), (), 'main.py', ('src',), False),
+        ((), ('*.js',), 'index.js', ('node_modules',), False),
+        ((), ('test/',), 'test', (), True),
+        (('*.py',), ('main.py',), 'main.py', (), False),
+        ((), ('\\src\\main.py',), 'main.py', ('src',), False),
+    ]
+)
+def test_includes_file(include, exclude, name, parents, expected):
+    assert TreeFilter(include, exclude).includes_file(name, _relative_stack(*parents)) == expected
+
+
+@pytest.mark.parametrize(
+    "exclude,name,parents,expected",
+    [
+        ((), 'src', (), False),
+        (('node_modules',), 'node_modules', (), True),
+        (('node_modules/',), 'node_modules', (), True),
+        (('t*/',), 'test', ('src',), True),
+        (('src/api',), 'api', ('src',), True),
+        (('src/api',), 'api', ('lib',), False),
+        (('*.py',), 'src', (), False),
+    ]
+)
+def test_excludes_dir(exclude, name, parents, expected):
+    assert TreeFilter(exclude=exclude).excludes_dir(name, _relative_stack(*parents)) == expected
+
+
+@pytest.mark.parametrize(
+    "include,exclude,expected",
+    [
+        ((), (), False),
+        (('*.py', 'main.py', '[a-z]*'), ('test/',), False),
+        (('src/*.py',), (), True),
+        ((), ('src/api/',), True),
+    ]
+)
+def test_needs_paths(include, exclude, expected):
+    assert TreeFilter(include, exclude).needs_paths() == expected
+
+
+def test_filter_tree_data_removes_excluded_subtrees():
+    nodes = filter_tree_data(read_input_tree(_TREE_INPUT), TreeFilter(exclude=('node_modules', 'src/api/v2/')))
+    assert [node.name for node in nodes] == ['src', 'api', 'routes.py', 'main.py', 'test', 'test_main.py', 'setup.py']
+
+
+def test_tree_filter_can_be_pickled():
+    tree_filter = pickle.loads(pickle.dumps(TreeFilter(('*.py', 'src/*'), ('test/', '[ab]*'))))
+    assert tree_filter.include == ('*.py', 'src/*')
+    assert tree_filter.includes_file('main.py', _relative_stack())
+    assert not tree_filter.excludes_dir('src', _relative_stack())
+    assert tree_filter.excludes_dir('test', _relative_stack())
@@ -0,0 +1,134 @@
+""" Testing Tree Index Methods.
+"""
+import os
+import pickle
+
+import pytest
+
+from treescript_files import tree_index
+from treescript_files.tree_index import TreeIndex
+from treescript_files.tree_reader import generate_treescript_files
+
+
+_TREE_INPUT = """src/
+  api/
+    routes.py
+    views.py
+    v2/
+      routes.py
+  main.py
+  util/
+    helpers.py
+    README.md
+docs/
+  index.md
+setup.py
+"""
+
+
+@pytest.fixture
+def index() -> TreeIndex:
+    return TreeIndex.from_treescript(_TREE_INPUT)
+
+
+def test_iter_files_matches_generated_files(index):
+    assert list(index.iter_files(path_separator=os.sep)) == list(generate_treescript_files(_TREE_INPUT, None))
+
+
+@pytest.mark.parametrize(
+    "dir_path,expected",
+    [
+        ('src/api', ['src/api/routes.py', 'src/api/views.py', 'src/api/v2/routes.py']),
+        ('src\\api\\', ['src/api/routes.py', 'src/api/views.py', 'src/api/v2/routes.py']),
+        ('docs/', ['docs/index.md']),
+        ('missing/', []),
+        ('src/main.py', []),
+    ]
+)
+def test_iter_files_subtree(index, dir_path, expected):
+    assert list(index.iter_files(dir_path, path_separator='/')) == expected
+
+
+def test_iter_files_max_depth(index):
+    assert list(index.iter_files(max_depth=1, path_separator='/')) == ['src/main.py', 'docs/index.md', 'setup.py']
+    assert list(index.iter_files('src/api/v2', max_depth=1)) == []
+
+
+@pytest.mark.parametrize(
+    "pattern,max_depth,expected",
+    [
+        ('*.py', None, ['setup.py']),
+        ('src/*.py', None, ['src/main.py']),
+        ('src/*/*.py', None, ['src/api/routes.py', 'src/api/views.py', 'src/util/helpers.py']),
+        ('**/routes.py', None, ['src/api/routes.py', 'src/api/v2/routes.py']),
+        ('src/**/*.md', None, ['src/util/README.md']),
+        ('**/*.py', 1, ['src/main.py', 'setup.py']),
+        ('src/**', 1, ['src/main.py']),
+        ('**/v[0-9]/*', None, ['src/api/v2/routes.py']),
+        ('docs', None, []),
+        ('', None, []),
+    ]
+)
+def test_glob_returns_matching_files(index, pattern, max_depth, expected):
+    assert list(index.glob(pattern, max_depth, path_separator='/')) == expected
+
+
+def test_glob_prunes_subtrees(index, monkeypatch):
+    visited = []
+    original = tree_index._compile_component
+
+    def _recording_component(component):
+        match = original(component)
+        return lambda name: visited.append(name) or match(name)
+    monkeypatch.setattr(tree_index, '_compile_component', _recording_component)
+    list(index.glob('docs/*.md'))
+    assert 'api' not in visited and 'routes.py' not in visited
+
+
+@pytest.mark.parametrize(
+    "dir_path,recursive,expected",
+    [
+        ('', True, 8),
+        ('', False, 1),
+        ('src', True, 6),
+        ('src', False, 1),
+        ('src/api', True, 3),
+        ('missing', True, 0),
+    ]
+)
+def test_count_files(index, dir_path, recursive, expected):
+    assert index.count_files(dir_path, recursive) == expected
+
+
+def test_from_treescript_merges_repeated_directories():
+    index = TreeIndex.from_treescript('src/\n  a.py\nsrc/\n  b.py\n')
+    assert list(index.iter_files('src', path_separator='/')) == ['src/a.py', 'src/b.py']
+    assert index.count_files('src') == 2
+
+
+def test_from_treescript_depth_jump_raises_exit():
+    with pytest.raises(SystemExit, match='You have jumped 1 steps in the tree on line: 2'):
+        TreeIndex.from_treescript('src/\n    a.py\n')
+
+
+def test_save_load_round_trip(index, tmp_path):
+    index.save(index_file := str(tmp_path / 'tree.index'))
+    loaded = TreeIndex.load(index_file)
+    assert list(loaded.iter_files()) == list(index.iter_files())
+    assert loaded.count_files('src') == 6
+    assert loaded.find_dir('src/api/v2') == index.find_dir('src/api/v2')
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b'',
+        b'not a pickle',
+        pickle.dumps((tree_index._INDEX_FORMAT_VERSION + 1, [], [], [], [])),
+        pickle.dumps(['list']),
+    ]
+)
+def test_load_invalid_file_raises_value_error(tmp_path, content):
+    (index_file := tmp_path / 'tree.index').write_bytes(content)
+    with pytest.raises(ValueError, match=tree_index._INVALID_INDEX_FILE_MSG):
+        TreeIndex.load(str(index_file))
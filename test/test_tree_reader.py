@@ -4,9 +4,9 @@ from re import escape
 
 import pytest
 
-from treescript_files import line_reader, generate_treescript_files
+from treescript_files import line_reader, generate_treescript_files, tree_reader
 from treescript_files.input_data import InputData
-from treescript_files.tree_reader import process_input_data
+from treescript_files.tree_reader import _split_top_level_chunks, generate_treescript_files_parallel, process_input_data
 
 
 def test_process_input_data_single_file_no_parent_path_returns_valid_path():
@@ -171,3 +171,130 @@ def test_generate_treescript_files_invalid_indentation_raises_exit():
     )
     with pytest.raises(SystemExit, match=escape(line_reader._INVALID_DEPTH_ERROR_MSG)):
         list(generator)
+
+
+_PARALLEL_INPUT = 'src/\n  a.py\n  # comment\nlib/\n  b.py\n\nc.py\ndocs/\n  d.md\n'
+
+
+@pytest.mark.parametrize("chunk_lines", [1, 2, 4, 100])
+def test_split_top_level_chunks_starts_chunks_at_top_level_lines(chunk_lines):
+    chunks = list(_split_top_level_chunks(_PARALLEL_INPUT, chunk_lines))
+    assert [line for _, lines in chunks for line in lines] == _PARALLEL_INPUT.splitlines()
+    line_number = 1
+    for first_line_number, lines in chunks:
+        assert first_line_number == line_number
+        assert not lines[0].startswith(' ')
+        line_number += len(lines)
+
+
+@pytest.mark.parametrize("chunk_lines", [1, 3, 100])
+def test_generate_treescript_files_parallel_matches_sequential(chunk_lines):
+    expected = list(generate_treescript_files(_PARALLEL_INPUT, 'module'))
+    result = list(generate_treescript_files_parallel(_PARALLEL_INPUT, 'module', max_workers=2, chunk_lines=chunk_lines))
+    assert result == expected
+    assert len(result) == 4
+
+
+def test_generate_treescript_files_parallel_error_keeps_line_number():
+    generator = generate_treescript_files_parallel(
+        'src/\n  a.py\nlib/\n  b.py\n   c.py\n',
+        None,
+        max_workers=2,
+        chunk_lines=1,
+    )
+    assert next(generator) in ['src/a.py', 'src\\a.py']
+    assert next(generator) in ['lib/b.py', 'lib\\b.py']
+    with pytest.raises(SystemExit, match=escape(line_reader._INVALID_DEPTH_ERROR_MSG + '5')):
+        next(generator)
+
+
+@pytest.mark.parametrize(
+    "parallel_threshold,expect_parallel", [
+        (None, False),
+        (1, True),
+        (1024**2, False),
+    ]
+)
+def test_process_input_data_parallel_threshold_selects_engine(monkeypatch, tmp_path, parallel_threshold, expect_parallel):
+    (tree_file := tmp_path / 'input.tree').write_text(_PARALLEL_INPUT)
+    input_data = InputData(
+        tree_input=_PARALLEL_INPUT,
+        jobs=2,
+        tree_file=str(tree_file),
+        parallel_threshold=parallel_threshold,
+    )
+    calls = []
+    def mock_parallel(**kwargs):
+        calls.append(kwargs)
+        return iter(['parallel'])
+    monkeypatch.setattr(tree_reader, 'generate_treescript_files_parallel', mock_parallel)
+    result = list(process_input_data(input_data))
+    assert (result == ['parallel']) == expect_parallel
+    assert len(calls) == int(expect_parallel)
+
+
+def test_process_input_data_default_arguments_within_size_limit_runs_parallel(monkeypatch, tmp_path):
+    from treescript_files import validate_arguments
+    from treescript_files.argument_parser import parse_arguments
+    tree_file = tmp_path / 'input.tree'
+    # Larger than the default parallel threshold, and smaller than the default file size limit
+    tree_file.write_text(''.join(f'dir_{i}/\n  module_{i}.py\n' for i in range(200_000)))
+    assert tree_reader._PARALLEL_THRESHOLD <= tree_file.stat().st_size < 8 * 1024**2
+    monkeypatch.setattr('os.cpu_count', lambda: 2)
+    calls = []
+    def mock_parallel(**kwargs):
+        calls.append(kwargs)
+        return iter(['parallel'])
+    monkeypatch.setattr(tree_reader, 'generate_treescript_files_parallel', mock_parallel)
+    input_data = validate_arguments(parse_arguments([str(tree_file)]))
+    assert list(process_input_data(input_data)) == ['parallel']
+    assert len(calls) == 1
+
+
+_FILTER_INPUT = 'src/\n  api/\n    a.py\n    # comment\n    b.js\n  c.py\nbuild/\n  out/\n    x.py\nd.py\n'
+
+
+@pytest.mark.parametrize(
+    "include,exclude,expected",
+    [
+        ((), ('build/',), ['src/api/a.py', 'src/api/b.js', 'src/c.py', 'd.py']),
+        (('*.py',), ('api',), ['src/c.py', 'build/out/x.py', 'd.py']),
+        (('src/*',), ('*.js',), ['src/api/a.py', 'src/c.py']),
+        ((), ('build/out', 'src/api/'), ['src/c.py', 'd.py']),
+    ]
+)
+def test_generate_treescript_files_filter_skips_excluded_subtrees(include, exclude, expected):
+    from treescript_files.tree_filter import TreeFilter
+    result = generate_treescript_files(_FILTER_INPUT, None, TreeFilter(include, exclude))
+    assert [path.replace('\\', '/') for path in result] == expected
+
+
+def test_generate_treescript_files_filter_only_scans_indentation_of_excluded_subtrees():
+    from treescript_files.tree_filter import TreeFilter
+    tree_input = 'build/\n  out/\n       /invalid/name/\n     x.py\nsrc/\n  a.py\n'
+    assert [p.replace('\\', '/') for p in generate_treescript_files(tree_input, None, TreeFilter(exclude=('build',)))] == ['src/a.py']
+
+
+def test_generate_treescript_files_filter_depth_jump_raises_exit():
+    from treescript_files.tree_filter import TreeFilter
+    with pytest.raises(SystemExit, match='You have jumped 1 steps in the tree on line: 2'):
+        list(generate_treescript_files('src/\n    a.py\n', None, TreeFilter(exclude=('*.js',))))
+
+
+@pytest.mark.parametrize("shape", ['wide', 'deep', 'comments', 'mixed_slashes'])
+@pytest.mark.parametrize(
+    "include,exclude",
+    [
+        (('*.py',), ('n1*/',)),
+        (('*[0-4]_*',), ('n*_[a-m]*',)),
+        ((), ('n2*/n*',)),
+    ]
+)
+def test_generate_treescript_files_filter_matches_filtered_tree_data(shape, include, exclude):
+    from benchmarks.treescript_generator import generate_treescript
+    from treescript_files.tree_filter import TreeFilter, filter_tree_data
+    tree_input = generate_treescript(shape, 2000)
+    tree_filter = TreeFilter(include, exclude)
+    expected = list(tree_reader._process_tree_data(filter_tree_data(line_reader.read_input_tree(tree_input), tree_filter)))
+    assert list(generate_treescript_files(tree_input, None, tree_filter)) == expected
+    assert list(generate_treescript_files_parallel(tree_input, None, max_workers=2, chunk_lines=300, tree_filter=tree_filter)) == expected
@@ -0,0 +1,164 @@
+""" Testing Verifier Methods.
+"""
+import os
+import shutil
+from io import BytesIO, StringIO
+from re import escape
+
+import pytest
+
+from treescript_files import verifier
+from treescript_files.input_data import InputData
+from treescript_files.line_reader import read_input_tree
+from treescript_files.materializer import materialize_tree
+from treescript_files.tree_filter import TreeFilter
+from treescript_files.verifier import verify_tree, write_verify_report
+
+
+_TREE_INPUT = """src/
+  api/
+    routes.py
+  main.py
+  api/
+    models.py
+docs/
+README.md
+"""
+
+
+@pytest.fixture
+def tree_root(tmp_path) -> str:
+    root = str(tmp_path / 'root')
+    materialize_tree(read_input_tree(_TREE_INPUT), root)
+    return root
+
+
+def test_verify_tree_matching_root(tree_root):
+    result = verify_tree(read_input_tree(_TREE_INPUT), tree_root, check_extra=True)
+    assert result.dirs_scanned == 4
+    assert result.files_expected == 4
+    assert result.missing == []
+    assert result.extra == []
+
+
+def test_verify_tree_scans_each_dir_once(tree_root, monkeypatch):
+    calls = []
+    scandir = os.scandir
+    monkeypatch.setattr(os, 'scandir', lambda path: calls.append(path) or scandir(path))
+    verify_tree(read_input_tree(_TREE_INPUT), tree_root, max_workers=2)
+    assert sorted(calls) == sorted([
+        tree_root + os.sep,
+        os.path.join(tree_root, 'src', ''),
+        os.path.join(tree_root, 'src', 'api', ''),
+        os.path.join(tree_root, 'docs', ''),
+    ])
+
+
+def test_verify_tree_missing_file(tree_root):
+    os.remove(os.path.join(tree_root, 'src', 'api', 'models.py'))
+    result = verify_tree(read_input_tree(_TREE_INPUT), tree_root)
+    assert result.missing == [os.path.join(tree_root, 'src', 'api', 'models.py')]
+
+
+def test_verify_tree_missing_dir_reports_its_files(tree_root):
+    import shutil
+    shutil.rmtree(os.path.join(tree_root, 'src', 'api'))
+    result = verify_tree(read_input_tree(_TREE_INPUT), tree_root)
+    assert result.missing == [
+        os.path.join(tree_root, 'src', 'api', ''),
+        os.path.join(tree_root, 'src', 'api', 'routes.py'),
+        os.path.join(tree_root, 'src', 'api', 'models.py'),
+    ]
+
+
+def test_verify_tree_file_replaced_by_dir_is_missing(tree_root):
+    os.remove(os.path.join(tree_root, 'README.md'))
+    os.mkdir(os.path.join(tree_root, 'README.md'))
+    result = verify_tree(read_input_tree(_TREE_INPUT), tree_root, check_extra=True)
+    assert result.missing == [os.path.join(tree_root, 'README.md')]
+    assert result.extra == []
+
+
+def test_verify_tree_extra_entries(tree_root):
+    open(os.path.join(tree_root, 'src', 'notes.md'), 'w').close()
+    os.mkdir(os.path.join(tree_root, 'build'))
+    assert verify_tree(read_input_tree(_TREE_INPUT), tree_root).extra == []
+    result = verify_tree(read_input_tree(_TREE_INPUT), tree_root, check_extra=True)
+    assert result.missing == []
+    assert result.extra == [os.path.join(tree_root, 'build', ''), os.path.join(tree_root, 'src', 'notes.md')]
+
+
+@pytest.mark.parametrize(
+    'tree_filter',
+    [
+        TreeFilter(exclude=('build/', '*.md')),
+        TreeFilter(include=('*.py',), exclude=('build',)),
+        TreeFilter(exclude=('build/', 'src/notes.md', 'README.md')),
+    ]
+)
+def test_verify_tree_filter_hides_extra_entries(tree_root, tree_filter):
+    open(os.path.join(tree_root, 'src', 'notes.md'), 'w').close()
+    os.mkdir(os.path.join(tree_root, 'build'))
+    os.remove(os.path.join(tree_root, 'README.md'))
+    result = verify_tree(read_input_tree(_TREE_INPUT), tree_root, check_extra=True, tree_filter=tree_filter)
+    assert result.missing == []
+    assert result.extra == []
+
+
+def test_verify_tree_unreadable_dir_raises_exit(tree_root, monkeypatch):
+    def scandir(path):
+        raise PermissionError(path)
+    monkeypatch.setattr(os, 'scandir', scandir)
+    with pytest.raises(SystemExit, match=escape(verifier._SCAN_FAILED_MSG)):
+        verify_tree(read_input_tree(_TREE_INPUT), tree_root)
+
+
+def test_write_verify_report_match_returns_count(tree_root):
+    output = StringIO()
+    assert write_verify_report(InputData(tree_input=_TREE_INPUT, verify_root=tree_root, check_extra=True), output) == 4
+    assert output.getvalue() == 'Verified 4 files in 4 directories: 0 missing, 0 extra.\n'
+
+
+def test_write_verify_report_mismatch_raises_exit(tree_root, capsys):
+    os.remove(os.path.join(tree_root, 'src', 'main.py'))
+    output = BytesIO()
+    with pytest.raises(SystemExit, match=escape(verifier._MISMATCH_MSG)):
+        write_verify_report(InputData(tree_input=_TREE_INPUT, verify_root=tree_root), output)
+    assert output.getvalue().decode() == 'Verified 4 files in 4 directories: 1 missing.\n'
+    assert capsys.readouterr().err == 'Missing: ' + os.path.join(tree_root, 'src', 'main.py') + '\n'
+
+
+def test_write_verify_report_streams_each_directory(tree_root, monkeypatch):
+    import sys
+    shutil.rmtree(os.path.join(tree_root, 'src'))
+    reported = []
+
+    def scan_dirs(*args):
+        for dir_missing, dir_extra in verifier_scan_dirs(*args):
+            # The mismatches of the earlier Directories were already reported
+            reported.append(sys.stderr.getvalue())
+            yield dir_missing, dir_extra
+    verifier_scan_dirs = verifier._scan_dirs
+    monkeypatch.setattr(verifier, '_scan_dirs', scan_dirs)
+    monkeypatch.setattr(sys, 'stderr', StringIO())
+    with pytest.raises(SystemExit, match=escape(verifier._MISMATCH_MSG)):
+        write_verify_report(InputData(tree_input=_TREE_INPUT, verify_root=tree_root, jobs=1), StringIO())
+    # Each snapshot is taken before the next Directory is yielded, and holds the earlier mismatches
+    assert reported[2].startswith('Missing: ' + os.path.join(tree_root, 'src') + os.sep + '\n')
+    assert len(reported[2]) < len(reported[3]) <= len(sys.stderr.getvalue())
+
+
+def test_write_verify_report_parent_path(tmp_path):
+    materialize_tree(read_input_tree(_TREE_INPUT), str(tmp_path / 'module'))
+    input_data = InputData(tree_input=_TREE_INPUT, parent_path='module/', verify_root=str(tmp_path))
+    assert write_verify_report(input_data, StringIO()) == 4
+
+
+@pytest.mark.parametrize('parent_path', ['/module', '\\module\\'])
+def test_write_verify_report_absolute_parent_raises_exit(tmp_path, parent_path):
+    materialize_tree(read_input_tree(_TREE_INPUT), str(tmp_path / 'module'))
+    input_data = InputData(tree_input=_TREE_INPUT, parent_path=parent_path, verify_root=str(tmp_path))
+    output = StringIO()
+    with pytest.raises(SystemExit, match='The Parent Path must be relative to the root'):
+        write_verify_report(input_data, output)
+    assert output.getvalue() == ''
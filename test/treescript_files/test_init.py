@@ -0,0 +1,36 @@
+""" Testing Package Level Methods.
+"""
+import pytest
+
+import treescript_files
+from treescript_files.input_data import InputData
+from treescript_files.tree_reader import generate_treescript_files
+
+
+def test_package_lazy_imports_resolve():
+    assert treescript_files.InputData is InputData
+    assert treescript_files.generate_treescript_files is generate_treescript_files
+
+
+def test_package_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        treescript_files.not_a_name
+
+
+def test_package_lazy_async_import_resolves():
+    from treescript_files.async_reader import agenerate_treescript_files
+    assert treescript_files.agenerate_treescript_files is agenerate_treescript_files
+
+
+def test_write_ts_files_stats_with_filter_returns_paths_written(capsys):
+    from io import BytesIO
+    from treescript_files.tree_filter import TreeFilter
+    input_data = InputData(
+        tree_input='src/\n  a.py\n  b.js\n  c.py\ndocs/\n  d.md\n',
+        tree_filter=TreeFilter(include=('*.py',)),
+        stats=True,
+    )
+    output = BytesIO()
+    assert treescript_files.write_ts_files(input_data, output) == 2
+    assert len(output.getvalue().splitlines()) == 2
+    assert 'files:' in capsys.readouterr().err
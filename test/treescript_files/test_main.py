@@ -1,14 +1,12 @@
 """ Testing Main Module.
  - Basic Integration Tests
 """
-import builtins
 import os
 import sys
 from re import escape
 
 import pytest
 
-from test.conftest import PrintCollector
 from treescript_files import file_validation
 from treescript_files.__main__ import main
 
@@ -32,33 +30,42 @@ def test_main_empty_input_file_raises_exit(monkeypatch, tmp_path):
         main()
 
 
-def test_main_basic_input_file_returns_treescript(monkeypatch, tmp_path):
+def test_main_basic_input_file_returns_treescript(capsys, tmp_path):
     sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME]
     os.chdir(tmp_path)
     (input_file_path := tmp_path / TEST_INPUT_FILE_NAME).touch()
     input_file_path.write_text('src/\n  file.py')
     #
-    collector = PrintCollector()
-    monkeypatch.setattr(builtins, 'print', collector.get_mock_print())
     main()
-    assert collector.collection in [
-        'src/file.py',
-        'src\\file.py'
+    assert capsys.readouterr().out in [
+        'src/file.py\n',
+        'src\\file.py\n'
     ]
 
 
-def test_main_two_input_files_returns_treescript(monkeypatch, tmp_path):
+def test_main_two_input_files_returns_treescript(capsys, tmp_path):
     sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME]
     os.chdir(tmp_path)
     (input_file_path := tmp_path / TEST_INPUT_FILE_NAME).touch()
     input_file_path.write_text('src/\n  file.py\n  file2.py')
     #
-    collector = PrintCollector()
-    monkeypatch.setattr(builtins, 'print', collector.get_mock_print())
     main()
-    assert collector.collection in [
-        'src/file.py\nsrc/file2.py',
-        'src\\file.py\nsrc\\file2.py',
+    assert capsys.readouterr().out in [
+        'src/file.py\nsrc/file2.py\n',
+        'src\\file.py\nsrc\\file2.py\n',
+    ]
+
+
+def test_main_space_separator_returns_treescript(capsys, tmp_path):
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--space']
+    os.chdir(tmp_path)
+    (input_file_path := tmp_path / TEST_INPUT_FILE_NAME).touch()
+    input_file_path.write_text('src/\n  file.py\n  file2.py')
+    #
+    main()
+    assert capsys.readouterr().out in [
+        'src/file.py src/file2.py\n',
+        'src\\file.py src\\file2.py\n',
     ]
 
 
@@ -74,3 +81,202 @@ def test_main_invalid_parent_path_slash_char_combination_raises_exit(tmp_path):
     os.chdir(tmp_path)
     with pytest.raises(ValueError, match='Invalid Directory slash character combination.'):
         main()
+
+
+def test_main_batch_directory_returns_treescript(capsys, tmp_path):
+    sys.argv = ['treescript-files', '--batch', 'trees', '--jobs', '2']
+    os.chdir(tmp_path)
+    (tmp_path / 'trees').mkdir()
+    (tmp_path / 'trees' / 'a.tree').write_text('src/\n  a.py')
+    (tmp_path / 'trees' / 'b.tree').write_text('src/\n  b.py')
+    #
+    main()
+    assert capsys.readouterr().out in [
+        'src/a.py\nsrc/b.py\n',
+        'src\\a.py\nsrc\\b.py\n',
+    ]
+
+
+def test_main_cache_dir_second_run_returns_same_treescript(capsys, tmp_path):
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--cache-dir', 'cache']
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE_NAME).write_text('src/\n  file.py\n  file2.py')
+    #
+    main()
+    first_output = capsys.readouterr().out
+    main()
+    assert capsys.readouterr().out == first_output
+    assert first_output in [
+        'src/file.py\nsrc/file2.py\n',
+        'src\\file.py\nsrc\\file2.py\n',
+    ]
+
+
+def test_main_stats_reports_on_stderr(capsys, tmp_path):
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--stats']
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE_NAME).write_text('src/\n  # comment\n  file.py\n  file2.py')
+    #
+    main()
+    captured = capsys.readouterr()
+    assert captured.out in [
+        'src/file.py\nsrc/file2.py\n',
+        'src\\file.py\nsrc\\file2.py\n',
+    ]
+    assert captured.err.startswith('TreeScript Files Stats:')
+    assert 'comments:' in captured.err
+
+
+def test_main_connect_without_server_processes_locally(capsys, tmp_path):
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--connect', 'missing.sock']
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE_NAME).write_text('src/\n  file.py')
+    #
+    main()
+    assert capsys.readouterr().out in ['src/file.py\n', 'src\\file.py\n']
+
+
+def test_main_include_exclude_filters_output(capsys, tmp_path):
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--include', '*.py', '--exclude', 'build/']
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE_NAME).write_text('src/\n  file.py\n  notes.md\nbuild/\n  out.py')
+    #
+    main()
+    assert capsys.readouterr().out in ['src/file.py\n', 'src\\file.py\n']
+
+
+def test_main_materialize_creates_tree(capsys, tmp_path):
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--materialize', 'out']
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE_NAME).write_text('src/\n  file.py')
+    #
+    main()
+    assert (tmp_path / 'out' / 'src' / 'file.py').is_file()
+    assert capsys.readouterr().out.startswith('Created 1 directories and 1 files in out')
+
+
+def test_main_verify_mismatch_raises_exit(capsys, tmp_path):
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--verify', 'out', '--extra']
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE_NAME).write_text('src/\n  file.py')
+    (tmp_path / 'out' / 'src').mkdir(parents=True)
+    (tmp_path / 'out' / 'src' / 'file.py').touch()
+    #
+    main()
+    assert capsys.readouterr().out == 'Verified 1 files in 2 directories: 0 missing, 0 extra.\n'
+    (tmp_path / 'out' / 'src' / 'extra.py').touch()
+    with pytest.raises(SystemExit, match='The Directory does not match the TreeScript'):
+        main()
+
+
+def test_main_from_dir_returns_treescript(capsys, tmp_path):
+    sys.argv = ['treescript-files', '--from-dir', 'project', '--exclude', '.git']
+    os.chdir(tmp_path)
+    (tmp_path / 'project' / 'src').mkdir(parents=True)
+    (tmp_path / 'project' / '.git').mkdir()
+    (tmp_path / 'project' / 'src' / 'file.py').touch()
+    #
+    main()
+    assert capsys.readouterr().out == 'src/\n  file.py\n'
+
+
+def test_main_diff_returns_changes(capsys, tmp_path):
+    sys.argv = ['treescript-files', '--diff', 'old.tree', 'new.tree']
+    os.chdir(tmp_path)
+    (tmp_path / 'old.tree').write_text('src/\n  file.py\n  old.py')
+    (tmp_path / 'new.tree').write_text('src/\n  file.py\n  new.py')
+    #
+    main()
+    assert capsys.readouterr().out in ['+ src/new.py\n- src/old.py\n', '+ src\\new.py\n- src\\old.py\n']
+
+
+def test_main_fingerprint_ignores_comments(capsys, tmp_path):
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--fingerprint']
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE_NAME).write_text('src/\n  file.py')
+    main()
+    fingerprint = capsys.readouterr().out
+    (tmp_path / TEST_INPUT_FILE_NAME).write_text('# Sources\nsrc/\n  file.py  The module\n')
+    main()
+    assert capsys.readouterr().out == fingerprint
+    assert len(fingerprint) == 33
+
+
+def test_main_bytes_engine_matches_text_engine(capsys, tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE_NAME).write_bytes('# Sources\r\nsrc/\r\n  api/\r\n    café.py\r\n  main.py  The module\r\n'.encode())
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--parent', 'module']
+    main()
+    expected = capsys.readouterr().out
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--parent', 'module', '--engine', 'bytes']
+    main()
+    assert capsys.readouterr().out == expected
+    assert len(expected.splitlines()) == 2
+
+
+def test_main_stdin_parent_returns_files(capsys, monkeypatch, tmp_path):
+    from io import BytesIO, TextIOWrapper
+    os.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'stdin', TextIOWrapper(BytesIO(b'src/\r\n  file.py\r\n'), encoding='utf-8'))
+    sys.argv = ['treescript-files', '-', '--parent', 'module']
+    main()
+    assert capsys.readouterr().out == os.path.join('module', 'src', 'file.py') + '\n'
+
+
+def test_main_stdin_empty_raises_exit(monkeypatch, tmp_path):
+    from io import BytesIO, TextIOWrapper
+    os.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'stdin', TextIOWrapper(BytesIO(b'\n\n'), encoding='utf-8'))
+    sys.argv = ['treescript-files', '-']
+    with pytest.raises(SystemExit, match=escape(file_validation._FILE_EMPTY_MSG)):
+        main()
+
+
+@pytest.mark.parametrize('options', [[], ['--engine', 'bytes'], ['--parent', 'module']])
+def test_main_compressed_input_returns_files(capsys, tmp_path, options):
+    import gzip
+    os.chdir(tmp_path)
+    with gzip.open(tmp_path / 'input.tree.gz', 'wb') as file:
+        file.write(b'src/\n  file.py\n')
+    sys.argv = ['treescript-files', 'input.tree.gz', *options]
+    main()
+    prefix = 'module' + os.sep if '--parent' in options else ''
+    assert capsys.readouterr().out == prefix + os.path.join('src', 'file.py') + '\n'
+
+
+def test_main_format_jsonl_returns_records(capsys, tmp_path):
+    import json
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE_NAME).write_text('src/\n  file.py')
+    sys.argv = ['treescript-files', TEST_INPUT_FILE_NAME, '--format', 'jsonl', '--parent', 'module']
+    main()
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record['path'] for record in records] == [os.path.join('module', 'src'), os.path.join('module', 'src', 'file.py')]
+    assert [record['line_number'] for record in records] == [1, 2]
+
+
+@pytest.mark.parametrize('options', [[], ['--diff', 'empty.tree']])
+def test_main_text_starting_with_bz2_magic_returns_files(capsys, tmp_path, options):
+    os.chdir(tmp_path)
+    (tmp_path / 'BZh.tree').write_text('BZh_docs/\n  a.md\n')
+    (tmp_path / 'empty.tree').write_text('# No Files\n')
+    sys.argv = ['treescript-files', *options, 'BZh.tree']
+    main()
+    prefix = '+ ' if '--diff' in options else ''
+    assert capsys.readouterr().out == prefix + os.path.join('BZh_docs', 'a.md') + '\n'
+
+
+def test_main_null_separator_works_with_xargs(tmp_path):
+    import shutil
+    import subprocess
+    if (xargs := shutil.which('xargs')) is None:
+        pytest.skip('xargs is not available.')
+    (tmp_path / TEST_INPUT_FILE_NAME).write_text('src/\n  main.py\n  util.py\n')
+    package_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    with subprocess.Popen(
+        [sys.executable, '-m', 'treescript_files', str(tmp_path / TEST_INPUT_FILE_NAME), '-0', '--parent', 'my project'],
+        stdout=subprocess.PIPE, cwd=package_root,
+    ) as process:
+        # Each path is one argument, including its spaces, and has no newline
+        output = subprocess.run([xargs, '-0', '-n', '1', 'printf', '[%s]'], stdin=process.stdout, capture_output=True).stdout
+    assert output.decode().replace('\\', '/') == '[my project/src/main.py][my project/src/util.py]'
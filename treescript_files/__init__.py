@@ -1,13 +1,40 @@
 """ TreeScript Files Package Level Methods.
  Author: DK96-OS 2024 - 2025
 """
-from treescript_files.argument_parser import parse_arguments
-from treescript_files.input_data import InputData, validate_arguments
-from treescript_files.tree_reader import generate_treescript_files
+from typing import TYPE_CHECKING, BinaryIO, TextIO
+
+if TYPE_CHECKING:
+    from treescript_files.argument_parser import parse_arguments as parse_arguments
+    from treescript_files.async_reader import agenerate_treescript_files as agenerate_treescript_files
+    from treescript_files.input_data import InputData as InputData
+    from treescript_files.input_data import validate_arguments as validate_arguments
+    from treescript_files.output_writer import write_paths as write_paths
+    from treescript_files.tree_reader import generate_treescript_files as generate_treescript_files
+    from treescript_files.tree_reader import process_input_data as process_input_data
+
+
+# The package level names, imported from their modules on first access to keep the start up fast.
+_LAZY_IMPORTS = {
+    'parse_arguments': 'treescript_files.argument_parser',
+    'InputData': 'treescript_files.input_data',
+    'validate_arguments': 'treescript_files.input_data',
+    'write_paths': 'treescript_files.output_writer',
+    'generate_treescript_files': 'treescript_files.tree_reader',
+    'process_input_data': 'treescript_files.tree_reader',
+    'agenerate_treescript_files': 'treescript_files.async_reader',
+}
+
+
+def __getattr__(name: str):
+    if (module_name := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    globals()[name] = value = getattr(import_module(module_name), name)
+    return value
 
 
 def ts_files(
-    input_data: InputData,
+    input_data: 'InputData',
 ) -> str:
     """ Converts TreeScript InputData into the desired Files output.
 
@@ -17,16 +44,82 @@ def ts_files(
 **Returns:**
  str - The String containing all of the Files, in the desired output format.
     """
-    file_generator = generate_treescript_files(
-        treescript_file=input_data.tree_input,
-        parent_path=input_data.parent_path,
+    from treescript_files.tree_reader import process_input_data as process_input_data
+    return input_data.separator.join(process_input_data(input_data))
+
+
+def write_ts_files(
+    input_data: 'InputData',
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> int:
+    """ Converts TreeScript InputData into Files, streaming them into the output.
+ - Paths are written in buffered chunks, as soon as they are parsed.
+
+**Parameters:**
+ - input_data (InputData): The program input data.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the Files into.
+ - encoding (str): The encoding used when the output stream is binary. Default: utf-8.
+
+**Returns:**
+ int - The number of Files written.
+    """
+    if input_data.batch_files is not None:
+        from treescript_files.batch_processor import write_batch_files
+        return write_batch_files(input_data, output_stream, encoding)
+    if input_data.from_dir is not None:
+        from treescript_files.dir_reader import write_dir_treescript
+        return write_dir_treescript(input_data, output_stream, encoding)
+    if input_data.diff_input is not None:
+        from treescript_files.tree_diff import write_tree_diff
+        return write_tree_diff(input_data, output_stream, encoding)
+    if input_data.materialize_root is not None:
+        from treescript_files.materializer import write_materialize_report
+        return write_materialize_report(input_data, output_stream, encoding)
+    if input_data.verify_root is not None:
+        from treescript_files.verifier import write_verify_report
+        return write_verify_report(input_data, output_stream, encoding)
+    if input_data.fingerprint:
+        from treescript_files.fingerprint import write_fingerprint
+        return write_fingerprint(input_data, output_stream, encoding)
+    if input_data.output_format != 'text':
+        from treescript_files.record_writer import write_tree_records
+        return write_tree_records(input_data, output_stream, encoding)
+    if input_data.stats:
+        from sys import stderr
+        from treescript_files.run_stats import write_ts_files_with_stats
+        stats = write_ts_files_with_stats(input_data, output_stream, encoding)
+        print(stats.format_report(), file=stderr)
+        return stats.paths
+    if input_data.connect_socket is not None and input_data.tree_file is not None:
+        from treescript_files.daemon import request_files
+        if (count := request_files(
+            socket_path=input_data.connect_socket,
+            tree_file=input_data.tree_file,
+            output_stream=output_stream,
+            parent_path=input_data.parent_path,
+            separator=input_data.separator,
+            file_size_limit=input_data.file_size_limit,
+            encoding=encoding,
+            tree_filter=input_data.tree_filter,
+        )) is not None:
+            return count
+    if input_data.cache_dir is not None and input_data.tree_file is not None:
+        from treescript_files.parse_cache import write_cached_files
+        return write_cached_files(input_data, output_stream, encoding)
+    from treescript_files.output_writer import write_paths as write_paths
+    from treescript_files.tree_reader import process_input_data as process_input_data
+    return write_paths(
+        paths=process_input_data(input_data),
+        output_stream=output_stream,
+        separator=input_data.separator,
+        encoding=encoding,
     )
-    return input_data.separator.join(file_generator)
 
 
 def validate_input(
     arguments: list[str],
-) -> InputData:
+) -> 'InputData':
     """ Validate the Given Arguments list using the ArgumentParser Module.
 
 **Parameters:**
@@ -35,6 +128,8 @@ def validate_input(
 **Returns:**
  InputData - The dataclass object containing the program input.
     """
+    from treescript_files.argument_parser import parse_arguments as parse_arguments
+    from treescript_files.input_data import validate_arguments
     return validate_arguments(
         parse_arguments(arguments)
     )
@@ -5,21 +5,29 @@ def main():
     """ TreeScript Files Main Method (Entry Point).
  Author: DK96-OS 2024 - 2025
     """
-    from sys import argv
-    from treescript_files import validate_input
-    input_data = validate_input(argv[1:])
-    #
-    from treescript_files import ts_files
-    output_data = ts_files(input_data)
-    #
-    print(output_data)
+    from sys import argv, stdout
+    output_stream = getattr(stdout, 'buffer', stdout)
+    encoding = stdout.encoding or 'utf-8'
+    # A single TreeScript file with default options skips the argument parser
+    from treescript_files.fast_path import write_single_file
+    if write_single_file(argv[1:], output_stream, encoding) is None:
+        from treescript_files import validate_input
+        input_data = validate_input(argv[1:])
+        if input_data.serve_socket is not None:
+            from treescript_files.daemon import serve
+            serve(input_data.serve_socket, input_data.idle_timeout)
+            return
+        #
+        from treescript_files import write_ts_files
+        write_ts_files(input_data, output_stream, encoding=encoding)
+    output_stream.flush()
 
 
 if __name__ == "__main__":
     # Get the directory of the current file (__file__ is the path to the script being executed)
-    from pathlib import Path
-    current_directory = Path(__file__).resolve().parent.parent
+    from os.path import dirname, realpath
+    current_directory = dirname(dirname(realpath(__file__)))
     # Add the directory to sys.path
     from sys import path
-    path.append(str(current_directory))
+    path.append(current_directory)
     main()
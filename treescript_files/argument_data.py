@@ -2,21 +2,84 @@
  - This DataClass is created after the argument syntax is validated.
 
 **Syntax Validation:**
- - The Input File is Present and non-blank.
+ - The Input File is Present and non-blank, unless Batch files are given instead.
  - The Parent Path is non-blank string or None.
+ - The File Size Limit is a positive number of bytes, or None.
+ - The Parallel Threshold is a positive number of bytes, or None.
+ - The Input File is absent in Serve mode.
+ - The Skip Existing and Dry Run flags are only given with a Materialize root.
+ - The Extra flag is only given with a Verify root.
+ - The Dir Fingerprints flag is only given with the Fingerprint flag.
+ - The Input File is absent when reading a Directory, or comparing two Tree Files.
 """
 from dataclasses import dataclass
 
+from treescript_files.daemon import _IDLE_TIMEOUT
+from treescript_files.file_validation import _FILE_SIZE_LIMIT
+from treescript_files.tree_reader import _PARALLEL_THRESHOLD
+
+
+_CACHE_SIZE_LIMIT = 256 * 1024**2 # 256 MB
+
 
 @dataclass(frozen=True)
 class ArgumentData:
     """ The syntactically valid arguments received by the Program.
 
 **Fields:**
- - tree_file (str): The file containing the Tree.
+ - tree_file (str?): The file containing the Tree, or None when Batch files are given.
  - parent_path (str?): The parent path to prefix files with.
  - separator (str): The separator to use in the program output.
+ - file_size_limit (int?): The maximum input file size in bytes, or None for no limit. Default: 8 MB.
+ - batch_files (tuple[str, ...]?): The files, directories, or globs to process as a Batch. Default: None.
+ - jobs (int?): The number of worker processes for a Batch, or None to use the CPU count. Default: None.
+ - parent_from_file (bool): Whether to add each Batch file's directory to its Parent Path. Default: False.
+ - parallel_threshold (int?): The input file size in bytes at which parsing is split across worker processes, or None to disable. Default: 4 MB.
+ - cache_dir (str?): The directory of the parse cache, or None to use the environment variable. Default: None.
+ - cache_size_limit (int): The maximum size of the parse cache in bytes. Default: 256 MB.
+ - stats (bool): Whether to report stage timings and counters on stderr. Default: False.
+ - serve_socket (str?): The Unix domain socket to serve requests on, or None. Default: None.
+ - connect_socket (str?): The Unix domain socket of a server to send the request to, or None. Default: None.
+ - idle_timeout (float): The number of seconds without a request before the server exits. Default: 600.
+ - include (tuple[str, ...]?): The glob patterns that select files, or None for every file. Default: None.
+ - exclude (tuple[str, ...]?): The glob patterns that remove files and directory subtrees, or None. Default: None.
+ - materialize_root (str?): The directory to create the Tree's directories and files in, or None. Default: None.
+ - skip_existing (bool): Whether to leave existing files unchanged when materializing. Default: False.
+ - dry_run (bool): Whether to only count what would be materialized. Default: False.
+ - verify_root (str?): The directory to check the Tree's files against, or None. Default: None.
+ - check_extra (bool): Whether to report unexpected files when verifying. Default: False.
+ - from_dir (str?): The directory to generate a TreeScript from, or None. Default: None.
+ - diff_files (tuple[str, str]?): The old and new Tree Files to compare, or None. Default: None.
+ - fingerprint (bool): Whether to output the fingerprint of the Tree, instead of its files. Default: False.
+ - dir_fingerprints (bool): Whether to also output the fingerprint of each directory. Default: False.
+ - engine (str): The input reader, either text or bytes. Default: text.
+ - output_format (str): The output format: text, jsonl, or json. Default: text.
     """
-    tree_file: str
+    tree_file: str | None
     parent_path: str | None
-    separator: str 
+    separator: str
+    file_size_limit: int | None = _FILE_SIZE_LIMIT
+    batch_files: tuple[str, ...] | None = None
+    jobs: int | None = None
+    parent_from_file: bool = False
+    parallel_threshold: int | None = _PARALLEL_THRESHOLD
+    cache_dir: str | None = None
+    cache_size_limit: int = _CACHE_SIZE_LIMIT
+    stats: bool = False
+    serve_socket: str | None = None
+    connect_socket: str | None = None
+    idle_timeout: float = _IDLE_TIMEOUT
+    include: tuple[str, ...] | None = None
+    exclude: tuple[str, ...] | None = None
+    materialize_root: str | None = None
+    skip_existing: bool = False
+    dry_run: bool = False
+    verify_root: str | None = None
+    check_extra: bool = False
+    from_dir: str | None = None
+    diff_files: tuple[str, str] | None = None
+    fingerprint: bool = False
+    dir_fingerprints: bool = False
+    engine: str = 'text'
+    output_format: str = 'text'
+
@@ -5,10 +5,18 @@
 from argparse import ArgumentParser
 from sys import exit
 
-from treescript_files.argument_data import ArgumentData
+from treescript_files.argument_data import _PARALLEL_THRESHOLD, ArgumentData
 from treescript_files.string_validation import validate_name
 
 
+# The number of values after each option that takes values, so that a value of -0 is not read as an option
+_OPTION_VALUE_COUNTS = {
+    '--parent': 1, '--size-limit': 1, '--batch': 1, '--jobs': 1, '-j': 1, '--parallel-threshold': 1,
+    '--cache-dir': 1, '--cache-size': 1, '--engine': 1, '--format': 1, '--include': 1, '--exclude': 1, '--materialize': 1,
+    '--verify': 1, '--from-dir': 1, '--diff': 2, '--serve': 1, '--connect': 1, '--idle-timeout': 1,
+}
+
+
 def parse_arguments(
     args: list[str],
 ) -> ArgumentData:
@@ -24,12 +32,40 @@ def parse_arguments(
         exit("No Arguments given.")
     # Initialize the Parser and Parse Immediately
     try:
-        parsed_args = _define_arguments().parse_args(args)
+        parsed_args = _define_arguments().parse_args(_replace_null_option(args))
     except SystemExit:
         exit("Unable to Parse Arguments.")
     return _validate_arguments(parsed_args)
 
 
+def _replace_null_option(
+    args: list[str],
+) -> list[str]:
+    """ Replace each -0 that stands as an option with --null.
+ - An option named -0 would make argparse read negative numbers, such as --size-limit -1, as options.
+ - A -0 that is the value of an option, or follows the -- separator, is left unchanged.
+
+**Parameters:**
+ - args (list[str]): A list of argument strings.
+
+**Returns:**
+ list[str] - The argument strings, with -0 options replaced.
+    """
+    result = []
+    value_count = 0
+    for index, arg in enumerate(args):
+        if value_count > 0:
+            value_count -= 1
+        elif arg == '--':
+            return result + args[index:]
+        elif arg == '-0':
+            arg = '--null'
+        else:
+            value_count = _OPTION_VALUE_COUNTS.get(arg, 0)
+        result.append(arg)
+    return result
+
+
 def _determine_output_separator(
     parsed_args,
 ) -> str:
@@ -41,6 +77,8 @@ def _determine_output_separator(
 **Returns:**
  str - The separator to use between elements in the output.
     """
+    if parsed_args.null:
+        return '\0'
     if parsed_args.space:
         return ' '
     if parsed_args.tab:
@@ -64,17 +102,155 @@ def _validate_arguments(
     """
     tree_file = parsed_args.tree_file
     parent_path = parsed_args.parent
+    if (from_dir := parsed_args.from_dir) is not None:
+        if tree_file is not None or parent_path is not None or parsed_args.batch is not None \
+                or parsed_args.serve is not None or parsed_args.materialize is not None or parsed_args.verify is not None \
+                or parsed_args.diff is not None:
+            exit("Use --from-dir without a Tree File, --parent, --batch, --serve, --materialize, --verify, or --diff.")
+        if not validate_name(from_dir):
+            exit("The From Dir argument was invalid.")
+        # A TreeScript has one line per entry
+        if parsed_args.space or parsed_args.comma or parsed_args.tab or parsed_args.null:
+            exit("Use --from-dir without --space, --comma, --tab, or --null.")
+        serve_socket = batch_files = diff_files = None
+    elif (diff_files := parsed_args.diff) is not None:
+        if tree_file is not None or parsed_args.batch is not None or parsed_args.serve is not None \
+                or parsed_args.materialize is not None or parsed_args.verify is not None:
+            exit("Use --diff without a Tree File, --batch, --serve, --materialize, or --verify.")
+        if not all(validate_name(diff_file) for diff_file in diff_files) or diff_files.count('-') > 1:
+            exit("The Diff argument was invalid.")
+        serve_socket = batch_files = None
+        diff_files = tuple(diff_files)
+    elif (serve_socket := parsed_args.serve) is not None:
+        if tree_file is not None or parsed_args.batch is not None or parsed_args.connect is not None:
+            exit("Use --serve without a Tree File, --batch, or --connect.")
+        if not validate_name(serve_socket):
+            exit("The Serve argument was invalid.")
+        batch_files = None
+    elif (batch_files := parsed_args.batch) is not None:
+        if tree_file is not None:
+            exit("Use either the Tree File argument or --batch, not both.")
+        if not all(validate_name(batch_file) for batch_file in batch_files):
+            exit("The Batch argument was invalid.")
+        batch_files = tuple(batch_files)
     # Validate Tree Name Syntax
-    if not validate_name(tree_file):
+    elif not validate_name(tree_file):
         exit("The Tree File argument was invalid.")
     if parent_path is not None:
         if not validate_name(parent_path):
             exit("The Parent Path argument was invalid.")
+    if (size_limit := parsed_args.size_limit) < 0:
+        exit("The Size Limit argument was invalid.")
+    if (jobs := parsed_args.jobs) is not None and jobs < 1:
+        exit("The Jobs argument was invalid.")
+    if (parallel_threshold := parsed_args.parallel_threshold) is None:
+        parallel_threshold = _PARALLEL_THRESHOLD
+    elif parallel_threshold < 0:
+        exit("The Parallel Threshold argument was invalid.")
+    else:
+        parallel_threshold = parallel_threshold * 1024**2 if parallel_threshold > 0 else None
+    if (cache_dir := parsed_args.cache_dir) is not None and not validate_name(cache_dir):
+        exit("The Cache Dir argument was invalid.")
+    if parsed_args.cache_size < 1:
+        exit("The Cache Size argument was invalid.")
+    if (connect_socket := parsed_args.connect) is not None and not validate_name(connect_socket):
+        exit("The Connect argument was invalid.")
+    if not parsed_args.idle_timeout > 0:
+        exit("The Idle Timeout argument was invalid.")
+    if (include := parsed_args.include) is not None:
+        if not all(validate_name(pattern) for pattern in include):
+            exit("The Include argument was invalid.")
+        include = tuple(include)
+    if (exclude := parsed_args.exclude) is not None:
+        if not all(validate_name(pattern) for pattern in exclude):
+            exit("The Exclude argument was invalid.")
+        exclude = tuple(exclude)
+    if (materialize_root := parsed_args.materialize) is not None:
+        if parsed_args.batch is not None:
+            exit("Use either --materialize or --batch, not both.")
+        if not validate_name(materialize_root):
+            exit("The Materialize argument was invalid.")
+    elif parsed_args.skip_existing or parsed_args.dry_run:
+        exit("Use --skip-existing and --dry-run with --materialize.")
+    if (verify_root := parsed_args.verify) is not None:
+        if parsed_args.batch is not None or materialize_root is not None:
+            exit("Use --verify without --batch or --materialize.")
+        if not validate_name(verify_root):
+            exit("The Verify argument was invalid.")
+    elif parsed_args.extra:
+        exit("Use --extra with --verify.")
+    if parsed_args.fingerprint:
+        if tree_file is None or materialize_root is not None or verify_root is not None:
+            exit("Use --fingerprint with a Tree File, without --materialize or --verify.")
+        if parsed_args.space or parsed_args.comma or parsed_args.tab or parsed_args.null:
+            exit("Use --fingerprint without --space, --comma, --tab, or --null.")
+    elif parsed_args.dir_fingerprints:
+        exit("Use --dir-fingerprints with --fingerprint.")
+    if parsed_args.format != 'text':
+        if tree_file is None or materialize_root is not None or verify_root is not None \
+                or parsed_args.fingerprint or parsed_args.stats:
+            exit("Use --format with a Tree File, without --materialize, --verify, --fingerprint, or --stats.")
+        if parsed_args.space or parsed_args.comma or parsed_args.tab or parsed_args.null:
+            exit("Use --format without --space, --comma, --tab, or --null.")
+    if parsed_args.engine != 'text':
+        if tree_file is None or tree_file == '-' or materialize_root is not None or verify_root is not None \
+                or parsed_args.fingerprint or parsed_args.format != 'text' or parsed_args.stats \
+                or connect_socket is not None:
+            exit("Use --engine bytes with a Tree File, without --materialize, --verify, --fingerprint, --format, --stats, or --connect.")
+    if serve_socket is not None:
+        if parent_path is not None or include is not None or exclude is not None or materialize_root is not None \
+                or verify_root is not None or parsed_args.fingerprint or parsed_args.format != 'text' or parsed_args.stats \
+                or parsed_args.space or parsed_args.comma or parsed_args.tab or parsed_args.null:
+            exit("Use --serve without --parent, --include, --exclude, --materialize, --verify, --fingerprint, --format, "
+                 "--stats, or a separator; each client sends its own options.")
+    if connect_socket is not None:
+        if tree_file is None or tree_file == '-' or materialize_root is not None or verify_root is not None \
+                or parsed_args.fingerprint or parsed_args.format != 'text':
+            exit("Use --connect with a Tree File, without stdin, --batch, --diff, --materialize, --verify, "
+                 "--fingerprint, or --format.")
+    if parsed_args.stats:
+        if tree_file is None or materialize_root is not None or verify_root is not None \
+                or parsed_args.fingerprint or connect_socket is not None:
+            exit("Use --stats with a Tree File, without --materialize, --verify, --fingerprint, or --connect.")
+    # The cache and the parallel engine are only used to output the files of a Tree File
+    if cache_dir is not None or parsed_args.parallel_threshold is not None:
+        if tree_file is None or tree_file == '-' or materialize_root is not None or verify_root is not None \
+                or parsed_args.fingerprint or parsed_args.format != 'text' or parsed_args.stats:
+            exit("Use --cache-dir and --parallel-threshold with a Tree File, without stdin, --materialize, --verify, "
+                 "--fingerprint, --format, or --stats.")
+        if parsed_args.parallel_threshold is not None and parsed_args.engine != 'text':
+            exit("Use --parallel-threshold without --engine bytes.")
+    if parsed_args.parent_from_file and batch_files is None:
+        exit("Use --parent-from-file with --batch.")
     #
     return ArgumentData(
         tree_file=tree_file,
         parent_path=parent_path,
-        separator=_determine_output_separator(parsed_args)
+        separator=_determine_output_separator(parsed_args),
+        file_size_limit=size_limit * 1024**2 if size_limit > 0 else None,
+        batch_files=batch_files,
+        jobs=jobs,
+        parent_from_file=parsed_args.parent_from_file,
+        parallel_threshold=parallel_threshold,
+        cache_dir=cache_dir,
+        cache_size_limit=parsed_args.cache_size * 1024**2,
+        stats=parsed_args.stats,
+        serve_socket=serve_socket,
+        connect_socket=connect_socket,
+        idle_timeout=parsed_args.idle_timeout,
+        include=include,
+        exclude=exclude,
+        materialize_root=materialize_root,
+        skip_existing=parsed_args.skip_existing,
+        dry_run=parsed_args.dry_run,
+        verify_root=verify_root,
+        check_extra=parsed_args.extra,
+        from_dir=from_dir,
+        diff_files=diff_files,
+        fingerprint=parsed_args.fingerprint,
+        dir_fingerprints=parsed_args.dir_fingerprints,
+        engine=parsed_args.engine,
+        output_format=parsed_args.format,
     )
 
 
@@ -88,11 +264,13 @@ def _define_arguments() -> ArgumentParser:
     parser = ArgumentParser(
         description="TreeScript Files",
     )
-    # Required argument
+    # Required argument, unless a Batch, a Directory, or a Diff is given, or in Serve mode
     parser.add_argument(
         'tree_file',
         type=str,
-        help='The File containing the Tree Node Structure'
+        nargs='?',
+        default=None,
+        help='The File containing the Tree Node Structure, or - to read it from stdin.'
     )
     # Optional Arguments
     parser.add_argument(
@@ -119,4 +297,169 @@ def _define_arguments() -> ArgumentParser:
         default=False,
         help='Use a tab as the element separator.',
     )
+    parser.add_argument(
+        '--null',
+        action='store_true',
+        default=False,
+        help='End each element with a NUL character, for xargs -0. May also be given as -0.',
+    )
+    parser.add_argument(
+        '--size-limit',
+        type=int,
+        default=8,
+        help='The maximum input file size in MB. Use 0 to disable the limit. Default: 8.',
+    )
+    parser.add_argument(
+        '--batch',
+        type=str,
+        nargs='+',
+        default=None,
+        metavar='TREE_INPUT',
+        help='Process many Tree files, directories of .tree files, or glob patterns, in order.',
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='The number of worker processes used for a Batch, or a large file. Default: The CPU count.',
+    )
+    parser.add_argument(
+        '--parent-from-file',
+        action='store_true',
+        default=False,
+        help="Add each Batch file's directory to the Parent Path of its files.",
+    )
+    parser.add_argument(
+        '--parallel-threshold',
+        type=int,
+        default=None,
+        help='The input file size in MB at which parsing is split across worker processes. Use 0 to disable. Default: 4.',
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help='The directory of the parse cache. Default: The TREESCRIPT_FILES_CACHE_DIR environment variable, or disabled.',
+    )
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=256,
+        help='The maximum size of the parse cache in MB. Default: 256.',
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        default=False,
+        help='Report the time of each stage, counters, and peak memory on stderr.',
+    )
+    parser.add_argument(
+        '--engine',
+        type=str,
+        choices=('text', 'bytes'),
+        default='text',
+        help='The input reader. The bytes engine scans a memory mapped file, and only decodes names. Default: text.',
+    )
+    parser.add_argument(
+        '--format',
+        type=str,
+        choices=('text', 'jsonl', 'json'),
+        default='text',
+        help='The output format. jsonl and json write a record per Directory and File, with its path, name, parent, type, depth, and line number. Default: text.',
+    )
+    parser.add_argument(
+        '--include',
+        type=str,
+        action='append',
+        default=None,
+        metavar='PATTERN',
+        help='Only output files matching this glob. A pattern without a slash matches the file name. May be repeated.',
+    )
+    parser.add_argument(
+        '--exclude',
+        type=str,
+        action='append',
+        default=None,
+        metavar='PATTERN',
+        help='Remove files and directory subtrees matching this glob. A trailing slash only matches directories. May be repeated.',
+    )
+    parser.add_argument(
+        '--materialize',
+        type=str,
+        default=None,
+        metavar='ROOT',
+        help='Create the directories and empty files of the Tree in this directory, instead of writing the paths.',
+    )
+    parser.add_argument(
+        '--skip-existing',
+        action='store_true',
+        default=False,
+        help='When materializing, leave existing files unchanged instead of updating their modification time.',
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        default=False,
+        help='When materializing, only report the directories and files that would be created.',
+    )
+    parser.add_argument(
+        '--verify',
+        type=str,
+        default=None,
+        metavar='ROOT',
+        help='Check that the files of the Tree exist in this directory, and exit with an error on a mismatch.',
+    )
+    parser.add_argument(
+        '--extra',
+        action='store_true',
+        default=False,
+        help='When verifying, also report the files and directories that are not in the Tree.',
+    )
+    parser.add_argument(
+        '--from-dir',
+        type=str,
+        default=None,
+        metavar='ROOT',
+        help='Write the TreeScript of an existing directory, instead of reading a Tree File.',
+    )
+    parser.add_argument(
+        '--diff',
+        type=str,
+        nargs=2,
+        default=None,
+        metavar=('OLD', 'NEW'),
+        help='Compare two Tree Files, and write the added and removed files.',
+    )
+    parser.add_argument(
+        '--fingerprint',
+        action='store_true',
+        default=False,
+        help='Output a hash of the set of files in the Tree, which ignores comments, line order, and empty directories.',
+    )
+    parser.add_argument(
+        '--dir-fingerprints',
+        action='store_true',
+        default=False,
+        help='With --fingerprint, output the hash of each directory containing files, and its path.',
+    )
+    parser.add_argument(
+        '--serve',
+        type=str,
+        default=None,
+        metavar='SOCKET',
+        help='Run a server that answers requests on this Unix domain socket, until idle.',
+    )
+    parser.add_argument(
+        '--connect',
+        type=str,
+        default=None,
+        metavar='SOCKET',
+        help='Send the request to the server on this Unix domain socket. Falls back to local processing. Default: The TREESCRIPT_FILES_SOCKET environment variable.',
+    )
+    parser.add_argument(
+        '--idle-timeout',
+        type=float,
+        default=600,
+        help='The number of seconds without a request before the server exits. Default: 600.',
+    )
     return parser
@@ -0,0 +1,156 @@
+""" Async Reader.
+
+An asyncio interface to the Tree Reader, for programs running an event loop.
+ - The file is validated and read in a worker thread, so the event loop is never blocked by I/O.
+ - Paths are parsed in batches in the worker thread, and the event loop runs other tasks between batches.
+ - Cancelling the consumer, or closing the generator early, closes the file once the current batch is done.
+ - Invalid input raises ValueError, instead of the SystemExit used by the command line program.
+ - The paths before an invalid line are yielded before the ValueError, as in generate_treescript_files.
+"""
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Generator
+
+from treescript_files.file_validation import _FILE_SIZE_LIMIT
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+    from concurrent.futures import Executor, Future
+    from treescript_files.tree_filter import TreeFilter
+
+
+_BATCH_SIZE = 4096 # The number of paths parsed by each worker thread task
+
+
+async def agenerate_treescript_files(
+    tree_file: str,
+    parent_path: str | None = None,
+    tree_filter: 'TreeFilter | None' = None,
+    file_size_limit: int | None = _FILE_SIZE_LIMIT,
+    batch_size: int = _BATCH_SIZE,
+    executor: 'Executor | None' = None,
+) -> AsyncGenerator[str, None]:
+    """ Read a TreeScript file, and asynchronously generate its file paths.
+ - Use contextlib.aclosing when the loop may end early, so that the file is closed promptly.
+
+**Parameters:**
+ - tree_file (str): The TreeScript file to read.
+ - parent_path (str?): The ParentPath to prefix file paths with. Default: None.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to output every file. Default: None.
+ - file_size_limit (int?): The maximum file size in bytes, or None for no limit. Default: 8 MB.
+ - batch_size (int): The number of paths parsed in the worker thread before the event loop resumes.
+ - executor (Executor?): The executor that reads and parses the file, or None for the event loop's default executor.
+
+**Yields:**
+ str - The path of each File, in TreeScript order.
+
+**Raises:**
+ ValueError - If the file or the TreeScript is invalid.
+    """
+    if batch_size < 1:
+        raise ValueError('The batch size must be positive.')
+    from asyncio import get_running_loop, wrap_future
+    loop = get_running_loop()
+    paths = await loop.run_in_executor(executor, _open_paths, tree_file, parent_path, tree_filter, file_size_limit)
+    pending = None
+    try:
+        while True:
+            # Keep the executor Future, which is still running after the asyncio Future is cancelled
+            pending = _submit(loop, executor, _next_batch, paths, batch_size)
+            batch, error = await wrap_future(pending)
+            pending = None
+            for path in batch:
+                yield path
+            if error is not None:
+                raise ValueError(error)
+            if len(batch) < batch_size:
+                return
+    finally:
+        if pending is None or pending.done() or pending.cancel():
+            paths.close()
+        else:
+            # The worker thread is still running the Generator, so close it when the batch is done
+            pending.add_done_callback(lambda _: paths.close())
+
+
+def _submit(
+    loop: 'AbstractEventLoop',
+    executor: 'Executor | None',
+    function: Callable,
+    *args,
+) -> 'Future':
+    """ Submit a function to the executor, or to the event loop's default executor.
+
+**Parameters:**
+ - loop (AbstractEventLoop): The running event loop.
+ - executor (Executor?): The executor to run the function in, or None for the event loop's default executor.
+ - function (Callable): The function to run in a worker thread.
+
+**Returns:**
+ Future - The executor Future, which reports whether the function is still running.
+    """
+    if executor is not None:
+        return executor.submit(function, *args)
+    from concurrent.futures import Future
+    future = Future()
+    loop.run_in_executor(None, _run_future, future, function, args)
+    return future
+
+
+def _run_future(
+    future: 'Future',
+    function: Callable,
+    args: tuple,
+):
+    """ Run a function in a worker thread, and set its result on the Future, unless it was cancelled first.
+
+**Parameters:**
+ - future (Future): The Future that receives the result.
+ - function (Callable): The function to run.
+ - args (tuple): The arguments of the function.
+    """
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(function(*args))
+    except BaseException as e:
+        future.set_exception(e)
+
+
+def _open_paths(
+    tree_file: str,
+    parent_path: str | None,
+    tree_filter: 'TreeFilter | None',
+    file_size_limit: int | None,
+) -> Generator[str, None, None]:
+    """ Validate the TreeScript file, and create its path Generator, in a worker thread.
+
+**Raises:**
+ ValueError - If the file is invalid.
+    """
+    from treescript_files.file_validation import read_input_lines
+    from treescript_files.tree_reader import generate_treescript_files
+    try:
+        return generate_treescript_files(read_input_lines(tree_file, file_size_limit), parent_path, tree_filter)
+    except SystemExit as e:
+        raise ValueError(e.code) from None
+
+
+def _next_batch(
+    paths: Generator[str, None, None],
+    batch_size: int,
+) -> tuple[list[str], str | None]:
+    """ Parse the next batch of paths, in a worker thread.
+ - When the TreeScript is invalid, the paths parsed before the error are returned with the error message.
+
+**Returns:**
+ list[str] - Up to batch_size paths. A shorter batch is the last one.
+ str? - The error message of an invalid TreeScript, or None.
+    """
+    batch = []
+    try:
+        for path in paths:
+            batch.append(path)
+            if len(batch) >= batch_size:
+                break
+    except SystemExit as e:
+        return batch, e.code
+    return batch, None
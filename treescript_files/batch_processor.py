@@ -0,0 +1,232 @@
+""" Batch Processor.
+
+Processes many TreeScript files in one invocation.
+ - Input arguments may be files, directories containing .tree files, or glob patterns.
+ - Files are parsed in parallel by a pool of worker processes.
+ - Results are returned in the same order as the input files.
+ - A file that fails does not affect the results of the other files.
+"""
+from os import path as os_path
+from sys import exit
+from typing import BinaryIO, Generator, Iterable, NamedTuple, TextIO
+
+from treescript_files.file_validation import _FILE_SIZE_LIMIT, read_input_lines
+from treescript_files.input_data import InputData
+from treescript_files.output_writer import write_paths
+from treescript_files.tree_filter import TreeFilter
+from treescript_files.tree_reader import generate_treescript_files
+
+
+_TREE_FILE_SUFFIX = '.tree'
+_GLOB_CHARS = ('*', '?', '[')
+
+_NO_TREE_FILES_FOUND_MSG = "No TreeScript files were found in the Batch input: "
+_BATCH_FAILED_MSG = "TreeScript files failed to process: "
+_ABSOLUTE_BATCH_FILE_MSG = "Use relative Batch paths with --parent-from-file: "
+
+
+class BatchResult(NamedTuple):
+    """ The result of processing one TreeScript file in a Batch.
+
+**Fields:**
+ - tree_file (str): The TreeScript file that was processed.
+ - files (list[str]?): The file paths in the TreeScript, or None if it failed.
+ - error (str?): The reason the TreeScript failed, or None if it succeeded.
+    """
+    tree_file: str
+    files: list[str] | None
+    error: str | None
+
+
+def expand_batch_inputs(
+    batch_inputs: Iterable[str],
+) -> tuple[str, ...]:
+    """ Expand the Batch input arguments into a sorted sequence of TreeScript files.
+ - A Directory is searched recursively for files ending with .tree, in sorted order.
+ - A glob pattern that is not an existing path is expanded in sorted order.
+ - Any other argument is used as a file, in the given order.
+
+**Parameters:**
+ - batch_inputs (Iterable[str]): The file, directory, and glob arguments.
+
+**Returns:**
+ tuple[str, ...] - The TreeScript file names, in processing order.
+
+**Raises:**
+ SystemExit - When a directory or glob argument does not match any file.
+    """
+    from glob import escape, glob
+    tree_files = []
+    for batch_input in batch_inputs:
+        if os_path.isdir(batch_input):
+            matches = glob(os_path.join(escape(batch_input), '**', '*' + _TREE_FILE_SUFFIX), recursive=True)
+        elif not os_path.exists(batch_input) and any(c in batch_input for c in _GLOB_CHARS):
+            matches = glob(batch_input, recursive=True)
+        else:
+            tree_files.append(batch_input)
+            continue
+        if len(matches := [m for m in matches if os_path.isfile(m)]) == 0:
+            exit(_NO_TREE_FILES_FOUND_MSG + batch_input)
+        tree_files.extend(sorted(matches))
+    return tuple(tree_files)
+
+
+def process_batch(
+    tree_files: Iterable[str],
+    parent_path: str | None = None,
+    parent_from_file: bool = False,
+    file_size_limit: int | None = _FILE_SIZE_LIMIT,
+    max_workers: int | None = None,
+    tree_filter: TreeFilter | None = None,
+) -> Generator[BatchResult, None, None]:
+    """ Process many TreeScript files, in parallel worker processes.
+ - Results are yielded in the same order as the tree_files.
+ - A limited number of files are in progress at once, so memory does not grow with the Batch.
+ - A single file, or a single worker, is processed in this process.
+
+**Parameters:**
+ - tree_files (Iterable[str]): The TreeScript files to process.
+ - parent_path (str?): The ParentPath to prefix file paths with.
+ - parent_from_file (bool): Whether to add the directory of each TreeScript file to its ParentPath.
+ - file_size_limit (int?): The maximum size of each file in bytes, or None for no limit.
+ - max_workers (int?): The number of worker processes, or None to use the CPU count.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to output every file. Default: None.
+
+**Yields:**
+ BatchResult - The result of each TreeScript file.
+
+**Raises:**
+ SystemExit - If parent_from_file is set, and a TreeScript file path is absolute.
+    """
+    tree_files = list(tree_files)
+    arguments = (
+        [_get_file_parent(f, parent_path, parent_from_file) for f in tree_files],
+        [file_size_limit] * len(tree_files),
+        [tree_filter] * len(tree_files),
+    )
+    if len(tree_files) < 2 or max_workers == 1:
+        yield from map(_process_batch_file, tree_files, *arguments)
+        return
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    from os import cpu_count
+    if max_workers is None:
+        max_workers = cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    pending = deque()
+    try:
+        for file_arguments in zip(tree_files, *arguments):
+            pending.append(executor.submit(_process_batch_file, *file_arguments))
+            # Keep each worker busy, without holding the results of the whole Batch
+            if len(pending) > max_workers * 2:
+                yield pending.popleft().result()
+        while len(pending) > 0:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def write_batch_files(
+    input_data: InputData,
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> int:
+    """ Process the Batch of TreeScript files in the InputData, and stream the Files into the output.
+ - Each failed TreeScript file is reported on stderr, along with its error.
+
+**Parameters:**
+ - input_data (InputData): The program input data, containing the batch files.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the Files into.
+ - encoding (str): The encoding used when the output stream is binary. Default: utf-8.
+
+**Returns:**
+ int - The number of Files written.
+
+**Raises:**
+ SystemExit - After all Files are written, if any TreeScript file failed.
+    """
+    failed_files = []
+
+    def _successful_files() -> Generator[str, None, None]:
+        from sys import stderr
+        for result in process_batch(
+            tree_files=input_data.batch_files,
+            parent_path=input_data.parent_path,
+            parent_from_file=input_data.parent_from_file,
+            file_size_limit=input_data.file_size_limit,
+            max_workers=input_data.jobs,
+            tree_filter=input_data.tree_filter,
+        ):
+            if result.error is not None:
+                print(f"{result.tree_file}: {result.error}", file=stderr)
+                failed_files.append(result.tree_file)
+            else:
+                yield from result.files
+    count = write_paths(
+        paths=_successful_files(),
+        output_stream=output_stream,
+        separator=input_data.separator,
+        encoding=encoding,
+    )
+    if len(failed_files) > 0:
+        output_stream.flush()
+        exit(_BATCH_FAILED_MSG + str(len(failed_files)))
+    return count
+
+
+def _get_file_parent(
+    tree_file: str,
+    parent_path: str | None,
+    parent_from_file: bool,
+) -> str | None:
+    """ Determine the ParentPath of a TreeScript file.
+
+**Parameters:**
+ - tree_file (str): The TreeScript file.
+ - parent_path (str?): The ParentPath shared by every file in the Batch.
+ - parent_from_file (bool): Whether to add the directory of the TreeScript file.
+
+**Returns:**
+ str? - The ParentPath to prefix the file paths with, or None.
+
+**Raises:**
+ SystemExit - If parent_from_file is set, and the TreeScript file path is absolute.
+    """
+    if not parent_from_file or len(file_dir := os_path.dirname(tree_file)) == 0:
+        return parent_path
+    # An absolute directory would replace the ParentPath in os.path.join, and make the file paths absolute
+    if os_path.isabs(file_dir) or len(os_path.splitdrive(file_dir)[0]) > 0:
+        exit(_ABSOLUTE_BATCH_FILE_MSG + tree_file)
+    if parent_path is None:
+        return file_dir
+    return os_path.join(parent_path, file_dir)
+
+
+def _process_batch_file(
+    tree_file: str,
+    parent_path: str | None,
+    file_size_limit: int | None,
+    tree_filter: TreeFilter | None = None,
+) -> BatchResult:
+    """ Process one TreeScript file, in a worker process.
+ - Errors are returned in the result instead of being raised.
+
+**Parameters:**
+ - tree_file (str): The TreeScript file to process.
+ - parent_path (str?): The ParentPath to prefix file paths with.
+ - file_size_limit (int?): The maximum size of the file in bytes, or None for no limit.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to output every file. Default: None.
+
+**Returns:**
+ BatchResult - The file paths, or the reason the file failed.
+    """
+    try:
+        return BatchResult(
+            tree_file,
+            list(generate_treescript_files(read_input_lines(tree_file, file_size_limit), parent_path, tree_filter)),
+            None,
+        )
+    except SystemExit as e:
+        return BatchResult(tree_file, None, str(e.code))
+    except ValueError as e:
+        return BatchResult(tree_file, None, str(e))
@@ -0,0 +1,189 @@
+""" Bytes Reader.
+
+An alternative to the Line Reader, which scans a memory mapped TreeScript file as bytes.
+ - The file is not decoded, and no str is created for a whole line.
+ - The indentation and name of each line are found with bytes methods, and only the name is decoded.
+ - A line with tabs, control characters, or non-ASCII bytes is decoded, and read by the Line Reader.
+ - The File is split into lines in large blocks, at \\n, \\r\\n, and \\r, like a file opened in text mode.
+ - Gives the same TreeData and errors as the Line Reader, for UTF-8 files.
+"""
+from sys import exit
+from typing import TYPE_CHECKING, Generator
+
+from treescript_files.file_validation import _FILE_EMPTY_MSG, _FILE_READ_OSERROR_MSG, _FILE_SIZE_LIMIT
+from treescript_files.line_reader import _INVALID_DEPTH_ERROR_MSG, _INVALID_NODE_NAME_ERROR_MSG, _new_tuple, _tokenize_line
+from treescript_files.tree_data import TreeData
+
+if TYPE_CHECKING:
+    from treescript_files.tree_filter import TreeFilter
+
+
+# The bytes that only the Line Reader handles: anything but printable ASCII and line breaks.
+_SLOW_BYTES_PATTERN = rb'[^\x20-\x7e\n\r]'
+_SLASHES = {47: b'/', 92: b'\\'} # The / and \ characters, by their byte value
+_BLOCK_SIZE = 1024**2 # The minimum number of bytes split into lines at once
+
+
+def read_mapped_tree(
+    file_name: str,
+    file_size_limit: int | None = _FILE_SIZE_LIMIT,
+) -> Generator[TreeData, None, None]:
+    """ Validate the TreeScript file, and generate its TreeData from a memory map.
+ - The File is checked immediately, but is only mapped when the Generator starts.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File.
+ - file_size_limit (int?): The maximum file size in bytes, or None for no limit. Default: 8 MB.
+
+**Returns:**
+ Generator[TreeData] - One TreeData object per non-comment line.
+
+**Raises:**
+ SystemExit - If the File does not exist, is empty or blank, read failed, or a line is invalid.
+    """
+    from treescript_files.file_validation import _validate_file_path
+    try:
+        _validate_file_path(file_name, file_size_limit)
+    except OSError:
+        exit(_FILE_READ_OSERROR_MSG)
+    return _read_mapped_file(file_name)
+
+
+def generate_mapped_files(
+    file_name: str,
+    parent_path: str | None,
+    tree_filter: 'TreeFilter | None' = None,
+    file_size_limit: int | None = _FILE_SIZE_LIMIT,
+) -> Generator[str, None, None]:
+    """ Translate a TreeScript file into file path strings, with the Bytes Reader.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File.
+ - parent_path (str?): The ParentPath to prefix file paths with.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to output every file. Default: None.
+ - file_size_limit (int?): The maximum file size in bytes, or None for no limit. Default: 8 MB.
+
+**Returns:**
+ Generator[str] - The file path strings.
+
+**Raises:**
+ SystemExit - If the File or the TreeScript is invalid.
+    """
+    from treescript_files.tree_reader import _format_parent_prefix, _process_tree_data
+    tree_data = read_mapped_tree(file_name, file_size_limit)
+    if tree_filter is not None:
+        from treescript_files.tree_filter import filter_tree_data
+        tree_data = filter_tree_data(tree_data, tree_filter)
+    return _process_tree_data(tree_data, '' if parent_path is None else _format_parent_prefix(parent_path))
+
+
+def _read_mapped_file(
+    file_name: str,
+) -> Generator[TreeData, None, None]:
+    """ Map the File into memory, and scan its lines.
+
+**Yields:**
+ TreeData - One TreeData object per non-comment line.
+
+**Raises:**
+ SystemExit - If the File is empty or blank, read failed, or a line is invalid.
+    """
+    from mmap import ACCESS_READ, mmap
+    try:
+        with open(file_name, 'rb') as file:
+            # An empty File cannot be mapped
+            data = mmap(file.fileno(), 0, access=ACCESS_READ) if file.seek(0, 2) > 0 else None
+    except (OSError, ValueError):
+        exit(_FILE_READ_OSERROR_MSG)
+    if data is None:
+        exit(_FILE_EMPTY_MSG)
+    with data:
+        yield from _scan_bytes(data)
+
+
+def _scan_bytes(
+    data,
+) -> Generator[TreeData, None, None]:
+    """ Generate the TreeData of each line in a memory mapped File.
+ - The File is split into blocks that end at a line break, and each block is split into lines at once.
+ - Mirrors line_reader._tokenize_line on bytes, for lines of printable ASCII.
+
+**Parameters:**
+ - data (mmap): The TreeScript file contents.
+
+**Yields:**
+ TreeData - One TreeData object per non-comment line.
+
+**Raises:**
+ SystemExit - If the File is blank, or a line is invalid.
+    """
+    from re import compile
+    slow_bytes = compile(_SLOW_BYTES_PATTERN)
+    is_blank = True
+    line_number = 0
+    for block in _split_blocks(data):
+        # Check the whole block once, so that most blocks skip the check on every line
+        check_lines = slow_bytes.search(block) is not None
+        # Splits at \n, \r\n, and \r, like a file opened in text mode
+        for line_number, line in enumerate(block.splitlines(), start=line_number + 1):
+            if check_lines and slow_bytes.search(line) is not None:
+                # Decode the whole line, and use the Line Reader
+                text = line.decode('utf-8')
+                if len(stripped := text.lstrip()) == 0:
+                    continue
+                is_blank = False
+                if stripped[0] != '#':
+                    yield _tokenize_line(line_number, text, stripped)
+                continue
+            if len(stripped := line.lstrip(b' ')) == 0:
+                continue
+            is_blank = False
+            if stripped[0] == 35: # The # character
+                continue
+            # Only spaces can surround the name, so the name ends at the first space
+            if (space := stripped.find(b' ')) != -1:
+                name = stripped[:space]
+            else:
+                name = stripped
+            if not 0 < len(name) < 100:
+                exit(_INVALID_NODE_NAME_ERROR_MSG + str(line_number))
+            # Bytes are compared as int, which is much faster than a bytes search
+            if 47 not in name and 92 not in name:
+                is_dir = False
+            # A Directory has one kind of slash char, at either end of the name
+            elif ((slash := name[-1]) in _SLASHES or (slash := name[0]) in _SLASHES) \
+                    and (92 if slash == 47 else 47) not in name \
+                    and slash not in (name := name.strip(_SLASHES[slash])) \
+                    and len(name) > 0 and name != b'.' and name != b'..':
+                is_dir = True
+            else:
+                exit(_INVALID_NODE_NAME_ERROR_MSG + str(line_number))
+            # Two space characters per unit of depth
+            if (space_count := len(line) - len(stripped)) & 1:
+                exit(_INVALID_DEPTH_ERROR_MSG + str(line_number))
+            yield _new_tuple(TreeData, (line_number, space_count >> 1, is_dir, name.decode('ascii')))
+    if is_blank:
+        exit(_FILE_EMPTY_MSG)
+
+
+def _split_blocks(
+    data,
+    block_size: int = _BLOCK_SIZE,
+) -> Generator[bytes, None, None]:
+    """ Copy the memory mapped File in blocks of whole lines.
+ - Each block ends after a \\n, so a \\r\\n line break is never split between blocks.
+
+**Parameters:**
+ - data (mmap): The TreeScript file contents.
+ - block_size (int): The minimum size of each block, except the last one.
+
+**Yields:**
+ bytes - The next block of lines.
+    """
+    start = 0
+    size = len(data)
+    while start < size:
+        if (end := data.find(b'\n', start + block_size - 1)) == -1:
+            end = size
+        yield data[start:end + 1]
+        start = end + 1
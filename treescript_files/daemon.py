@@ -0,0 +1,436 @@
+""" Daemon Mode.
+
+A warm server process answers TreeScript requests over a Unix domain socket, so clients skip the interpreter start up.
+ - Each client connection is handled by its own thread.
+ - The output of each TreeScript file is cached, keyed by the file modification time and size, and the output options.
+ - The output is streamed to the client as it is parsed, and the cache is bounded by the total size of its outputs.
+ - The server exits after it has been idle for the idle timeout.
+ - A client that cannot reach the server processes the TreeScript itself.
+
+**Protocol:**
+ - The client sends one line of JSON: tree_file, parent_path, separator, file_size_limit, encoding, include, and exclude.
+ - The server streams the encoded output in frames, each a "data <size>" line followed by that many bytes.
+ - The reply ends with "ok <count>", or with "error <message>" if the TreeScript is invalid.
+"""
+from os import path as os_path
+from sys import exit
+from typing import TYPE_CHECKING, BinaryIO, TextIO
+
+from treescript_files.file_validation import _FILE_SIZE_LIMIT
+
+if TYPE_CHECKING:
+    from treescript_files.tree_filter import TreeFilter
+
+
+_SOCKET_ENV_VAR = 'TREESCRIPT_FILES_SOCKET'
+_IDLE_TIMEOUT = 600 # 10 minutes
+_CACHE_SIZE = 64 * 1024**2 # The maximum total size of the outputs held in memory, 64 MB
+_MAX_REQUEST_SIZE = 64 * 1024
+
+_UNIX_SOCKETS_UNAVAILABLE_MSG = "Unix domain sockets are not available on this platform."
+_SERVER_ALREADY_RUNNING_MSG = "A server is already listening on the socket: "
+_INVALID_REQUEST_MSG = "The request was invalid."
+_INCOMPLETE_RESPONSE_MSG = "The server closed the connection before the output was complete."
+
+
+def serve(
+    socket_path: str,
+    idle_timeout: float = _IDLE_TIMEOUT,
+):
+    """ Listen on a Unix domain socket, and answer TreeScript requests until idle.
+ - The socket is only accessible by the current user, and is removed on exit.
+
+**Parameters:**
+ - socket_path (str): The path of the Unix domain socket.
+ - idle_timeout (float): The number of seconds without a request before the server exits. Default: 10 minutes.
+
+**Raises:**
+ SystemExit - If Unix domain sockets are unavailable, or another server is listening on the socket.
+    """
+    import socket
+    if not hasattr(socket, 'AF_UNIX'):
+        exit(_UNIX_SOCKETS_UNAVAILABLE_MSG)
+    _remove_stale_socket(socket_path)
+    from os import umask
+    # Create the socket without group or other permissions
+    previous_umask = umask(0o077)
+    try:
+        server = _create_server(socket_path, idle_timeout)
+    finally:
+        umask(previous_umask)
+    try:
+        with server:
+            server.serve_until_idle()
+    finally:
+        _remove_file(socket_path)
+
+
+def request_files(
+    socket_path: str,
+    tree_file: str,
+    output_stream: BinaryIO | TextIO,
+    parent_path: str | None = None,
+    separator: str = '\n',
+    file_size_limit: int | None = _FILE_SIZE_LIMIT,
+    encoding: str = 'utf-8',
+    tree_filter: 'TreeFilter | None' = None,
+) -> int | None:
+    """ Ask the server for the Files of a TreeScript file, and stream them into the output.
+
+**Parameters:**
+ - socket_path (str): The path of the server's Unix domain socket.
+ - tree_file (str): The TreeScript file, which is sent as an absolute path.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the Files into.
+ - parent_path (str?): The ParentPath to prefix file paths with.
+ - separator (str): The separator between Files. Default: Newline.
+ - file_size_limit (int?): The maximum file size in bytes, or None for no limit. Default: 8 MB.
+ - encoding (str): The encoding of the output. Default: utf-8.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to output every file. Default: None.
+
+**Returns:**
+ int? - The number of Files written, or None if the server could not be reached.
+
+**Raises:**
+ SystemExit - If the server could not process the TreeScript file, or closed the connection after some output.
+    """
+    import socket
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    from json import dumps
+    request = dumps({
+        'tree_file': os_path.abspath(tree_file),
+        'parent_path': parent_path,
+        'separator': separator,
+        'file_size_limit': file_size_limit,
+        'encoding': encoding,
+        'include': [] if tree_filter is None else tree_filter.include,
+        'exclude': [] if tree_filter is None else tree_filter.exclude,
+    }).encode() + b'\n'
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+        client.sendall(request)
+        response = client.makefile('rb')
+    except OSError:
+        client.close()
+        return None
+    from io import TextIOBase
+    decoder = None
+    if isinstance(output_stream, TextIOBase):
+        # Decode incrementally, so that characters split between frames are preserved
+        from codecs import getincrementaldecoder
+        decoder = getincrementaldecoder(encoding)()
+    is_written = False
+    with client, response:
+        while True:
+            try:
+                status = response.readline().decode('utf-8', 'replace').rstrip('\n').split(' ', 1)
+                if status[0] == 'data' and len(status) == 2 and status[1].isdigit():
+                    if len(chunk := response.read(size := int(status[1]))) != size:
+                        break
+                    output_stream.write(chunk if decoder is None else decoder.decode(chunk))
+                    is_written = True
+                    continue
+            except OSError:
+                break
+            if status[0] == 'error' and len(status) == 2:
+                exit(status[1])
+            if status[0] != 'ok' or len(status) != 2 or not status[1].isdigit():
+                break
+            if decoder is not None:
+                output_stream.write(decoder.decode(b'', True))
+            return int(status[1])
+    # The Files cannot be processed locally without repeating the output that was written
+    if is_written:
+        exit(_INCOMPLETE_RESPONSE_MSG)
+    return None
+
+
+def get_socket_path(
+    socket_path: str | None,
+) -> str | None:
+    """ Determine the server socket from the argument, or the environment variable.
+
+**Parameters:**
+ - socket_path (str?): The socket argument, or None.
+
+**Returns:**
+ str? - The socket path, or None if no server is configured.
+    """
+    if socket_path is not None:
+        return socket_path
+    from os import environ
+    if len(env_socket := environ.get(_SOCKET_ENV_VAR, '').strip()) > 0:
+        return env_socket
+    return None
+
+
+class _OutputCache:
+    """ A thread-safe, least recently used cache of encoded outputs, bounded by their total size.
+ - An output larger than the size limit is streamed without being cached.
+    """
+
+    def __init__(self, size_limit: int = _CACHE_SIZE):
+        from threading import Lock
+        self._entries = {}
+        self._size = 0
+        self._size_limit = size_limit
+        self._lock = Lock()
+
+    def write_output(self, request: dict, output_stream: BinaryIO) -> int:
+        """ Write the encoded output of a request, parsing the TreeScript on a cache miss.
+ - The key includes the file modification time and size, so a changed file is parsed again.
+ - On a cache miss, the output is written as it is parsed.
+
+**Parameters:**
+ - request (dict): The decoded client request.
+ - output_stream (BinaryIO): The stream to write the encoded output into.
+
+**Returns:**
+ int - The number of Files written.
+
+**Raises:**
+ SystemExit - If the TreeScript file is invalid.
+ ValueError - If the request is invalid.
+        """
+        from os import stat
+        tree_file = request['tree_file']
+        options = (
+            request['parent_path'], request['separator'], request['file_size_limit'], request['encoding'],
+            tuple(request.get('include', ())), tuple(request.get('exclude', ())),
+        )
+        if not isinstance(tree_file, str) or not os_path.isabs(tree_file):
+            raise ValueError(_INVALID_REQUEST_MSG)
+        try:
+            file_stat = stat(tree_file)
+            key = (tree_file, file_stat.st_mtime_ns, file_stat.st_size, *options)
+        except OSError:
+            key = None # Let the file validation report the error
+        with self._lock:
+            if (entry := self._entries.pop(key, None)) is not None:
+                self._entries[key] = entry
+        if entry is not None:
+            for chunk in entry[1]:
+                output_stream.write(chunk)
+            return entry[0]
+        if key is None:
+            return _process_request(tree_file, *options, output_stream)
+        recorder = _RecordingStream(output_stream, self._size_limit)
+        count = _process_request(tree_file, *options, recorder)
+        if recorder.chunks is not None:
+            self._add_entry(key, (count, recorder.chunks, recorder.size))
+        return count
+
+    def _add_entry(self, key: tuple, entry: tuple[int, list[bytes], int]):
+        """ Add an output, and remove the least recently used outputs until the cache is within the size limit.
+        """
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._size -= previous[2]
+            self._entries[key] = entry
+            self._size += entry[2]
+            while self._size > self._size_limit:
+                self._size -= self._entries.pop(next(iter(self._entries)))[2]
+
+
+class _RecordingStream:
+    """ A binary stream that writes to the output stream, and keeps the chunks for the cache.
+ - The chunks are discarded once their size exceeds the limit, and writing continues to the output stream only.
+    """
+
+    def __init__(self, output_stream: BinaryIO, size_limit: int):
+        self._output_stream = output_stream
+        self._size_limit = size_limit
+        self.chunks = []
+        self.size = 0
+
+    def write(self, data: bytes):
+        self._output_stream.write(data)
+        if self.chunks is not None:
+            if (size := self.size + len(data)) > self._size_limit:
+                self.chunks = None
+            else:
+                self.chunks.append(data)
+                self.size = size
+
+
+class _FrameStream:
+    """ A binary stream that writes each chunk to the client as a data frame.
+    """
+
+    def __init__(self, output_stream: BinaryIO):
+        self._output_stream = output_stream
+
+    def write(self, data: bytes):
+        if len(data) > 0:
+            self._output_stream.write(b'data %d\n' % len(data))
+            self._output_stream.write(data)
+
+
+def _process_request(
+    tree_file: str,
+    parent_path: str | None,
+    separator: str,
+    file_size_limit: int | None,
+    encoding: str,
+    include: tuple[str, ...],
+    exclude: tuple[str, ...],
+    output_stream: BinaryIO,
+) -> int:
+    """ Process a TreeScript file, and write its encoded output into the stream.
+
+**Parameters:**
+ - tree_file (str): The absolute path of the TreeScript file.
+ - parent_path (str?): The ParentPath to prefix file paths with.
+ - separator (str): The separator between Files.
+ - file_size_limit (int?): The maximum file size in bytes, or None for no limit.
+ - encoding (str): The encoding of the output.
+ - include (tuple[str, ...]): The Include patterns, or empty for every File.
+ - exclude (tuple[str, ...]): The Exclude patterns, or empty.
+ - output_stream (BinaryIO): The stream to write the encoded output into.
+
+**Returns:**
+ int - The number of Files written.
+
+**Raises:**
+ SystemExit - If the TreeScript file is invalid.
+ ValueError - If an option is invalid.
+    """
+    from treescript_files.file_validation import read_input_lines
+    from treescript_files.output_writer import write_paths
+    from treescript_files.tree_reader import generate_treescript_files
+    if not isinstance(separator, str) or not isinstance(encoding, str) \
+            or not (parent_path is None or isinstance(parent_path, str)) \
+            or not (file_size_limit is None or isinstance(file_size_limit, int)) \
+            or not all(isinstance(pattern, str) for pattern in include + exclude):
+        raise ValueError(_INVALID_REQUEST_MSG)
+    try:
+        ''.encode(encoding)
+    except LookupError:
+        raise ValueError(_INVALID_REQUEST_MSG)
+    tree_filter = None
+    if len(include) > 0 or len(exclude) > 0:
+        from treescript_files.tree_filter import TreeFilter
+        tree_filter = TreeFilter(include, exclude)
+    return write_paths(
+        paths=generate_treescript_files(read_input_lines(tree_file, file_size_limit), parent_path, tree_filter),
+        output_stream=output_stream,
+        separator=separator,
+        encoding=encoding,
+    )
+
+
+def _create_server(
+    socket_path: str,
+    idle_timeout: float,
+):
+    """ Create the threading server, bound to the socket path.
+
+**Parameters:**
+ - socket_path (str): The path of the Unix domain socket.
+ - idle_timeout (float): The number of seconds without a request before the server exits.
+
+**Returns:**
+ ThreadingUnixStreamServer - The bound and listening server.
+    """
+    from json import loads
+    from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+    from threading import Lock
+    from time import monotonic
+
+    class _RequestHandler(StreamRequestHandler):
+
+        def handle(self):
+            try:
+                if not isinstance(request := loads(self.rfile.readline(_MAX_REQUEST_SIZE)), dict):
+                    raise ValueError(_INVALID_REQUEST_MSG)
+                count = self.server.output_cache.write_output(request, _FrameStream(self.wfile))
+            except SystemExit as e:
+                self.wfile.write(f'error {e.code}'.replace('\n', ' ').encode() + b'\n')
+                return
+            except (KeyError, TypeError, ValueError) as e:
+                self.wfile.write(f'error {e if isinstance(e, ValueError) else _INVALID_REQUEST_MSG}\n'.encode())
+                return
+            self.wfile.write(b'ok %d\n' % count)
+
+    class _Server(ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self):
+            super().__init__(socket_path, _RequestHandler)
+            self.output_cache = _OutputCache()
+            self._active_requests = 0
+            self._last_activity = monotonic()
+            self._activity_lock = Lock()
+
+        def process_request(self, request, client_address):
+            with self._activity_lock:
+                self._active_requests += 1
+            super().process_request(request, client_address)
+
+        def shutdown_request(self, request):
+            super().shutdown_request(request)
+            with self._activity_lock:
+                self._active_requests -= 1
+                self._last_activity = monotonic()
+
+        def handle_error(self, request, client_address):
+            pass # A client that disconnects early does not affect the server
+
+        def serve_until_idle(self):
+            """ Handle requests until no request has been active for the idle timeout.
+            """
+            while True:
+                with self._activity_lock:
+                    if self._active_requests > 0:
+                        self.timeout = idle_timeout
+                    elif (remaining := self._last_activity + idle_timeout - monotonic()) > 0:
+                        self.timeout = remaining
+                    else:
+                        return
+                self.handle_request()
+
+    return _Server()
+
+
+def _remove_stale_socket(
+    socket_path: str,
+):
+    """ Remove a socket file left behind by a server that is no longer running.
+
+**Parameters:**
+ - socket_path (str): The path of the Unix domain socket.
+
+**Raises:**
+ SystemExit - If a server is listening on the socket.
+    """
+    import socket
+    from os import lstat
+    from stat import S_ISSOCK
+    try:
+        if not S_ISSOCK(lstat(socket_path).st_mode):
+            return
+    except OSError:
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            _remove_file(socket_path)
+            return
+    exit(_SERVER_ALREADY_RUNNING_MSG + socket_path)
+
+
+def _remove_file(
+    file_path: str,
+):
+    """ Remove a file, ignoring errors.
+
+**Parameters:**
+ - file_path (str): The path of the file to remove.
+    """
+    from os import remove
+    try:
+        remove(file_path)
+    except OSError:
+        pass
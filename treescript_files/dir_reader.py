@@ -0,0 +1,195 @@
+""" Directory Reader.
+
+Generates TreeScript from an existing Directory on disk, the reverse of the Tree Reader.
+ - Each Directory is listed with scandir, and its entries are sorted by name, so the output is deterministic.
+ - The subdirectories of a Directory are listed by a pool of threads, while its lines are written.
+ - A limited number of Directories are listed ahead, in the order they are written.
+ - Symbolic links are written as Files, and are not followed.
+ - Names that a TreeScript line cannot represent are skipped, and reported.
+"""
+from os import sep
+from sys import exit
+from typing import TYPE_CHECKING, BinaryIO, Generator, TextIO
+
+from treescript_files.path_stack import PathStack
+
+if TYPE_CHECKING:
+    from treescript_files.input_data import InputData
+    from treescript_files.tree_filter import TreeFilter
+
+
+_SCAN_FAILED_MSG = "Failed to scan: "
+_SKIPPED_NAME_MSG = "Skipped a name that TreeScript cannot represent: "
+_MAX_NAME_LENGTH = 99 # The longest name accepted by the Line Reader, including a Directory slash
+_PREFETCH_LIMIT = 64 # The maximum number of Directories listed ahead of the output
+
+
+def generate_dir_treescript(
+    root: str,
+    tree_filter: 'TreeFilter | None' = None,
+    max_workers: int | None = None,
+    skipped: list[str] | None = None,
+) -> Generator[str, None, None]:
+    """ Generate the TreeScript lines of a Directory, in sorted order.
+ - Two spaces of indentation per level, and Directories end with a slash.
+
+**Parameters:**
+ - root (str): The Directory to describe. It is not included in the output.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to describe every entry. Default: None.
+ - max_workers (int?): The number of threads listing Directories, or None for the ThreadPoolExecutor default.
+ - skipped (list[str]?): A list that receives the paths of entries that cannot be represented, or None.
+
+**Yields:**
+ str - Each TreeScript line, without a line break.
+
+**Raises:**
+ SystemExit - If a Directory could not be listed.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    root_prefix = root if root.endswith(sep) else root + sep
+    track_relative = tree_filter is not None and tree_filter.needs_paths()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    # Each slot is a Directory path and its listing Future, or None until it is submitted.
+    # The slot needed next is always first, because children are queued ahead of their parent's siblings.
+    queued = deque()
+    in_flight = 0
+    try:
+        def prefetch():
+            """ Start listing the next queued Directories, until the prefetch limit is reached.
+            """
+            nonlocal in_flight
+            while in_flight < _PREFETCH_LIMIT and len(queued) > 0:
+                if (slot := queued.popleft())[1] is None:
+                    slot[1] = executor.submit(_list_dir, slot[0])
+                    in_flight += 1
+
+        def take(slot: list) -> list[tuple[str, bool]]:
+            """ Wait for the listing of a Directory, or list it now if it was not submitted.
+            """
+            nonlocal in_flight
+            if (future := slot[1]) is None:
+                # The queued slot is skipped by prefetch
+                slot[1] = False
+                return _list_dir(slot[0])
+            in_flight -= 1
+            return future.result()
+
+        def prepare(listing: list[tuple[str, bool]], dir_path: str, relative_path: str) -> list:
+            """ Filter the sorted entries of a Directory, and queue its subdirectories for listing.
+            """
+            path_stack = PathStack(relative_path, path_separator='/') if track_relative else None
+            entries = []
+            slots = []
+            for name, is_dir in listing:
+                if not _is_representable(name, is_dir):
+                    if skipped is not None:
+                        skipped.append(dir_path + name)
+                    continue
+                if not is_dir:
+                    if tree_filter is None or tree_filter.includes_file(name, path_stack):
+                        entries.append((name, None))
+                    continue
+                if tree_filter is not None and tree_filter.excludes_dir(name, path_stack):
+                    continue
+                slots.append(slot := [dir_path + name + sep, None])
+                entries.append((name, slot))
+            queued.extendleft(reversed(slots))
+            prefetch()
+            return entries
+        #
+        # Each frame is an entry iterator, and the relative path of its Directory
+        frames = [(iter(prepare(_list_dir(root_prefix), root_prefix, '')), '')]
+        while len(frames) > 0:
+            entries, relative_path = frames[-1]
+            indent = '  ' * (len(frames) - 1)
+            for name, slot in entries:
+                if slot is None:
+                    yield indent + name
+                    continue
+                yield indent + name + '/'
+                listing = take(slot)
+                child_relative = relative_path + name + '/' if track_relative else ''
+                frames.append((iter(prepare(listing, slot[0], child_relative)), child_relative))
+                break
+            else:
+                frames.pop()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def write_dir_treescript(
+    input_data: 'InputData',
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> int:
+    """ Write the TreeScript of the InputData's Directory into the output, as it is generated.
+ - Skipped names are reported on stderr.
+
+**Parameters:**
+ - input_data (InputData): The program input data, with a from_dir root.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the TreeScript into.
+ - encoding (str): The encoding used when the output stream is binary. Default: utf-8.
+
+**Returns:**
+ int - The number of lines written.
+
+**Raises:**
+ SystemExit - If a Directory could not be listed.
+    """
+    from treescript_files.output_writer import write_paths
+    skipped = []
+    count = write_paths(
+        paths=generate_dir_treescript(input_data.from_dir, input_data.tree_filter, input_data.jobs, skipped),
+        output_stream=output_stream,
+        separator='\n',
+        encoding=encoding,
+    )
+    if len(skipped) > 0:
+        from sys import stderr
+        for path in skipped:
+            print(_SKIPPED_NAME_MSG + path, file=stderr)
+    return count
+
+
+def _list_dir(
+    dir_path: str,
+) -> list[tuple[str, bool]]:
+    """ List the entries of a Directory, sorted by name, in a worker thread.
+
+**Parameters:**
+ - dir_path (str): The path of the Directory, ending with a separator.
+
+**Returns:**
+ list[tuple[str, bool]] - The name of each entry, and whether it is a Directory that is not a link.
+
+**Raises:**
+ SystemExit - If the Directory could not be listed.
+    """
+    from os import scandir
+    try:
+        with scandir(dir_path) as entries:
+            listing = [(entry.name, entry.is_dir(follow_symlinks=False)) for entry in entries]
+    except OSError:
+        exit(_SCAN_FAILED_MSG + dir_path)
+    listing.sort()
+    return listing
+
+
+def _is_representable(
+    name: str,
+    is_dir: bool,
+) -> bool:
+    """ Determine whether the Line Reader reads a name back unchanged.
+ - Whitespace ends a name or a line, a leading # starts a comment, and slashes mark Directories.
+ - Names that cannot be encoded, such as undecodable file system bytes, are also excluded.
+    """
+    if len(name) + is_dir > _MAX_NAME_LENGTH or name[0] == '#' or '/' in name or '\\' in name:
+        return False
+    if name.split() != [name]:
+        return False
+    try:
+        name.encode('utf-8')
+    except UnicodeEncodeError:
+        return False
+    return True
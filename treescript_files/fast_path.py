@@ -0,0 +1,75 @@
+""" Command Line Fast Path.
+
+The common invocation, a single TreeScript file with default options, is handled without the argument parser.
+ - Avoids importing argparse, dataclasses, and pathlib, which dominate the program start up time.
+ - Any other arguments, or an input that needs another engine, are left to the full argument parser.
+ - When the TREESCRIPT_FILES_SOCKET environment variable is set, the request is sent to the server.
+"""
+from typing import BinaryIO, Iterable, TextIO
+
+
+def write_single_file(
+    arguments: list[str],
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> int | None:
+    """ Write the Files of a single TreeScript file argument, when no options are given.
+ - Produces the same output and errors as the full argument parser, for the arguments it accepts.
+
+**Parameters:**
+ - arguments (list[str]): The command line arguments, excluding the program name.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the Files into.
+ - encoding (str): The encoding used when the output stream is binary. Default: utf-8.
+
+**Returns:**
+ int? - The number of Files written, or None if the arguments require the full argument parser.
+
+**Raises:**
+ SystemExit - If the TreeScript file is invalid.
+    """
+    if len(arguments) != 1 or len((tree_file := arguments[0]).strip()) == 0:
+        return None
+    from treescript_files.file_validation import _STDIN_FILE_NAME
+    if tree_file == _STDIN_FILE_NAME:
+        # Paths are written while the producer is still writing the Input
+        from treescript_files.file_validation import read_stdin_lines
+        return _write_lines(read_stdin_lines(), output_stream, encoding)
+    if tree_file.startswith('-'):
+        return None
+    from treescript_files.parse_cache import get_cache_dir
+    if get_cache_dir(None) is not None:
+        return None
+    from treescript_files.daemon import get_socket_path
+    if (socket_path := get_socket_path(None)) is not None:
+        from treescript_files.daemon import request_files
+        if (count := request_files(socket_path, tree_file, output_stream, encoding=encoding)) is not None:
+            return count
+    from os.path import getsize
+    from treescript_files.tree_reader import _PARALLEL_THRESHOLD
+    try:
+        if getsize(tree_file) >= _PARALLEL_THRESHOLD:
+            return None
+    except OSError:
+        # Let the full argument parser report the error
+        return None
+    from treescript_files.file_validation import read_input_lines
+    return _write_lines(read_input_lines(tree_file), output_stream, encoding)
+
+
+def _write_lines(
+    lines: Iterable[str],
+    output_stream: BinaryIO | TextIO,
+    encoding: str,
+) -> int:
+    """ Write the Files of the TreeScript lines, with the default options.
+
+**Returns:**
+ int - The number of Files written.
+    """
+    from treescript_files.output_writer import write_paths
+    from treescript_files.tree_reader import generate_treescript_files
+    return write_paths(
+        paths=generate_treescript_files(lines, None),
+        output_stream=output_stream,
+        encoding=encoding,
+    )
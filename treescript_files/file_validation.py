@@ -1,48 +1,260 @@
 """ File Validation Methods.
  - The Methods raise SystemExit and TypeError exceptions.
 """
-from pathlib import Path
+from os import lstat, path as os_path
 from sys import exit
+from typing import BinaryIO, Generator
 
 
 _FILE_SIZE_LIMIT = 8 * 1024**2 # 8 MB
-_FILE_SIZE_LIMIT_ERROR_MSG = "File larger than 8 MB Limit."
+_STDIN_FILE_NAME = '-' # The Tree File argument that reads the Input from stdin
+_STREAM_CHUNK_SIZE = 64 * 1024 # The maximum number of bytes read from a stream at once
+# The stdlib module that decompresses each format, by file name suffix, and by the magic bytes at the start of the File
+_COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'lzma'}
+_COMPRESSION_MAGIC = ((b'\x1f\x8b', 'gzip'), (b'\xfd7zXZ\x00', 'lzma'))
+# A bz2 File starts with BZh, a block size digit from 1 to 9, and the magic of its first block
+_BZ2_MAGIC = b'BZh'
+_BZ2_BLOCK_MAGIC = b'1AY&SY'
+_FILE_SIZE_LIMIT_ERROR_MSG = "File larger than the Size Limit."
 _FILE_SYMLINK_DISABLED_MSG = "Symlink file paths are disabled."
 
 _FILE_DOES_NOT_EXIST_MSG = "The File does not Exist."
 _FILE_READ_OSERROR_MSG = "Failed to Read from File."
 _FILE_EMPTY_MSG = 'The Input File is Empty.'
+_COMPRESSION_UNAVAILABLE_MSG = "The Compression Module for the File is not available."
 
 
 def validate_input_file(
     file_name: str,
-    file_size_limit: int = _FILE_SIZE_LIMIT,
+    file_size_limit: int | None = _FILE_SIZE_LIMIT,
 ) -> str | None:
     """ Read the Input File, Validate (non-blank) data, and return Input str.
  - Max FileSize is 8 MB by default.
  - Symlink type file paths are disabled.
+ - The whole File is held in memory, so prefer read_input_lines for large Files.
 
 **Parameters:**
  - file_name (str): The Name of the Input File.
+ - file_size_limit (int?): The maximum file size in bytes, or None for no limit.
 
 **Returns:**
  str? - The String Contents of the Input File.
 
 **Raises:**
  SystemExit - If the File does not exist, or is empty or blank, or read failed.
+    """
+    return ''.join(read_input_lines(file_name, file_size_limit))
+
+
+def read_input_lines(
+    file_name: str,
+    file_size_limit: int | None = _FILE_SIZE_LIMIT,
+) -> Generator[str, None, None]:
+    """ Validate the Input File, and read it incrementally, one line at a time.
+ - The File is checked immediately, but is only opened when the Generator starts.
+ - Only one line is held in memory at a time.
+ - Symlink type file paths are disabled.
+ - The File name - reads the Input from stdin.
+ - A gzip, bz2, or xz File is decompressed as it is read, and the size limit applies to the decompressed bytes.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File, or - for stdin.
+ - file_size_limit (int?): The maximum file size in bytes, or None for no limit. Default: 8 MB.
+
+**Yields:**
+ str - Each line of the Input File, including the line ending.
+
+**Raises:**
+ SystemExit - If the File does not exist, or is empty or blank, or read failed.
+    """
+    if file_name == _STDIN_FILE_NAME:
+        return read_stdin_lines(file_size_limit)
+    try:
+        compression = _detect_compression(file_name)
+        # The size limit of a compressed File is applied to the decompressed bytes, while they are read
+        _validate_file_path(file_name, file_size_limit if compression is None else None)
+        if compression is not None:
+            return _read_compressed_lines(file_name, compression, file_size_limit)
+    except OSError:
+        exit(_FILE_READ_OSERROR_MSG)
+    return _read_lines(file_name)
+
+
+def read_stdin_lines(
+    file_size_limit: int | None = _FILE_SIZE_LIMIT,
+) -> Generator[str, None, None]:
+    """ Read the Input from stdin incrementally, so that lines are processed while the producer is writing.
+ - The size limit and the empty Input check are applied as the stream is read.
+
+**Parameters:**
+ - file_size_limit (int?): The maximum number of bytes read, or None for no limit. Default: 8 MB.
+
+**Returns:**
+ Generator[str] - Each line of the Input, including the line ending.
+
+**Raises:**
+ SystemExit - If the Input is larger than the size limit, or is empty or blank.
+    """
+    from sys import stdin
+    return read_stream_lines(stdin.buffer, file_size_limit, stdin.encoding or 'utf-8')
+
+
+def read_stream_lines(
+    stream: BinaryIO,
+    file_size_limit: int | None = _FILE_SIZE_LIMIT,
+    encoding: str = 'utf-8',
+) -> Generator[str, None, None]:
+    """ Read the lines of a binary stream, as soon as each line is complete.
+ - Lines end at \\n, \\r\\n, or \\r, like a file opened in text mode, so line numbers match.
+ - The encoding must be ASCII compatible, such as UTF-8, so that line breaks can be found in the bytes.
+
+**Parameters:**
+ - stream (BinaryIO): The stream to read, which must have a read1 method.
+ - file_size_limit (int?): The maximum number of bytes read, or None for no limit. Default: 8 MB.
+ - encoding (str): The encoding of the stream. Default: utf-8.
+
+**Yields:**
+ str - Each line of the stream, including the line ending.
+
+**Raises:**
+ SystemExit - If the stream is larger than the size limit, is empty or blank, or read failed.
+    """
+    is_blank = True
+    size = 0
+    pending = bytearray() # The start of a line that continues in the next chunk
+    try:
+        while len(chunk := stream.read1(_STREAM_CHUNK_SIZE)) > 0:
+            if file_size_limit is not None and (size := size + len(chunk)) > file_size_limit:
+                exit(_FILE_SIZE_LIMIT_ERROR_MSG)
+            pending += chunk
+            if b'\n' not in chunk and b'\r' not in chunk:
+                continue
+            lines = pending.splitlines(keepends=True)
+            # A final \r may be the start of a \r\n line break
+            pending = lines.pop() if not lines[-1].endswith(b'\n') else bytearray()
+            for line in lines:
+                text = line.decode(encoding)
+                if is_blank and len(text.strip()) > 0:
+                    is_blank = False
+                yield text
+    except OSError:
+        exit(_FILE_READ_OSERROR_MSG)
+    # The last line, which has no line break, or ends with \r
+    if len(pending) > 0:
+        text = pending.decode(encoding)
+        if is_blank and len(text.strip()) > 0:
+            is_blank = False
+        yield text
+    if is_blank:
+        exit(_FILE_EMPTY_MSG)
+
+
+def _validate_file_path(
+    file_name: str,
+    file_size_limit: int | None,
+) -> None:
+    """ Check that the Input File exists, is not a symlink, and is within the size limit.
+ - Uses os.path rather than pathlib, which keeps pathlib out of the program start up.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File.
+ - file_size_limit (int?): The maximum file size in bytes, or None for no limit.
+
+**Raises:**
+ SystemExit - If the File does not exist, is a symlink, or is too large.
+ OSError - If the File could not be inspected.
+    """
+    if not os_path.exists(file_name):
+        exit(_FILE_DOES_NOT_EXIST_MSG)
+    if os_path.islink(file_name):
+        exit(_FILE_SYMLINK_DISABLED_MSG)
+    if file_size_limit is not None and lstat(file_name).st_size > file_size_limit:
+        exit(_FILE_SIZE_LIMIT_ERROR_MSG)
+
+
+def _read_lines(
+    file_name: str,
+) -> Generator[str, None, None]:
+    """ Read the lines of a File, and exit at the end if every line was blank.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File.
+
+**Yields:**
+ str - Each line of the File.
+
+**Raises:**
+ SystemExit - If the File is empty or blank, or read failed.
+    """
+    is_blank = True
+    try:
+        with open(file_name) as file:
+            for line in file:
+                if is_blank and len(line.strip()) > 0:
+                    is_blank = False
+                yield line
+    except OSError:
+        exit(_FILE_READ_OSERROR_MSG)
+    if is_blank:
+        exit(_FILE_EMPTY_MSG)
+
+
+def _detect_compression(
+    file_name: str,
+) -> str | None:
+    """ Determine the compression format of a File, from its magic bytes or its name suffix.
+ - The full bz2 header is matched, so that a TreeScript starting with BZh is read as text.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File.
+
+**Returns:**
+ str? - The name of the stdlib module that decompresses the File, or None if the File is not compressed.
     """
     try:
-        if not (file_path := Path(file_name)).exists():
-            exit(_FILE_DOES_NOT_EXIST_MSG)
-        if file_path.is_symlink():
-            exit(_FILE_SYMLINK_DISABLED_MSG)
-        if file_path.lstat().st_size > file_size_limit:
-            exit(_FILE_SIZE_LIMIT_ERROR_MSG)
-        if (data := file_path.read_text()) is not None:
-            if len(data.strip()) > 0:
-                return data
-            exit(_FILE_EMPTY_MSG)
-        # Fallthrough: return None
+        with open(file_name, 'rb') as file:
+            magic = file.read(10)
     except OSError:
+        # Let the reader report the error
+        return None
+    for prefix, module_name in _COMPRESSION_MAGIC:
+        if magic.startswith(prefix):
+            return module_name
+    if magic.startswith(_BZ2_MAGIC) and b'1' <= magic[3:4] <= b'9' and magic[4:] == _BZ2_BLOCK_MAGIC:
+        return 'bz2'
+    return _COMPRESSION_SUFFIXES.get(os_path.splitext(file_name)[1].lower())
+
+
+def _read_compressed_lines(
+    file: str | BinaryIO,
+    module_name: str,
+    file_size_limit: int | None,
+) -> Generator[str, None, None]:
+    """ Decompress a File as it is read, and read its lines.
+ - Only one chunk of the decompressed data is held in memory at a time.
+
+**Parameters:**
+ - file (str | BinaryIO): The Name of the Input File, or the File opened in binary mode.
+ - module_name (str): The stdlib module that decompresses the File: gzip, bz2, or lzma.
+ - file_size_limit (int?): The maximum number of decompressed bytes, or None for no limit.
+
+**Yields:**
+ str - Each line of the decompressed File, including the line ending.
+
+**Raises:**
+ SystemExit - If the decompressed File is too large, is empty or blank, or could not be decompressed.
+    """
+    from importlib import import_module
+    try:
+        module = import_module(module_name)
+    except ImportError:
+        exit(_COMPRESSION_UNAVAILABLE_MSG)
+    from locale import getpreferredencoding
+    # A truncated File raises EOFError, and invalid xz data raises LZMAError
+    errors = (OSError, EOFError, module.LZMAError) if module_name == 'lzma' else (OSError, EOFError)
+    try:
+        with module.open(file, 'rb') as stream:
+            # The encoding that open() uses for an uncompressed File
+            yield from read_stream_lines(stream, file_size_limit, getpreferredencoding(False))
+    except errors:
         exit(_FILE_READ_OSERROR_MSG)
-    return None
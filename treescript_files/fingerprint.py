@@ -0,0 +1,119 @@
+""" Tree Fingerprint.
+
+A Merkle hash of the Files described by a TreeScript.
+ - Comments, blank lines, trailing words, the order of lines, and repeated Files do not change the fingerprint.
+ - Directories without any Files do not change the fingerprint, so it only depends on the set of file paths.
+ - Each Directory has its own fingerprint, so the subtrees that changed can be found by comparing them.
+ - The digests are the same as the Tree Diff uses to skip identical subtrees.
+"""
+from os import sep
+from typing import TYPE_CHECKING, BinaryIO, Generator, Iterable, TextIO
+
+from treescript_files.tree_diff import _EMPTY_DIGEST, DiffDir, build_diff_tree
+
+if TYPE_CHECKING:
+    from treescript_files.input_data import InputData
+    from treescript_files.tree_filter import TreeFilter
+
+
+def compute_fingerprint(
+    treescript: str | Iterable[str],
+    tree_filter: 'TreeFilter | None' = None,
+) -> str:
+    """ Compute the fingerprint of the Files in a TreeScript.
+ - Two TreeScripts with the same set of file paths have the same fingerprint.
+
+**Parameters:**
+ - treescript (str | Iterable[str]): The TreeScript, as a string or an Iterable of lines.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to include every File. Default: None.
+
+**Returns:**
+ str - The hexadecimal fingerprint of the root Directory.
+
+**Raises:**
+ SystemExit - If the TreeScript is invalid.
+    """
+    return build_fingerprint_tree(treescript, tree_filter).digest.hex()
+
+
+def build_fingerprint_tree(
+    treescript: str | Iterable[str],
+    tree_filter: 'TreeFilter | None' = None,
+) -> DiffDir:
+    """ Parse a TreeScript into Directory nodes, each holding the fingerprint of its subtree.
+
+**Parameters:**
+ - treescript (str | Iterable[str]): The TreeScript, as a string or an Iterable of lines.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to include every File. Default: None.
+
+**Returns:**
+ DiffDir - The root Directory, whose digest is the fingerprint of the Tree.
+
+**Raises:**
+ SystemExit - If the TreeScript is invalid.
+    """
+    from treescript_files.line_reader import read_input_tree
+    tree_data = read_input_tree(treescript)
+    if tree_filter is not None:
+        from treescript_files.tree_filter import filter_tree_data
+        tree_data = filter_tree_data(tree_data, tree_filter)
+    return build_diff_tree(tree_data)
+
+
+def iter_dir_fingerprints(
+    root: DiffDir,
+    parent_path: str | None = None,
+) -> Generator[tuple[str, str], None, None]:
+    """ Generate the fingerprint of every Directory containing Files, in sorted pre-order.
+
+**Parameters:**
+ - root (DiffDir): The root Directory, from build_fingerprint_tree.
+ - parent_path (str?): The ParentPath to prefix the Directory paths with.
+
+**Yields:**
+ tuple[str, str] - The hexadecimal fingerprint, and the Directory path ending with a separator. The root path is the Parent Path, or empty.
+    """
+    from treescript_files.tree_reader import _format_parent_prefix
+    stack = [(root, '' if parent_path is None else _format_parent_prefix(parent_path))]
+    while len(stack) > 0:
+        node, prefix = stack.pop()
+        if node.digest == _EMPTY_DIGEST and node is not root:
+            continue
+        yield node.digest.hex(), prefix
+        stack.extend((node.dirs[name], prefix + name + sep) for name in sorted(node.dirs, reverse=True))
+
+
+def write_fingerprint(
+    input_data: 'InputData',
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> int:
+    """ Write the fingerprint of the Tree Input, and optionally of each Directory, into the output.
+ - Each Directory line is the fingerprint, two spaces, and the Directory path.
+
+**Parameters:**
+ - input_data (InputData): The program input data.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the fingerprints into.
+ - encoding (str): The encoding used when the output stream is binary. Default: utf-8.
+
+**Returns:**
+ int - The number of fingerprints written.
+
+**Raises:**
+ SystemExit - If the TreeScript is invalid.
+    """
+    from treescript_files.output_writer import write_paths
+    root = build_fingerprint_tree(input_data.tree_input, input_data.tree_filter)
+    if not input_data.dir_fingerprints:
+        lines = (root.digest.hex(),)
+    else:
+        lines = (
+            f'{digest}  {path if len(path) > 0 else "." + sep}'
+            for digest, path in iter_dir_fingerprints(root, input_data.parent_path)
+        )
+    return write_paths(
+        paths=lines,
+        output_stream=output_stream,
+        separator='\n',
+        encoding=encoding,
+    )
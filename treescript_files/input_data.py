@@ -2,12 +2,13 @@
  Author: DK96-OS 2024 - 2025
 """
 from dataclasses import dataclass
-from typing import Generator
+from typing import Generator, Iterable
 
-from .argument_data import ArgumentData
-from .file_validation import validate_input_file
+from .argument_data import _CACHE_SIZE_LIMIT, _IDLE_TIMEOUT, _PARALLEL_THRESHOLD, ArgumentData
+from .file_validation import _FILE_SIZE_LIMIT, _STDIN_FILE_NAME, read_input_lines
 from .string_validation import validate_slash_char
 from .tree_data import TreeData
+from .tree_filter import TreeFilter
 
 
 @dataclass(frozen=True)
@@ -15,13 +16,61 @@ class InputData:
     """ The Data Class Containing Program Input.
 
 **Fields:**
- - tree_input (str): The Tree Input to the program.
+ - tree_input (str | Iterable[str]?): The Tree Input to the program, as a string or an Iterable of lines. None when Batch files or a Directory are given, or in Serve mode.
  - parent_path (str?): The Parent Path to prefix, or None. Default: None.
  - separator (str): The separator between elements in the program output. Default: Newline Character.
+ - batch_files (tuple[str, ...]?): The TreeScript files to process as a Batch, or None. Default: None.
+ - jobs (int?): The number of worker processes for a Batch, or None to use the CPU count. Default: None.
+ - parent_from_file (bool): Whether to add each Batch file's directory to its Parent Path. Default: False.
+ - file_size_limit (int?): The maximum size of each Batch file in bytes, or None for no limit. Default: 8 MB.
+ - tree_file (str?): The name of the file that the Tree Input is read from, or None. Default: None.
+ - parallel_threshold (int?): The Tree File size in bytes at which parsing is split across worker processes, or None to disable. Default: 4 MB.
+ - cache_dir (str?): The directory of the parse cache, or None to disable the cache. Default: None.
+ - cache_size_limit (int): The maximum size of the parse cache in bytes. Default: 256 MB.
+ - stats (bool): Whether to report stage timings and counters on stderr. Default: False.
+ - serve_socket (str?): The Unix domain socket to serve requests on, or None. Default: None.
+ - connect_socket (str?): The Unix domain socket of a server that processes the Tree File, or None. Default: None.
+ - idle_timeout (float): The number of seconds without a request before the server exits. Default: 600.
+ - tree_filter (TreeFilter?): The compiled Include and Exclude patterns, or None to output every file. Default: None.
+ - materialize_root (str?): The directory to create the Tree's directories and files in, or None. Default: None.
+ - skip_existing (bool): Whether to leave existing files unchanged when materializing. Default: False.
+ - dry_run (bool): Whether to only count what would be materialized. Default: False.
+ - verify_root (str?): The directory to check the Tree's files against, or None. Default: None.
+ - check_extra (bool): Whether to report unexpected files when verifying. Default: False.
+ - from_dir (str?): The directory to generate a TreeScript from, or None. Default: None.
+ - diff_input (str | Iterable[str]?): The new Tree to compare with the Tree Input, as a string or an Iterable of lines, or None. Default: None.
+ - fingerprint (bool): Whether to output the fingerprint of the Tree, instead of its files. Default: False.
+ - dir_fingerprints (bool): Whether to also output the fingerprint of each directory. Default: False.
+ - engine (str): The input reader for the Tree File, either text or bytes. Default: text.
+ - output_format (str): The output format: text for the file paths, or jsonl or json for a record per node. Default: text.
     """
-    tree_input: str
+    tree_input: str | Iterable[str] | None
     parent_path: str | None = None
     separator: str = '\n'
+    batch_files: tuple[str, ...] | None = None
+    jobs: int | None = None
+    parent_from_file: bool = False
+    file_size_limit: int | None = _FILE_SIZE_LIMIT
+    tree_file: str | None = None
+    parallel_threshold: int | None = _PARALLEL_THRESHOLD
+    cache_dir: str | None = None
+    cache_size_limit: int = _CACHE_SIZE_LIMIT
+    stats: bool = False
+    serve_socket: str | None = None
+    connect_socket: str | None = None
+    idle_timeout: float = _IDLE_TIMEOUT
+    tree_filter: TreeFilter | None = None
+    materialize_root: str | None = None
+    skip_existing: bool = False
+    dry_run: bool = False
+    verify_root: str | None = None
+    check_extra: bool = False
+    from_dir: str | None = None
+    diff_input: str | Iterable[str] | None = None
+    fingerprint: bool = False
+    dir_fingerprints: bool = False
+    engine: str = 'text'
+    output_format: str = 'text'
 
     def get_tree_data(self) -> Generator[TreeData, None, None]:
         """ Initializes a Generator for processing the Tree Input.
@@ -52,8 +101,68 @@ def validate_arguments(argument_data: ArgumentData) -> InputData:
             pass # This is handled by Validation Part 2.
         elif len(path_prefix.strip()) < 1:
             path_prefix = None # Remove blank arguments
+    if argument_data.serve_socket is not None:
+        return InputData(
+            tree_input=None,
+            serve_socket=argument_data.serve_socket,
+            idle_timeout=argument_data.idle_timeout,
+        )
+    from .daemon import get_socket_path
+    from .parse_cache import get_cache_dir
+    tree_filter = None
+    if argument_data.include is not None or argument_data.exclude is not None:
+        tree_filter = TreeFilter(argument_data.include or (), argument_data.exclude or ())
+    if argument_data.from_dir is not None:
+        return InputData(
+            tree_input=None,
+            jobs=argument_data.jobs,
+            tree_filter=tree_filter,
+            from_dir=argument_data.from_dir,
+        )
+    if argument_data.diff_files is not None:
+        old_file, new_file = argument_data.diff_files
+        return InputData(
+            tree_input=read_input_lines(old_file, argument_data.file_size_limit),
+            parent_path=path_prefix,
+            separator=argument_data.separator,
+            file_size_limit=argument_data.file_size_limit,
+            tree_file=old_file,
+            tree_filter=tree_filter,
+            diff_input=read_input_lines(new_file, argument_data.file_size_limit),
+        )
+    if argument_data.batch_files is not None:
+        from .batch_processor import expand_batch_inputs
+        return InputData(
+            tree_input=None,
+            parent_path=path_prefix,
+            separator=argument_data.separator,
+            batch_files=expand_batch_inputs(argument_data.batch_files),
+            jobs=argument_data.jobs,
+            parent_from_file=argument_data.parent_from_file,
+            file_size_limit=argument_data.file_size_limit,
+            tree_filter=tree_filter,
+        )
     return InputData(
-        tree_input=validate_input_file(argument_data.tree_file),
+        tree_input=read_input_lines(argument_data.tree_file, argument_data.file_size_limit),
         parent_path=path_prefix,
         separator=argument_data.separator,
+        jobs=argument_data.jobs,
+        file_size_limit=argument_data.file_size_limit,
+        # The stdin Input has no File for the cache, the server, or the parallel and bytes engines
+        tree_file=None if argument_data.tree_file == _STDIN_FILE_NAME else argument_data.tree_file,
+        parallel_threshold=argument_data.parallel_threshold,
+        cache_dir=get_cache_dir(argument_data.cache_dir),
+        cache_size_limit=argument_data.cache_size_limit,
+        stats=argument_data.stats,
+        connect_socket=get_socket_path(argument_data.connect_socket),
+        tree_filter=tree_filter,
+        materialize_root=argument_data.materialize_root,
+        skip_existing=argument_data.skip_existing,
+        dry_run=argument_data.dry_run,
+        verify_root=argument_data.verify_root,
+        check_extra=argument_data.check_extra,
+        fingerprint=argument_data.fingerprint,
+        dir_fingerprints=argument_data.dir_fingerprints,
+        engine=argument_data.engine,
+        output_format=argument_data.output_format,
     )
@@ -7,23 +7,30 @@ The Default Input Reader.
  - The Name String is the name of the line.
 """
 from sys import exit
-from typing import Generator
+from typing import Generator, Iterable
 
-from .string_validation import validate_dir_name, validate_name
 from .tree_data import TreeData
 
 
 _INVALID_DEPTH_ERROR_MSG = "Invalid Indentation (Number of Spaces) in Line: "
 _INVALID_NODE_NAME_ERROR_MSG = "Invalid Name in Line: "
 
+_SLASH_CHARS = '/\\'
+
+# Creates TreeData without calling the NamedTuple constructor.
+_new_tuple = tuple.__new__
+
 
 def read_input_tree(
-    input_tree_data: str
+    input_tree_data: str | Iterable[str],
+    first_line_number: int = 1,
 ) -> Generator[TreeData, None, None]:
-    """ Generate structured Tree Data from the Input Data String.
+    """ Generate structured Tree Data from the Input Data String, or an Iterable of lines.
+ - An open file handle may be given, so that lines are read incrementally.
 
 **Parameters:**
- - input_tree_data (str): The Input string, which should contain TreeScript.
+ - input_tree_data (str | Iterable[str]): The Input string or lines, which should contain TreeScript.
+ - first_line_number (int): The line number of the first line, when reading part of a file. Default: 1.
 
 **Yields:**
  TreeData - Produces TreeData from the Input Data.
@@ -31,10 +38,12 @@ def read_input_tree(
 **Raises:**
  SystemExit - When any Line cannot be read as TreeScript successfully.
     """
-    for line_number, line in enumerate(input_tree_data.splitlines(), start=1):
-        if len(lstr := line.lstrip()) == 0 or lstr.startswith('#'):
+    if isinstance(input_tree_data, str):
+        input_tree_data = input_tree_data.splitlines()
+    for line_number, line in enumerate(input_tree_data, start=first_line_number):
+        if len(stripped := line.lstrip()) == 0 or stripped[0] == '#':
             continue
-        yield _process_line(line_number, line)
+        yield _tokenize_line(line_number, line, stripped)
 
 
 def _process_line(
@@ -54,65 +63,46 @@ def _process_line(
 **Raises:**
  SystemExit - When Line cannot be read successfully.
     """
-    # Remove Leading Spaces (and trailing)
-    if chr(32) in (args := line.strip()):
-        args = args.split(chr(32))  # Split line into words.
-        name = args[0]  # First Word is the Tree Node Name.
-        # Additional Words are ignored.
-        is_dir, node_name = _validate_node_name(line_number, name)
-    else:  # Was Not Split
-        is_dir, node_name = _validate_node_name(line_number, args)
-    return TreeData(
-        line_number=line_number,
-        depth=_calculate_depth(line_number, line),
-        is_dir=is_dir,
-        name=node_name,
-    )
-
-
-def _validate_node_name(
+    return _tokenize_line(line_number, line, line.lstrip())
+
+
+def _tokenize_line(
     line_number: int,
-    node_name: str,
-) -> tuple[bool, str]:
-    """ Determine whether this Tree Node is a Directory, and validate the name.
+    line: str,
+    stripped: str,
+) -> TreeData:
+    """ Determine the depth, node type, and name of a line, in a single pass.
+ - Gives the same results and errors as the Directory and File name validation in String Validation.
+ - The name is validated before the depth.
 
 **Parameters:**
- - line_number (int): Identifies the line in the input tree.
- - node_name (str): The argument received for the node name.
+ - line_number (int): The number for future reference.
+ - line (str): A line from the input tree structure.
+ - stripped (str): The line, with the leading whitespace removed.
 
 **Returns:**
- tuple[bool, str] - Node information: is a directory, name of node.
+ TreeData - The Tree Node of the line.
 
 **Raises:**
- SystemExit - When the directory name is invalid.
+ SystemExit - When Line cannot be read successfully.
     """
-    try: # Check if the line contains any slash characters
-        if (dir_name := validate_dir_name(node_name)) is not None:
-            return True, dir_name
-        # Fall-Through to File Node
-    except ValueError: # An error in the dir name validation method, such that it cannot be a file either
+    # The first word is the name, additional words are ignored.
+    if (space := (name := stripped.rstrip()).find(' ')) != -1:
+        name = name[:space]
+    if not 0 < len(name) < 100:
         exit(_INVALID_NODE_NAME_ERROR_MSG + str(line_number))
-    if not validate_name(node_name):
+    if '/' not in name and '\\' not in name:
+        is_dir = False
+    # A Directory has one kind of slash char, at either end of the name
+    elif ((slash := name[-1]) in _SLASH_CHARS or (slash := name[0]) in _SLASH_CHARS) \
+            and _SLASH_CHARS.replace(slash, '') not in name \
+            and slash not in (name := name.strip(slash)) \
+            and len(name) > 0 and name != '.' and name != '..':
+        is_dir = True
+    else:
         exit(_INVALID_NODE_NAME_ERROR_MSG + str(line_number))
-    return False, node_name # Is a FileNode
-
-
-def _calculate_depth(
-    line_number: int,
-    line: str
-) -> int:
-    """ Calculates the depth of a line in the tree structure.
-
-**Parameters:**
- - line_number (int): The LineNumber used for debugging invalid line indentation.
- - line (str): A line from the tree command output.
-
-**Returns:**
- int - The depth of the line in the tree structure, or -1 if space count is invalid.
-    """
-    space_count = len(line) - len(line.lstrip())
-    # Bit Shift Shuffle Equivalence Validation (space_count is divisible by 2)
-    if (depth := space_count >> 1) << 1 != space_count:
-        # Invalid Space Count! Someone made an off-by-one whitespace mistake!
+    # Two space characters per unit of depth
+    if (space_count := len(line) - len(stripped)) & 1:
         exit(_INVALID_DEPTH_ERROR_MSG + str(line_number))
-    return depth
+    return _new_tuple(TreeData, (line_number, space_count >> 1, is_dir, name))
+
@@ -0,0 +1,263 @@
+""" Materializer.
+
+Creates the Directories and empty Files described by a TreeScript on disk.
+ - Each Directory is created once, in the order the PathStack pushes it, so its parent always exists.
+ - Files are created by a pool of threads, in batches, because creating a file is bound by I/O.
+ - A File that already exists is touched, unless existing Files are skipped.
+ - A dry run only checks which Directories and Files exist, without writing.
+"""
+from os import path as os_path
+from sys import exit
+from typing import TYPE_CHECKING, BinaryIO, Iterable, NamedTuple, TextIO
+
+from treescript_files.path_stack import PathStack
+from treescript_files.tree_data import TreeData
+
+if TYPE_CHECKING:
+    from treescript_files.input_data import InputData
+
+
+_FILE_BATCH_SIZE = 256 # The number of Files created by each thread task
+_CREATE_FAILED_MSG = "Failed to create: "
+
+
+class MaterializeResult(NamedTuple):
+    """ The number of Directories and Files created, or found to exist.
+
+**Fields:**
+ - dirs_created (int): The Directories that were created, or would be created in a dry run.
+ - dirs_existing (int): The Directories that already existed.
+ - files_created (int): The Files that were created, or would be created in a dry run.
+ - files_existing (int): The Files that already existed.
+    """
+    dirs_created: int
+    dirs_existing: int
+    files_created: int
+    files_existing: int
+
+
+def materialize_tree(
+    tree_data: Iterable[TreeData],
+    root: str,
+    skip_existing: bool = False,
+    dry_run: bool = False,
+    max_workers: int | None = None,
+) -> MaterializeResult:
+    """ Create the Directories and empty Files of a Tree, under a root Directory.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The TreeData of each node, in TreeScript order.
+ - root (str): The Directory to create the Tree in. It is created if it does not exist.
+ - skip_existing (bool): Whether to leave existing Files unchanged, instead of updating their modification time. Default: False.
+ - dry_run (bool): Whether to only count the Directories and Files that would be created. Default: False.
+ - max_workers (int?): The number of threads creating Files, or None for the ThreadPoolExecutor default.
+
+**Returns:**
+ MaterializeResult - The number of Directories and Files created, and found to exist.
+
+**Raises:**
+ SystemExit - If the depth jumps, or a Directory or File could not be created.
+    """
+    from os import makedirs
+    if not dry_run:
+        try:
+            makedirs(root, exist_ok=True)
+        except OSError:
+            exit(_CREATE_FAILED_MSG + root)
+    create_dir = _check_dir if dry_run else _create_dir
+    create_files = _check_files if dry_run else _create_files
+    path_stack = PathStack(_format_root(root))
+    # Paths seen in this run, so a repeated Directory is not created again
+    known_dirs = set()
+    dir_counts = [0, 0]
+    file_counts = [0, 0]
+    batch = []
+    with _FileCreator(create_files, skip_existing, max_workers, file_counts) as creator:
+        for tree_node in tree_data:
+            if (delta := tree_node.depth - path_stack.get_depth()) > 0:
+                exit(f'You have jumped {delta} steps in the tree on line: {tree_node.line_number}')
+            elif delta < 0:
+                path_stack.reduce_depth(tree_node.depth)
+            if tree_node.is_dir:
+                path_stack.push(tree_node.name)
+                if (dir_path := path_stack.join_stack()) not in known_dirs:
+                    known_dirs.add(dir_path)
+                    dir_counts[0 if create_dir(dir_path) else 1] += 1
+                continue
+            batch.append(path_stack.join_stack() + tree_node.name)
+            if len(batch) >= _FILE_BATCH_SIZE:
+                creator.submit(batch)
+                batch = []
+        if len(batch) > 0:
+            creator.submit(batch)
+    return MaterializeResult(dir_counts[0], dir_counts[1], file_counts[0], file_counts[1])
+
+
+def write_materialize_report(
+    input_data: 'InputData',
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> int:
+    """ Materialize the Tree of the InputData, and write a summary of the counts into the output.
+
+**Parameters:**
+ - input_data (InputData): The program input data, with a materialize root.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the summary into.
+ - encoding (str): The encoding used when the output stream is binary. Default: utf-8.
+
+**Returns:**
+ int - The number of Files created.
+
+**Raises:**
+ SystemExit - If the Parent Path is absolute, the TreeScript is invalid, or a Directory or File could not be created.
+    """
+    from io import TextIOBase
+    from treescript_files.line_reader import read_input_tree
+    tree_data = read_input_tree(input_data.tree_input)
+    if input_data.tree_filter is not None:
+        from treescript_files.tree_filter import filter_tree_data
+        tree_data = filter_tree_data(tree_data, input_data.tree_filter)
+    root = input_data.materialize_root
+    if input_data.parent_path is not None:
+        from treescript_files.tree_reader import _join_parent_root
+        root = _join_parent_root(root, input_data.parent_path)
+    result = materialize_tree(
+        tree_data=tree_data,
+        root=root,
+        skip_existing=input_data.skip_existing,
+        dry_run=input_data.dry_run,
+        max_workers=input_data.jobs,
+    )
+    verb = 'Would create' if input_data.dry_run else 'Created'
+    report = f'{verb} {result.dirs_created} directories and {result.files_created} files in {root} ' \
+        f'({result.dirs_existing} directories and {result.files_existing} files already existed).\n'
+    output_stream.write(report if isinstance(output_stream, TextIOBase) else report.encode(encoding))
+    return result.files_created
+
+
+class _FileCreator:
+    """ Creates batches of Files in a thread pool, with a limited number of batches in progress.
+    """
+
+    def __init__(self, create_files, skip_existing: bool, max_workers: int | None, file_counts: list[int]):
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+        self._create_files = create_files
+        self._skip_existing = skip_existing
+        self._file_counts = file_counts
+        if max_workers is None:
+            from os import cpu_count
+            # The ThreadPoolExecutor default, for I/O bound work
+            max_workers = min(32, (cpu_count() or 1) + 4)
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._max_pending = self._max_workers * 2
+        self._pending = deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                while len(self._pending) > 0:
+                    self._take_result()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def submit(self, batch: list[str]):
+        self._pending.append(self._executor.submit(self._create_files, batch, self._skip_existing))
+        if len(self._pending) > self._max_pending:
+            self._take_result()
+
+    def _take_result(self):
+        created, existing, failed_path = self._pending.popleft().result()
+        self._file_counts[0] += created
+        self._file_counts[1] += existing
+        if failed_path is not None:
+            exit(_CREATE_FAILED_MSG + failed_path)
+
+
+def _create_dir(
+    dir_path: str,
+) -> bool:
+    """ Create a Directory, whose parent exists.
+
+**Returns:**
+ bool - True if the Directory was created, False if it already existed.
+
+**Raises:**
+ SystemExit - If the Directory could not be created.
+    """
+    from os import mkdir
+    try:
+        mkdir(dir_path)
+        return True
+    except FileExistsError:
+        if os_path.isdir(dir_path):
+            return False
+    except OSError:
+        pass
+    exit(_CREATE_FAILED_MSG + dir_path)
+
+
+def _check_dir(
+    dir_path: str,
+) -> bool:
+    """ Determine whether a Directory would be created.
+    """
+    return not os_path.isdir(dir_path)
+
+
+def _create_files(
+    file_paths: list[str],
+    skip_existing: bool,
+) -> tuple[int, int, str | None]:
+    """ Create a batch of empty Files, in a worker thread.
+
+**Parameters:**
+ - file_paths (list[str]): The paths of the Files to create.
+ - skip_existing (bool): Whether to leave existing Files unchanged, instead of updating their modification time.
+
+**Returns:**
+ tuple[int, int, str?] - The number of Files created, the number that existed, and the first path that failed or None.
+    """
+    from os import utime
+    created = existing = 0
+    for file_path in file_paths:
+        try:
+            with open(file_path, 'xb'):
+                pass
+            created += 1
+            continue
+        except FileExistsError:
+            if os_path.isdir(file_path):
+                return created, existing, file_path
+            existing += 1
+        except OSError:
+            return created, existing, file_path
+        if not skip_existing:
+            try:
+                utime(file_path)
+            except OSError:
+                return created, existing, file_path
+    return created, existing, None
+
+
+def _check_files(
+    file_paths: list[str],
+    skip_existing: bool,
+) -> tuple[int, int, str | None]:
+    """ Count the Files in a batch that would be created, and those that exist.
+    """
+    existing = sum(1 for file_path in file_paths if os_path.lexists(file_path))
+    return len(file_paths) - existing, existing, None
+
+
+def _format_root(
+    root: str,
+) -> str:
+    """ Format the root Directory as the prefix of each path, ending with the OS separator.
+    """
+    from os import sep
+    return root if root.endswith(sep) else root + sep
@@ -0,0 +1,57 @@
+""" Output Writer Methods.
+ - Streams file path strings into a file-like object, in buffered chunks.
+ - The Separator is applied between paths as they are written.
+"""
+from io import TextIOBase
+from typing import BinaryIO, Iterable, TextIO
+
+
+_CHUNK_SIZE = 1024 # The number of paths joined into each write call
+
+
+def write_paths(
+    paths: Iterable[str],
+    output_stream: BinaryIO | TextIO,
+    separator: str = '\n',
+    encoding: str = 'utf-8',
+    chunk_size: int = _CHUNK_SIZE,
+) -> int:
+    """ Write the path strings to the output stream, as they are produced.
+ - The output matches print(separator.join(paths)), including the final newline.
+ - A NUL separator also ends the last path, like find -print0, and nothing is written when there are no paths.
+ - Binary streams receive encoded bytes, Text streams receive str.
+ - Each chunk of paths is joined and encoded once, and written in a single call.
+
+**Parameters:**
+ - paths (Iterable[str]): The path strings to write.
+ - output_stream (BinaryIO | TextIO): The file-like object to write into.
+ - separator (str): The separator to place between paths. Default: Newline.
+ - encoding (str): The encoding used for Binary streams. Default: utf-8.
+ - chunk_size (int): The number of paths to buffer before each write.
+
+**Returns:**
+ int - The number of paths written.
+    """
+    if isinstance(output_stream, TextIOBase):
+        write = output_stream.write
+    else:
+        def write(text: str):
+            output_stream.write(text.encode(encoding))
+    # NUL separated output is read by xargs -0, where a newline would become part of the last path
+    terminator = '\0' if separator == '\0' else '\n'
+    count = 0
+    leading = ''
+    pending = []
+    for path in paths:
+        pending.append(path)
+        if len(pending) >= chunk_size:
+            write(leading + separator.join(pending))
+            count += len(pending)
+            leading = separator
+            pending.clear()
+    if len(pending) > 0:
+        write(leading + separator.join(pending) + terminator)
+        count += len(pending)
+    elif count > 0 or terminator == '\n':
+        write(terminator)
+    return count
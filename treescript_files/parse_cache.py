@@ -0,0 +1,346 @@
+""" Parse Cache.
+
+An optional on-disk cache of the program output, keyed by the TreeScript content.
+ - The key is a hash of the Tree File bytes, parent path, separator, filter patterns, and output encoding.
+ - A cache hit streams the stored output, without decoding or parsing the TreeScript.
+ - On a miss, the bytes that are parsed are hashed again, and the entry is only stored if they match the key.
+ - Entries are written to a temporary file and atomically renamed, so concurrent runs are safe.
+ - The least recently used entries are evicted when the cache exceeds its size limit.
+ - Temporary files left by a killed run are removed once they are stale.
+ - Entries are stored under a versioned directory, so parser changes invalidate old entries.
+"""
+from os import path as os_path
+from typing import TYPE_CHECKING, BinaryIO, Generator, TextIO
+
+if TYPE_CHECKING:
+    from treescript_files.input_data import InputData
+
+
+# Increment this whenever the parser output changes, to invalidate existing entries.
+_CACHE_FORMAT_VERSION = 1
+_CACHE_DIR_ENV_VAR = 'TREESCRIPT_FILES_CACHE_DIR'
+
+_ENTRY_HEADER = b'treescript-files-cache %d %020d\n'
+_ENTRY_HEADER_SIZE = len(_ENTRY_HEADER % (0, 0))
+_READ_CHUNK_SIZE = 1024**2
+_STALE_TEMP_SECONDS = 3600 # The age of a temporary file that no running process is writing
+
+
+def write_cached_files(
+    input_data: 'InputData',
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> int:
+    """ Write the Files of the InputData using the cache, storing the output on a cache miss.
+ - The Cache is skipped when it cannot be read or written, so it never causes a failure.
+ - The Tree File bytes are hashed before anything is decoded, so a hit only reads the File once.
+ - On a miss, the File is parsed from the bytes that are hashed again, so the entry belongs to the text that is parsed.
+
+**Parameters:**
+ - input_data (InputData): The program input data, with a tree_file and a cache_dir.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the Files into.
+ - encoding (str): The encoding of the output. Default: utf-8.
+
+**Returns:**
+ int - The number of Files written.
+    """
+    from treescript_files.output_writer import write_paths
+    from treescript_files.tree_reader import process_input_data
+    entry_dir = os_path.join(input_data.cache_dir, f'v{_CACHE_FORMAT_VERSION}')
+    try:
+        entry_key = _hash_file(input_data.tree_file, _options_digest(input_data, encoding)).hexdigest()
+        entry_path = os_path.join(entry_dir, entry_key)
+        if (count := _read_entry(entry_path, output_stream, encoding)) is not None:
+            return count
+        from os import makedirs
+        from tempfile import NamedTemporaryFile
+        makedirs(entry_dir, exist_ok=True)
+        entry_file = NamedTemporaryFile(dir=entry_dir, prefix='.tmp-', delete=False)
+        # The header is rewritten with the File count once the output is complete
+        entry_file.write(_ENTRY_HEADER % (_CACHE_FORMAT_VERSION, 0))
+    except OSError:
+        return write_paths(process_input_data(input_data), output_stream, input_data.separator, encoding)
+    parsed_digest = _options_digest(input_data, encoding)
+    if input_data.engine == 'text':
+        from dataclasses import replace
+        input_data = replace(
+            input_data,
+            tree_input=_read_hashed_lines(input_data.tree_file, input_data.file_size_limit, parsed_digest),
+        )
+    tee_stream = _TeeStream(output_stream, entry_file, encoding)
+    try:
+        count = write_paths(
+            paths=process_input_data(input_data),
+            output_stream=tee_stream,
+            separator=input_data.separator,
+            encoding=encoding,
+        )
+    except BaseException:
+        entry_file.close()
+        _remove_file(entry_file.name)
+        raise
+    try:
+        with entry_file:
+            if input_data.engine != 'text':
+                # The bytes engine maps the File, so it is hashed again once the parse is done
+                _hash_file(input_data.tree_file, parsed_digest)
+            if tee_stream.entry_failed:
+                raise OSError('The cache entry could not be written.')
+            if parsed_digest.hexdigest() != entry_key:
+                raise OSError('The Tree File changed while it was parsed.')
+            entry_file.seek(0)
+            entry_file.write(_ENTRY_HEADER % (_CACHE_FORMAT_VERSION, count))
+        from os import replace
+        replace(entry_file.name, entry_path)
+    except OSError:
+        _remove_file(entry_file.name)
+        return count
+    _evict_entries(entry_dir, input_data.cache_size_limit)
+    return count
+
+
+def get_cache_dir(
+    cache_dir: str | None,
+) -> str | None:
+    """ Determine the Cache directory from the argument, or the environment variable.
+
+**Parameters:**
+ - cache_dir (str?): The Cache directory argument, or None.
+
+**Returns:**
+ str? - The Cache directory, or None if caching is disabled.
+    """
+    if cache_dir is not None:
+        return cache_dir
+    from os import environ
+    if len(env_dir := environ.get(_CACHE_DIR_ENV_VAR, '').strip()) > 0:
+        return env_dir
+    return None
+
+
+class _TeeStream:
+    """ A binary stream that writes to the output stream and a cache entry file.
+ - When the entry file fails, writing continues to the output stream only.
+    """
+
+    def __init__(self, output_stream: BinaryIO | TextIO, entry_file: BinaryIO, encoding: str):
+        from io import TextIOBase
+        self._output_stream = output_stream
+        self._entry_file = entry_file
+        self._encoding = encoding
+        self._is_text = isinstance(output_stream, TextIOBase)
+        self.entry_failed = False
+
+    def write(self, data: bytes):
+        self._output_stream.write(data.decode(self._encoding) if self._is_text else data)
+        if not self.entry_failed:
+            try:
+                self._entry_file.write(data)
+            except OSError:
+                self.entry_failed = True
+
+
+class _HashingStream:
+    """ A binary stream that hashes the bytes read from a File.
+ - Supports read for the decompressors, and read1 for the stream line reader.
+    """
+
+    def __init__(self, stream: BinaryIO, digest):
+        self._stream = stream
+        self._digest = digest
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        self._digest.update(data := self._stream.read(size))
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        self._digest.update(data := self._stream.read1(size))
+        return data
+
+
+def _options_digest(
+    input_data: 'InputData',
+    encoding: str,
+):
+    """ Start the hash of a cache key with the output options.
+
+**Parameters:**
+ - input_data (InputData): The program input data.
+ - encoding (str): The encoding of the output.
+
+**Returns:**
+ hashlib._Hash - The sha256 digest, to be updated with the Tree File bytes.
+    """
+    from hashlib import sha256
+    digest = sha256()
+    tree_filter = input_data.tree_filter
+    for option in (
+        _CACHE_FORMAT_VERSION, input_data.parent_path, input_data.separator, encoding,
+        None if tree_filter is None else (tree_filter.include, tree_filter.exclude),
+    ):
+        digest.update(repr(option).encode() + b'\0')
+    return digest
+
+
+def _hash_file(
+    file_name: str,
+    digest,
+):
+    """ Update the digest with the bytes of a File, read in chunks.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File.
+ - digest (hashlib._Hash): The digest to update.
+
+**Returns:**
+ hashlib._Hash - The updated digest.
+
+**Raises:**
+ OSError - If the File could not be read.
+    """
+    with open(file_name, 'rb') as file:
+        while len(chunk := file.read(_READ_CHUNK_SIZE)) > 0:
+            digest.update(chunk)
+    return digest
+
+
+def _read_hashed_lines(
+    file_name: str,
+    file_size_limit: int | None,
+    digest,
+) -> Generator[str, None, None]:
+    """ Read the lines of the Tree File, and hash its bytes as they are read.
+ - A compressed File is decompressed, and the compressed bytes are hashed.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File.
+ - file_size_limit (int?): The maximum number of bytes read, or decompressed, or None for no limit.
+ - digest (hashlib._Hash): The digest to update with the File bytes.
+
+**Yields:**
+ str - Each line of the File, including the line ending.
+
+**Raises:**
+ SystemExit - If the File is too large, is empty or blank, or read failed.
+    """
+    from locale import getpreferredencoding
+    from treescript_files.file_validation import _FILE_READ_OSERROR_MSG, _detect_compression, _read_compressed_lines, read_stream_lines
+    compression = _detect_compression(file_name)
+    try:
+        file = open(file_name, 'rb')
+    except OSError:
+        from sys import exit
+        exit(_FILE_READ_OSERROR_MSG)
+    with file:
+        stream = _HashingStream(file, digest)
+        if compression is not None:
+            yield from _read_compressed_lines(stream, compression, file_size_limit)
+        else:
+            # The encoding that open() uses for the File
+            yield from read_stream_lines(stream, file_size_limit, getpreferredencoding(False))
+        try:
+            # Bytes after the end of the compressed data are part of the key too
+            while len(stream.read(_READ_CHUNK_SIZE)) > 0:
+                pass
+        except OSError:
+            digest.update(b'\0')
+
+
+def _read_entry(
+    entry_path: str,
+    output_stream: BinaryIO | TextIO,
+    encoding: str,
+) -> int | None:
+    """ Stream a cache entry into the output, if it exists and is valid.
+ - The entry modification time is updated, which orders entries for eviction.
+
+**Parameters:**
+ - entry_path (str): The path of the cache entry.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the Files into.
+ - encoding (str): The encoding of the output.
+
+**Returns:**
+ int? - The number of Files written, or None on a cache miss.
+    """
+    try:
+        entry_file = open(entry_path, 'rb')
+    except OSError:
+        return None
+    with entry_file:
+        header = entry_file.read(_ENTRY_HEADER_SIZE).split()
+        if len(header) != 3 or header[:2] != (_ENTRY_HEADER % (_CACHE_FORMAT_VERSION, 0)).split()[:2]:
+            return None
+        try:
+            count = int(header[2])
+        except ValueError:
+            return None
+        from io import TextIOBase, TextIOWrapper
+        if isinstance(output_stream, TextIOBase):
+            # Decode incrementally, so that characters split between chunks are preserved
+            entry_file = TextIOWrapper(entry_file, encoding=encoding, newline='')
+        while len(chunk := entry_file.read(_READ_CHUNK_SIZE)) > 0:
+            output_stream.write(chunk)
+    try:
+        from os import utime
+        utime(entry_path)
+    except OSError:
+        pass
+    return count
+
+
+def _evict_entries(
+    entry_dir: str,
+    size_limit: int,
+):
+    """ Remove the least recently used entries, until the Cache is within the size limit.
+ - Entries removed by a concurrent run are ignored.
+ - Temporary files older than an hour were left by a killed run, and are removed.
+
+**Parameters:**
+ - entry_dir (str): The directory containing cache entries.
+ - size_limit (int): The maximum total size of the entries in bytes.
+    """
+    from os import scandir
+    from time import time
+    stale_time = time() - _STALE_TEMP_SECONDS
+    entries = []
+    total_size = 0
+    try:
+        with scandir(entry_dir) as directory:
+            for entry in directory:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                if entry.name.startswith('.tmp-'):
+                    # A temporary file of a killed run is never renamed into an entry
+                    if stat.st_mtime < stale_time:
+                        _remove_file(entry.path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+    except OSError:
+        return
+    if total_size <= size_limit:
+        return
+    for _, size, entry_path in sorted(entries):
+        _remove_file(entry_path)
+        if (total_size := total_size - size) <= size_limit:
+            break
+
+
+def _remove_file(
+    file_path: str,
+):
+    """ Remove a file, ignoring errors.
+
+**Parameters:**
+ - file_path (str): The path of the file to remove.
+    """
+    from os import remove
+    try:
+        remove(file_path)
+    except OSError:
+        pass
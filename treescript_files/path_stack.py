@@ -1,10 +1,11 @@
 """ Path Stack Management.
 """
-from pathlib import Path
+from os import sep
 
 
 class PathStack:
     """ A Stack of Directory names in a Path.
+ - The joined directory prefix is cached for every depth level.
 
 **Method Summary:**
  - push(str)
@@ -13,9 +14,22 @@ class PathStack:
  - get_depth: int
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        root: str = '',
+        path_separator: str = sep,
+    ):
+        """ Initialize an empty Path Stack.
+
+        **Parameters:**
+        - root (str): The prefix of every path, such as a parent directory ending with a separator. Default: Empty.
+        - path_separator (str): The separator placed after each directory name.
+        """
         # The Stack of Directories in the Path.
         self._stack: list[str] = []
+        # The joined Path prefix at each depth, starting with the root.
+        self._prefixes: list[str] = [root]
+        self._separator = path_separator
 
     def push(self, directory_name: str):
         """ Push a directory to the Path Stack.
@@ -25,16 +39,16 @@ class PathStack:
         - directory_name (str): The name of the next directory in the Path Stack.
         """
         self._stack.append(directory_name)
+        self._prefixes.append(self._prefixes[-1] + directory_name + self._separator)
 
-    def join_stack(self, path_separator: str = str(Path('a/b'))[1]) -> str:
+    def join_stack(self) -> str:
         """ Combines all elements in the Stack to form a parent directory.
+        - The prefix is cached when each directory is pushed, so this is constant time.
 
         **Returns:**
-        str - representing the current directory.
+        str - representing the current directory, including the root.
         """
-        if len(self._stack) == 0:
-            return ""
-        return f"{path_separator.join(self._stack)}{path_separator}"
+        return self._prefixes[-1]
 
     def reduce_depth(self, depth: int) -> bool:
         """ Reduce the Depth of the Path Stack.
@@ -50,8 +64,8 @@ class PathStack:
             return True
         if current_depth < depth or depth < 0:
             return False
-        for _ in range(current_depth, depth, -1):
-            self._stack.pop()
+        del self._stack[depth:]
+        del self._prefixes[depth + 1:]
         return True
 
     def get_depth(self) -> int:
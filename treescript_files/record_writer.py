@@ -0,0 +1,117 @@
+""" Record Writer.
+
+Writes one JSON record per Tree Node, for tools that need more than the file paths.
+ - Each record holds the path, name, parent path, node type, depth, and line number of a Directory or File.
+ - Records are streamed as JSON Lines, or as the elements of a JSON array.
+ - Strings are escaped by the C accelerated json encoder, and each record is filled into a template.
+ - The escaped parent path is reused by every node in a Directory, and is joined to each escaped name.
+"""
+from os import sep
+from sys import exit
+from typing import TYPE_CHECKING, BinaryIO, Generator, Iterable, TextIO
+
+from treescript_files.path_stack import PathStack
+from treescript_files.tree_data import TreeData
+
+if TYPE_CHECKING:
+    from treescript_files.input_data import InputData
+
+
+_RECORD_TEMPLATE = '{"path":%s,"name":%s,"parent":%s,"is_dir":%s,"depth":%d,"line_number":%d}'
+_JSON_BOOLEANS = ('false', 'true')
+
+
+def generate_tree_records(
+    tree_data: Iterable[TreeData],
+    root: str = '',
+    path_separator: str = sep,
+) -> Generator[str, None, None]:
+    """ Generate the JSON record of each Directory and File, in TreeScript order.
+ - Directory paths do not end with a separator. The parent of a top-level node is the root, or an empty string.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The TreeData of each node, in TreeScript order.
+ - root (str): The prefix for every path, ending with the path separator, or empty. Default: Empty.
+ - path_separator (str): The separator placed between names in each path. Default: The OS separator.
+
+**Yields:**
+ str - The JSON object of each node, without a line break.
+
+**Raises:**
+ SystemExit - When the depth increases by more than one level.
+    """
+    from json.encoder import encode_basestring
+    path_stack = PathStack(root, path_separator)
+    prefix = None
+    for node in tree_data:
+        if (delta := node.depth - path_stack.get_depth()) > 0:
+            exit(f'You have jumped {delta} steps in the tree on line: {node.line_number}')
+        elif delta < 0:
+            path_stack.reduce_depth(node.depth)
+        # The prefix is cached by the PathStack, so it is only escaped again when the Directory changes
+        if path_stack.join_stack() is not prefix:
+            prefix = path_stack.join_stack()
+            # A JSON string can be split between characters, so the escaped prefix is joined to each escaped name
+            open_prefix = encode_basestring(prefix)[:-1]
+            parent = encode_basestring(prefix[:-1])
+        name = encode_basestring(node.name)
+        yield _RECORD_TEMPLATE % (
+            open_prefix + name[1:], name, parent, _JSON_BOOLEANS[node.is_dir], node.depth, node.line_number,
+        )
+        if node.is_dir:
+            path_stack.push(node.name)
+
+
+def write_tree_records(
+    input_data: 'InputData',
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> int:
+    """ Write the JSON record of each node in the Tree Input, as JSON Lines or as a JSON array.
+
+**Parameters:**
+ - input_data (InputData): The program input data.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the records into.
+ - encoding (str): The encoding used when the output stream is binary. Default: utf-8.
+
+**Returns:**
+ int - The number of records written.
+
+**Raises:**
+ SystemExit - If the TreeScript is invalid.
+    """
+    from treescript_files.output_writer import write_paths
+    from treescript_files.tree_reader import _format_parent_prefix
+    tree_data = input_data.get_tree_data()
+    if input_data.tree_filter is not None:
+        from treescript_files.tree_filter import filter_tree_data
+        tree_data = filter_tree_data(tree_data, input_data.tree_filter)
+    records = generate_tree_records(
+        tree_data, '' if input_data.parent_path is None else _format_parent_prefix(input_data.parent_path),
+    )
+    if input_data.output_format != 'json':
+        return write_paths(records, output_stream, '\n', encoding)
+    if (first := next(records, None)) is None:
+        write_paths(('[]',), output_stream, '\n', encoding)
+        return 0
+    return write_paths(_json_array(first, records), output_stream, ',\n', encoding)
+
+
+def _json_array(
+    first: str,
+    records: Iterable[str],
+) -> Generator[str, None, None]:
+    """ Add the brackets of a JSON array to the records, so that they can be written with a comma separator.
+
+**Parameters:**
+ - first (str): The first JSON record.
+ - records (Iterable[str]): The JSON records after the first.
+
+**Yields:**
+ str - The records, with the opening bracket before the first, and the closing bracket after the last.
+    """
+    previous = '[\n' + first
+    for record in records:
+        yield previous
+        previous = record
+    yield previous + '\n]'
@@ -0,0 +1,214 @@
+""" Run Statistics.
+
+Instrumentation for the --stats option.
+ - Measures the wall time of each stage: read, parse, build, and write.
+ - Counts lines, comments, blank lines, directories, files, paths written, and the max depth.
+ - Reports bytes read, bytes written, and the peak memory of the process.
+ - The instrumented pipeline is only assembled when stats are requested, so the default path has no overhead.
+"""
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import BinaryIO, Generator, Iterable, TextIO, TypeVar
+
+from treescript_files.input_data import InputData
+from treescript_files.tree_data import TreeData
+
+
+_STAGES = ('read', 'parse', 'build', 'write')
+
+T = TypeVar('T')
+
+
+@dataclass
+class RunStats:
+    """ The Statistics collected while processing a TreeScript.
+
+**Fields:**
+ - stage_seconds (dict[str, float]): The wall time spent in each stage.
+ - total_seconds (float): The total wall time.
+ - lines (int): The number of lines read.
+ - comments (int): The number of comment lines skipped.
+ - blank_lines (int): The number of blank lines skipped.
+ - dirs (int): The number of directory nodes.
+ - files (int): The number of file nodes.
+ - paths (int): The number of file paths written, after the Include and Exclude patterns.
+ - max_depth (int): The greatest depth of any node.
+ - bytes_read (int): The number of UTF-8 bytes in the lines that were read.
+ - bytes_written (int): The number of encoded bytes written to the output.
+ - peak_memory (int?): The peak resident memory of the process in bytes, or None if unavailable.
+    """
+    stage_seconds: dict[str, float] = field(default_factory=lambda: dict.fromkeys(_STAGES, 0.0))
+    total_seconds: float = 0.0
+    lines: int = 0
+    comments: int = 0
+    blank_lines: int = 0
+    dirs: int = 0
+    files: int = 0
+    paths: int = 0
+    max_depth: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    peak_memory: int | None = None
+
+    def format_report(self) -> str:
+        """ Format the Statistics as a multi-line report.
+
+**Returns:**
+ str - The report text, without a trailing newline.
+        """
+        report = ['TreeScript Files Stats:']
+        for stage in _STAGES:
+            report.append(f' {stage + ":":<15}{self.stage_seconds[stage] * 1000:12.3f} ms')
+        report.append(f' {"total:":<15}{self.total_seconds * 1000:12.3f} ms')
+        for name, value in (
+            ('lines', self.lines),
+            ('comments', self.comments),
+            ('blank lines', self.blank_lines),
+            ('dirs', self.dirs),
+            ('files', self.files),
+            ('paths', self.paths),
+            ('max depth', self.max_depth),
+            ('bytes read', self.bytes_read),
+            ('bytes written', self.bytes_written),
+        ):
+            report.append(f' {name + ":":<15}{value:12,}')
+        peak_memory = 'n/a' if self.peak_memory is None else f'{self.peak_memory / 1024**2:,.1f} MB'
+        report.append(f' {"peak memory:":<15}{peak_memory:>12}')
+        return '\n'.join(report)
+
+
+def write_ts_files_with_stats(
+    input_data: InputData,
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> RunStats:
+    """ Convert the TreeScript InputData into Files, while measuring each stage.
+ - Uses the sequential engine, so the stage timings are comparable between runs.
+ - The Include and Exclude patterns are applied to the parsed nodes, and counted in the build stage.
+
+**Parameters:**
+ - input_data (InputData): The program input data.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the Files into.
+ - encoding (str): The encoding used when the output stream is binary. Default: utf-8.
+
+**Returns:**
+ RunStats - The Statistics of the run.
+    """
+    from treescript_files.line_reader import read_input_tree
+    from treescript_files.output_writer import write_paths
+    from treescript_files.tree_reader import _format_parent_prefix, _process_tree_data
+    stats = RunStats()
+    start = perf_counter()
+    tree_input = input_data.tree_input
+    if isinstance(tree_input, str):
+        tree_input = tree_input.splitlines()
+    # Each stage's time includes the stages it pulls from, and is separated afterwards.
+    stage_totals = [0.0, 0.0, 0.0]
+    lines = _timed(_count_lines(tree_input, stats), stage_totals, 0)
+    nodes = _timed(_count_nodes(read_input_tree(lines), stats), stage_totals, 1)
+    if input_data.tree_filter is not None:
+        from treescript_files.tree_filter import filter_tree_data
+        nodes = filter_tree_data(nodes, input_data.tree_filter)
+    paths = _timed(
+        _process_tree_data(
+            nodes,
+            root='' if input_data.parent_path is None else _format_parent_prefix(input_data.parent_path),
+        ),
+        stage_totals,
+        2,
+    )
+    stats.paths = write_paths(
+        paths=paths,
+        output_stream=_CountingStream(output_stream, stats, encoding),
+        separator=input_data.separator,
+        encoding=encoding,
+    )
+    stats.total_seconds = perf_counter() - start
+    stats.stage_seconds['read'] = stage_totals[0]
+    stats.stage_seconds['parse'] = stage_totals[1] - stage_totals[0]
+    stats.stage_seconds['build'] = stage_totals[2] - stage_totals[1]
+    stats.stage_seconds['write'] = stats.total_seconds - stage_totals[2]
+    stats.peak_memory = _get_peak_memory()
+    return stats
+
+
+class _CountingStream:
+    """ A binary stream that counts the bytes written, and forwards them to the output stream.
+ - Text output streams receive the decoded str.
+    """
+
+    def __init__(self, output_stream: BinaryIO | TextIO, stats: RunStats, encoding: str):
+        from io import TextIOBase
+        self._output_stream = output_stream
+        self._stats = stats
+        self._encoding = encoding
+        self._is_text = isinstance(output_stream, TextIOBase)
+
+    def write(self, data: bytes):
+        self._stats.bytes_written += len(data)
+        self._output_stream.write(data.decode(self._encoding) if self._is_text else data)
+
+
+def _timed(
+    iterable: Iterable[T],
+    stage_totals: list[float],
+    stage_index: int,
+) -> Generator[T, None, None]:
+    """ Add the time spent producing each item to a stage total.
+    """
+    iterator = iter(iterable)
+    clock = perf_counter
+    while True:
+        start = clock()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            stage_totals[stage_index] += clock() - start
+            return
+        stage_totals[stage_index] += clock() - start
+        yield item
+
+
+def _count_lines(
+    lines: Iterable[str],
+    stats: RunStats,
+) -> Generator[str, None, None]:
+    """ Count the lines, comments, blank lines, and UTF-8 bytes read.
+    """
+    for line in lines:
+        stats.lines += 1
+        stats.bytes_read += len(line.encode('utf-8', 'replace'))
+        if len(stripped := line.lstrip()) == 0:
+            stats.blank_lines += 1
+        elif stripped[0] == '#':
+            stats.comments += 1
+        yield line
+
+
+def _count_nodes(
+    nodes: Iterable[TreeData],
+    stats: RunStats,
+) -> Generator[TreeData, None, None]:
+    """ Count the directories and files, and find the max depth.
+    """
+    for node in nodes:
+        if node.is_dir:
+            stats.dirs += 1
+        else:
+            stats.files += 1
+        if node.depth > stats.max_depth:
+            stats.max_depth = node.depth
+        yield node
+
+
+def _get_peak_memory() -> int | None:
+    """ Obtain the peak resident memory of this process in bytes, where the platform supports it.
+    """
+    try:
+        from resource import RUSAGE_SELF, getrusage
+    except ImportError:
+        return None
+    from sys import platform
+    max_rss = getrusage(RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return max_rss if platform == 'darwin' else max_rss * 1024
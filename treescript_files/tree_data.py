@@ -1,11 +1,11 @@
-""" Tree Node DataClass.
+""" Tree Node Data.
 """
-from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass(frozen=True)
-class TreeData:
-    """ A DataClass representing a Tree Node.
+class TreeData(NamedTuple):
+    """ A compact, immutable Tuple representing a Tree Node.
+ - One is created for every non-comment line, so it has no per-instance dict.
 
 **Fields:**
  - line_number (int): The LineNumber of the TreeData Node in the Input File.
@@ -0,0 +1,201 @@
+""" Tree Diff.
+
+Compares the Files of two TreeScripts, without building either list of file paths.
+ - Each Tree is parsed from its TreeData into Directory nodes, with sorted file names.
+ - Every Directory has a digest of the Files in its subtree, so identical subtrees are skipped in constant time.
+ - Directories without any Files in their subtree do not change the digest of their parent.
+ - The two Trees are walked in lockstep, merging the sorted names like a merge sort.
+ - Paths are only built for the Files that were added or removed.
+"""
+from hashlib import blake2b
+from os import sep
+from sys import exit
+from typing import TYPE_CHECKING, BinaryIO, Generator, Iterable, TextIO
+
+from treescript_files.tree_data import TreeData
+
+if TYPE_CHECKING:
+    from treescript_files.input_data import InputData
+
+
+_DIGEST_SIZE = 16
+_EMPTY_DIGEST = blake2b(digest_size=_DIGEST_SIZE).digest() # The digest of a subtree without Files
+_ADDED_PREFIX = '+ '
+_REMOVED_PREFIX = '- '
+
+
+class DiffDir:
+    """ A Directory node of a Tree being compared.
+
+**Fields:**
+ - files (tuple[str, ...]): The sorted, unique names of the Files in the Directory.
+ - dirs (dict[str, DiffDir]): The subdirectories, by name.
+ - digest (bytes): The digest of the File paths in the subtree, relative to this Directory.
+    """
+    __slots__ = ('files', 'dirs', 'digest')
+
+    def __init__(self):
+        self.files: list[str] | tuple[str, ...] = []
+        self.dirs: dict[str, DiffDir] = {}
+        self.digest = b''
+
+
+def build_diff_tree(
+    tree_data: Iterable[TreeData],
+) -> DiffDir:
+    """ Build the Directory nodes of a Tree, and the digest of every subtree.
+ - Directories with the same path are merged, and repeated Files are counted once.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The TreeData of each node, in TreeScript order.
+
+**Returns:**
+ DiffDir - The root Directory.
+
+**Raises:**
+ SystemExit - If the depth increases by more than one level.
+    """
+    root = DiffDir()
+    stack = [root]
+    for node in tree_data:
+        if (delta := node.depth - len(stack) + 1) > 0:
+            exit(f'You have jumped {delta} steps in the tree on line: {node.line_number}')
+        elif delta < 0:
+            del stack[node.depth + 1:]
+        parent = stack[-1]
+        if not node.is_dir:
+            parent.files.append(node.name)
+            continue
+        if (child := parent.dirs.get(node.name)) is None:
+            parent.dirs[node.name] = child = DiffDir()
+        stack.append(child)
+    _compute_digests(root)
+    return root
+
+
+def diff_trees(
+    old_root: DiffDir,
+    new_root: DiffDir,
+    parent_path: str | None = None,
+) -> Generator[tuple[bool, str], None, None]:
+    """ Walk two Trees in lockstep, and generate the Files that were added or removed.
+ - Within a Directory, Files are generated in name order, followed by the subdirectories in name order.
+
+**Parameters:**
+ - old_root (DiffDir): The root Directory of the old Tree.
+ - new_root (DiffDir): The root Directory of the new Tree.
+ - parent_path (str?): The ParentPath to prefix file paths with.
+
+**Yields:**
+ tuple[bool, str] - Whether the File was added, rather than removed, and its path.
+    """
+    from treescript_files.tree_reader import _format_parent_prefix
+    root = '' if parent_path is None else _format_parent_prefix(parent_path)
+    # Each frame is the old and new Directory, either of which may be absent, and the path prefix
+    stack: list[tuple[DiffDir | None, DiffDir | None, str]] = [(old_root, new_root, root)]
+    while len(stack) > 0:
+        old_dir, new_dir, prefix = stack.pop()
+        if old_dir is None:
+            yield from ((True, prefix + name) for name in new_dir.files)
+            stack.extend((None, new_dir.dirs[name], prefix + name + sep) for name in sorted(new_dir.dirs, reverse=True))
+            continue
+        if new_dir is None:
+            yield from ((False, prefix + name) for name in old_dir.files)
+            stack.extend((old_dir.dirs[name], None, prefix + name + sep) for name in sorted(old_dir.dirs, reverse=True))
+            continue
+        if old_dir.digest == new_dir.digest:
+            continue
+        yield from _merge_files(old_dir.files, new_dir.files, prefix)
+        old_dirs, new_dirs = old_dir.dirs, new_dir.dirs
+        for name in sorted(old_dirs.keys() | new_dirs.keys(), reverse=True):
+            stack.append((old_dirs.get(name), new_dirs.get(name), prefix + name + sep))
+
+
+def write_tree_diff(
+    input_data: 'InputData',
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> int:
+    """ Compare the Tree Input with the Diff Input, and stream the added and removed Files into the output.
+ - Added Files start with a plus sign, and removed Files with a minus sign.
+
+**Parameters:**
+ - input_data (InputData): The program input data, where the Tree Input is the old Tree, and the Diff Input is the new Tree.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the changes into.
+ - encoding (str): The encoding used when the output stream is binary. Default: utf-8.
+
+**Returns:**
+ int - The number of Files added or removed.
+
+**Raises:**
+ SystemExit - If either TreeScript is invalid.
+    """
+    from treescript_files.line_reader import read_input_tree
+    from treescript_files.output_writer import write_paths
+    trees = []
+    for tree_input in (input_data.tree_input, input_data.diff_input):
+        tree_data = read_input_tree(tree_input)
+        if input_data.tree_filter is not None:
+            from treescript_files.tree_filter import filter_tree_data
+            tree_data = filter_tree_data(tree_data, input_data.tree_filter)
+        trees.append(build_diff_tree(tree_data))
+    return write_paths(
+        paths=(
+            (_ADDED_PREFIX if is_added else _REMOVED_PREFIX) + path
+            for is_added, path in diff_trees(trees[0], trees[1], input_data.parent_path)
+        ),
+        output_stream=output_stream,
+        separator=input_data.separator,
+        encoding=encoding,
+    )
+
+
+def _compute_digests(
+    root: DiffDir,
+):
+    """ Sort the Files of every Directory, and compute the digests from the deepest Directories up.
+ - A subtree without Files has the digest of no data, and is left out of its parent's digest.
+    """
+    # Collect the Directories in pre-order, so that reversing visits children before parents
+    order = [root]
+    index = 0
+    while index < len(order):
+        order.extend(order[index].dirs.values())
+        index += 1
+    for node in reversed(order):
+        node.files = files = tuple(sorted(set(node.files)))
+        digest = blake2b(digest_size=_DIGEST_SIZE)
+        if len(files) > 0:
+            # The File count, then each name ending with a null, so that the encoding is unambiguous
+            digest.update(b'%d\0' % len(files) + ''.join(name + '\0' for name in files).encode('utf-8', 'surrogatepass'))
+        for name in sorted(node.dirs):
+            if (child_digest := node.dirs[name].digest) != _EMPTY_DIGEST:
+                digest.update(name.encode('utf-8', 'surrogatepass') + b'\0' + child_digest)
+        node.digest = digest.digest()
+
+
+def _merge_files(
+    old_files: tuple[str, ...],
+    new_files: tuple[str, ...],
+    prefix: str,
+) -> Generator[tuple[bool, str], None, None]:
+    """ Merge the sorted file names of a Directory, and generate the names that are only on one side.
+    """
+    i = j = 0
+    old_count, new_count = len(old_files), len(new_files)
+    while i < old_count and j < new_count:
+        if (old_name := old_files[i]) == (new_name := new_files[j]):
+            i += 1
+            j += 1
+        elif old_name < new_name:
+            yield False, prefix + old_name
+            i += 1
+        else:
+            yield True, prefix + new_name
+            j += 1
+    while i < old_count:
+        yield False, prefix + old_files[i]
+        i += 1
+    while j < new_count:
+        yield True, prefix + new_files[j]
+        j += 1
@@ -0,0 +1,167 @@
+""" Tree Filter.
+
+Include and Exclude glob patterns, compiled once and matched while the Tree is traversed.
+ - A pattern without a slash matches the name of a File or Directory, so no path is built.
+ - A pattern with a slash matches the path relative to the Tree, using forward slashes.
+ - A pattern ending with a slash only matches Directories.
+ - An excluded Directory removes its whole subtree.
+ - Include patterns select Files; when none are given, every File that is not excluded is included.
+"""
+from typing import Generator, Iterable
+
+from treescript_files.path_stack import PathStack
+from treescript_files.tree_data import TreeData
+
+
+_GLOB_CHARS = ('*', '?', '[')
+
+
+class TreeFilter:
+    """ The compiled Include and Exclude patterns.
+
+**Method Summary:**
+ - needs_paths: bool
+ - excludes_dir(str, PathStack?): bool
+ - includes_file(str, PathStack?): bool
+    """
+
+    def __init__(
+        self,
+        include: Iterable[str] = (),
+        exclude: Iterable[str] = (),
+    ):
+        """ Compile the Include and Exclude patterns.
+
+**Parameters:**
+ - include (Iterable[str]): The patterns that select Files. Default: Every File.
+ - exclude (Iterable[str]): The patterns that remove Files and Directory subtrees. Default: None.
+        """
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self._include_file = _PatternSet(self.include)
+        self._exclude_file = _PatternSet(p for p in self.exclude if not _is_dir_pattern(p))
+        self._exclude_dir = _PatternSet(p.rstrip('/\\') for p in self.exclude)
+
+    def needs_paths(self) -> bool:
+        """ Whether any pattern matches a relative path, which must then be tracked during traversal.
+        """
+        return self._include_file.has_paths or self._exclude_file.has_paths or self._exclude_dir.has_paths
+
+    def excludes_dir(
+        self,
+        name: str,
+        path_stack: PathStack | None = None,
+    ) -> bool:
+        """ Determine whether a Directory and its subtree are excluded.
+
+**Parameters:**
+ - name (str): The name of the Directory.
+ - path_stack (PathStack?): The relative path of the parent Directory, with forward slashes. Required when needs_paths is True.
+
+**Returns:**
+ bool - True if the Directory is excluded.
+        """
+        return not self._exclude_dir.is_empty and self._exclude_dir.matches(name, path_stack)
+
+    def includes_file(
+        self,
+        name: str,
+        path_stack: PathStack | None = None,
+    ) -> bool:
+        """ Determine whether a File is included in the output.
+
+**Parameters:**
+ - name (str): The name of the File.
+ - path_stack (PathStack?): The relative path of the parent Directory, with forward slashes. Required when needs_paths is True.
+
+**Returns:**
+ bool - True if the File is included.
+        """
+        if not self._include_file.is_empty and not self._include_file.matches(name, path_stack):
+            return False
+        return self._exclude_file.is_empty or not self._exclude_file.matches(name, path_stack)
+
+
+def filter_tree_data(
+    tree_data: Iterable[TreeData],
+    tree_filter: TreeFilter,
+) -> Generator[TreeData, None, None]:
+    """ Remove the excluded nodes from a TreeData Iterable.
+ - The nodes of an excluded subtree are removed, so the remaining depths stay consistent.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The TreeData of each node, in TreeScript order.
+ - tree_filter (TreeFilter): The compiled patterns.
+
+**Yields:**
+ TreeData - The nodes that are not excluded.
+    """
+    path_stack = PathStack(path_separator='/') if tree_filter.needs_paths() else None
+    skip_depth = -1 # The depth of the excluded Directory, whose subtree is being removed
+    for node in tree_data:
+        if skip_depth >= 0:
+            if node.depth > skip_depth:
+                continue
+            skip_depth = -1
+        if path_stack is not None and node.depth < path_stack.get_depth():
+            path_stack.reduce_depth(node.depth)
+        if node.is_dir:
+            if tree_filter.excludes_dir(node.name, path_stack):
+                skip_depth = node.depth
+                continue
+            if path_stack is not None:
+                path_stack.push(node.name)
+        elif not tree_filter.includes_file(node.name, path_stack):
+            continue
+        yield node
+
+
+class _PatternSet:
+    """ A group of patterns, compiled into literal names, name suffixes, and regular expressions.
+ - Suffix patterns such as *.py are matched with str.endswith, instead of a regular expression.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        name_literals, name_suffixes, name_globs, path_globs = set(), [], [], []
+        for pattern in patterns:
+            if '/' in (pattern := pattern.replace('\\', '/').lstrip('/')):
+                path_globs.append(pattern)
+            elif not any(c in pattern for c in _GLOB_CHARS):
+                name_literals.add(pattern)
+            elif pattern[0] == '*' and not any(c in pattern[1:] for c in _GLOB_CHARS):
+                name_suffixes.append(pattern[1:])
+            else:
+                name_globs.append(pattern)
+        self._name_literals = frozenset(name_literals)
+        self._name_suffixes = tuple(name_suffixes)
+        self._name_regex = _compile_globs(name_globs)
+        self._path_regex = _compile_globs(path_globs)
+        self.is_empty = len(name_literals) + len(name_suffixes) + len(name_globs) + len(path_globs) == 0
+        self.has_paths = len(path_globs) > 0
+
+    def matches(self, name: str, path_stack: PathStack | None) -> bool:
+        if name in self._name_literals or name.endswith(self._name_suffixes):
+            return True
+        if self._name_regex is not None and self._name_regex.match(name) is not None:
+            return True
+        return self._path_regex is not None and self._path_regex.match(path_stack.join_stack() + name) is not None
+
+
+def _compile_globs(
+    patterns: list[str],
+):
+    """ Compile glob patterns into one regular expression, or None if there are no patterns.
+    """
+    if len(patterns) == 0:
+        return None
+    from fnmatch import translate
+    from re import compile
+    return compile('|'.join(translate(pattern) for pattern in patterns))
+
+
+def _is_dir_pattern(
+    pattern: str,
+) -> bool:
+    """ Whether a pattern ends with a slash, and only matches Directories.
+    """
+    return pattern.endswith(('/', '\\'))
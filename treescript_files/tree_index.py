@@ -0,0 +1,351 @@
+""" Tree Index.
+
+An in-memory trie of the Directories and Files in a TreeScript, for repeated queries.
+ - Each Directory is an integer id, with its name, parent, depth, and entries stored in parallel lists.
+ - The entries of a Directory are file names and child Directory ids, in TreeScript order.
+ - Directories with the same path are merged into one node.
+ - Queries match names one level at a time, and only build path strings for the Files they return.
+"""
+from os import sep
+from sys import exit
+from typing import Generator, Iterable
+
+from treescript_files.tree_data import TreeData
+
+
+# Increment this whenever the saved format changes.
+_INDEX_FORMAT_VERSION = 1
+_INVALID_INDEX_FILE_MSG = "The file is not a TreeIndex, or was saved by another version."
+_ROOT_ID = 0
+
+
+class TreeIndex:
+    """ A trie of the Directories and Files in a TreeScript.
+
+**Method Summary:**
+ - from_tree_data(Iterable[TreeData]): TreeIndex
+ - from_treescript(str | Iterable[str]): TreeIndex
+ - load(str): TreeIndex
+ - save(str)
+ - find_dir(str): int?
+ - count_files(str, bool): int
+ - iter_files(str, int?, str): Generator[str]
+ - glob(str, int?, str): Generator[str]
+    """
+
+    __slots__ = ('_names', '_parents', '_depths', '_entries', '_file_counts', '_lookup')
+
+    def __init__(self):
+        """ Initialize an empty Tree Index, containing only the root Directory.
+        """
+        # The name, parent id, and depth of each Directory, by id.
+        self._names: list[str] = ['']
+        self._parents: list[int] = [-1]
+        self._depths: list[int] = [0]
+        # The file names (str) and child Directory ids (int) of each Directory.
+        self._entries: list[list[str | int]] = [[]]
+        # The number of Files in the subtree of each Directory.
+        self._file_counts: list[int] = [0]
+        # The id of each Directory, by parent id and name.
+        self._lookup: dict[tuple[int, str], int] = {}
+
+    @classmethod
+    def from_tree_data(
+        cls,
+        tree_data: Iterable[TreeData],
+    ) -> 'TreeIndex':
+        """ Build a Tree Index from a TreeData Iterable.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The TreeData of each node, in TreeScript order.
+
+**Returns:**
+ TreeIndex - The index of the Tree.
+
+**Raises:**
+ SystemExit - If the depth increases by more than one level.
+        """
+        index = cls()
+        names, parents, depths, entries, lookup = index._names, index._parents, index._depths, index._entries, index._lookup
+        stack = [_ROOT_ID]
+        for node in tree_data:
+            if (delta := node.depth - len(stack) + 1) > 0:
+                exit(f'You have jumped {delta} steps in the tree on line: {node.line_number}')
+            elif delta < 0:
+                del stack[node.depth + 1:]
+            parent_id = stack[-1]
+            if not node.is_dir:
+                entries[parent_id].append(node.name)
+                continue
+            if (dir_id := lookup.get((parent_id, node.name))) is None:
+                lookup[parent_id, node.name] = dir_id = len(names)
+                names.append(node.name)
+                parents.append(parent_id)
+                depths.append(len(stack))
+                entries.append([])
+                entries[parent_id].append(dir_id)
+            stack.append(dir_id)
+        index._count_files()
+        return index
+
+    @classmethod
+    def from_treescript(
+        cls,
+        treescript: str | Iterable[str],
+    ) -> 'TreeIndex':
+        """ Parse a TreeScript, and build its Tree Index.
+
+**Parameters:**
+ - treescript (str | Iterable[str]): The TreeScript, as a string or an Iterable of lines.
+
+**Returns:**
+ TreeIndex - The index of the Tree.
+
+**Raises:**
+ SystemExit - If the TreeScript is invalid.
+        """
+        from treescript_files.line_reader import read_input_tree
+        return cls.from_tree_data(read_input_tree(treescript))
+
+    @classmethod
+    def load(
+        cls,
+        file_name: str,
+    ) -> 'TreeIndex':
+        """ Load a Tree Index saved by the save method.
+ - Uses pickle, so only load files from a trusted source.
+
+**Parameters:**
+ - file_name (str): The file to read the Tree Index from.
+
+**Returns:**
+ TreeIndex - The saved Tree Index.
+
+**Raises:**
+ ValueError - If the file is not a Tree Index, or has another format version.
+ OSError - If the file could not be read.
+        """
+        from pickle import UnpicklingError, load
+        with open(file_name, 'rb') as file:
+            try:
+                state = load(file)
+            except (EOFError, UnpicklingError):
+                raise ValueError(_INVALID_INDEX_FILE_MSG)
+        if not isinstance(state, tuple) or len(state) != 5 or state[0] != _INDEX_FORMAT_VERSION:
+            raise ValueError(_INVALID_INDEX_FILE_MSG)
+        index = cls()
+        _, index._names, index._parents, index._depths, index._entries = state
+        index._lookup = {
+            (index._parents[dir_id], index._names[dir_id]): dir_id
+            for dir_id in range(1, len(index._names))
+        }
+        index._count_files()
+        return index
+
+    def save(
+        self,
+        file_name: str,
+    ):
+        """ Save the Tree Index to a file, so it can be reused without parsing.
+ - The lookup table and File counts are rebuilt on load, to keep the file compact.
+
+**Parameters:**
+ - file_name (str): The file to write the Tree Index into.
+
+**Raises:**
+ OSError - If the file could not be written.
+        """
+        from pickle import HIGHEST_PROTOCOL, dump
+        with open(file_name, 'wb') as file:
+            dump(
+                (_INDEX_FORMAT_VERSION, self._names, self._parents, self._depths, self._entries),
+                file,
+                protocol=HIGHEST_PROTOCOL,
+            )
+
+    def find_dir(
+        self,
+        dir_path: str,
+    ) -> int | None:
+        """ Find the id of a Directory by its path.
+
+**Parameters:**
+ - dir_path (str): The Directory path, separated by either slash. An empty path is the root.
+
+**Returns:**
+ int? - The Directory id, or None if the Directory is not in the Tree.
+        """
+        dir_id = _ROOT_ID
+        for name in _split_path(dir_path):
+            if (dir_id := self._lookup.get((dir_id, name))) is None:
+                return None
+        return dir_id
+
+    def count_files(
+        self,
+        dir_path: str = '',
+        recursive: bool = True,
+    ) -> int:
+        """ Count the Files in a Directory.
+
+**Parameters:**
+ - dir_path (str): The Directory path, separated by either slash. Default: The root.
+ - recursive (bool): Whether to include the Files in subdirectories. Default: True.
+
+**Returns:**
+ int - The number of Files, or zero if the Directory is not in the Tree.
+        """
+        if (dir_id := self.find_dir(dir_path)) is None:
+            return 0
+        if recursive:
+            return self._file_counts[dir_id]
+        return sum(1 for entry in self._entries[dir_id] if entry.__class__ is str)
+
+    def iter_files(
+        self,
+        dir_path: str = '',
+        max_depth: int | None = None,
+        path_separator: str = sep,
+    ) -> Generator[str, None, None]:
+        """ Generate the paths of the Files in the subtree of a Directory, in TreeScript order.
+
+**Parameters:**
+ - dir_path (str): The Directory path, separated by either slash. Default: The root.
+ - max_depth (int?): The greatest depth of the Files, where zero is the top level, or None for any depth.
+ - path_separator (str): The separator used in the paths. Default: The OS separator.
+
+**Yields:**
+ str - The path of each File.
+        """
+        if (dir_id := self.find_dir(dir_path)) is None:
+            return
+        if max_depth is not None and self._depths[dir_id] > max_depth:
+            return
+        yield from self._walk(dir_id, self._get_prefix(dir_id, path_separator), None, max_depth, path_separator)
+
+    def glob(
+        self,
+        pattern: str,
+        max_depth: int | None = None,
+        path_separator: str = sep,
+    ) -> Generator[str, None, None]:
+        """ Generate the paths of the Files matching a glob pattern, in TreeScript order.
+ - Each pattern component is matched against one name, with fnmatch rules.
+ - A ** component matches any number of Directories.
+ - Directories that cannot lead to a match are not visited.
+
+**Parameters:**
+ - pattern (str): The glob pattern, separated by either slash. ie: src/**/*.py
+ - max_depth (int?): The greatest depth of the Files, where zero is the top level, or None for any depth.
+ - path_separator (str): The separator used in the paths. Default: The OS separator.
+
+**Yields:**
+ str - The path of each matching File.
+        """
+        if len(components := _split_path(pattern)) == 0:
+            return
+        matchers = tuple(None if c == '**' else _compile_component(c) for c in components)
+        yield from self._walk(_ROOT_ID, '', _close_states(matchers, (0,)), max_depth, path_separator, matchers)
+
+    def _walk(
+        self,
+        dir_id: int,
+        prefix: str,
+        states: tuple[int, ...] | None,
+        max_depth: int | None,
+        path_separator: str,
+        matchers: tuple = (),
+    ) -> Generator[str, None, None]:
+        """ Walk a subtree in TreeScript order, optionally matching the glob states.
+        """
+        names, depths, entries = self._names, self._depths, self._entries
+        last = len(matchers) - 1
+        # Each frame is an entry iterator, its path prefix, and its glob states
+        frames = [(iter(entries[dir_id]), prefix, states)]
+        while len(frames) > 0:
+            iterator, prefix, states = frames[-1]
+            for entry in iterator:
+                if entry.__class__ is str:
+                    if states is None or any(
+                        (i == last and (matchers[i] is None or matchers[i](entry)))
+                        for i in states
+                    ):
+                        yield prefix + entry
+                    continue
+                if max_depth is not None and depths[entry] > max_depth:
+                    continue
+                name = names[entry]
+                if states is not None:
+                    next_states = []
+                    for i in states:
+                        if matchers[i] is None:
+                            next_states.append(i)
+                        elif i < last and matchers[i](name):
+                            next_states.append(i + 1)
+                    if len(next_states) == 0:
+                        continue
+                    next_states = _close_states(matchers, next_states)
+                else:
+                    next_states = None
+                frames.append((iter(entries[entry]), prefix + name + path_separator, next_states))
+                break
+            else:
+                frames.pop()
+
+    def _get_prefix(
+        self,
+        dir_id: int,
+        path_separator: str,
+    ) -> str:
+        """ Join the names of a Directory and its ancestors into a path prefix.
+        """
+        names = []
+        while dir_id != _ROOT_ID:
+            names.append(self._names[dir_id])
+            dir_id = self._parents[dir_id]
+        return ''.join(name + path_separator for name in reversed(names))
+
+    def _count_files(self):
+        """ Count the Files in the subtree of every Directory.
+ - Child Directories always have a greater id than their parent.
+        """
+        counts = [sum(1 for entry in entries if entry.__class__ is str) for entries in self._entries]
+        parents = self._parents
+        for dir_id in range(len(counts) - 1, _ROOT_ID, -1):
+            counts[parents[dir_id]] += counts[dir_id]
+        self._file_counts = counts
+
+
+def _split_path(
+    path: str,
+) -> list[str]:
+    """ Split a path into its names, at either slash.
+    """
+    return [name for name in path.replace('\\', '/').split('/') if len(name) > 0]
+
+
+def _compile_component(
+    component: str,
+):
+    """ Create a function that matches one name against a pattern component.
+    """
+    if not any(c in component for c in '*?['):
+        return component.__eq__
+    from fnmatch import translate
+    from re import compile
+    return compile(translate(component)).match
+
+
+def _close_states(
+    matchers: tuple,
+    states: Iterable[int],
+) -> tuple[int, ...]:
+    """ Add the states reached by matching a ** component against zero Directories.
+    """
+    closed = []
+    for i in states:
+        while i not in closed:
+            closed.append(i)
+            if matchers[i] is None and i + 1 < len(matchers):
+                i += 1
+    return tuple(closed)
@@ -1,19 +1,33 @@
 """ Reads the TreeData from a Generator.
+ - Large inputs may be split at top-level lines, and parsed by parallel worker processes.
 """
-from pathlib import Path
-from typing import Generator, Literal
+from os import sep
+from sys import exit
+from typing import TYPE_CHECKING, Generator, Iterable, Literal
 
-from treescript_files.input_data import InputData
-from treescript_files.line_reader import read_input_tree
+from treescript_files.file_validation import _detect_compression
+from treescript_files.line_reader import _tokenize_line, read_input_tree
 from treescript_files.path_stack import PathStack
 from treescript_files.string_validation import validate_slash_char
 from treescript_files.tree_data import TreeData
 
+if TYPE_CHECKING:
+    # InputData depends on dataclasses, which is not needed at run time here.
+    from treescript_files.input_data import InputData
+    from treescript_files.tree_filter import TreeFilter
+
+
+_PARALLEL_THRESHOLD = 4 * 1024**2 # 4 MB, below the default file size limit
+_PARALLEL_CHUNK_LINES = 50_000 # The minimum number of lines sent to each worker
+_ABSOLUTE_PARENT_MSG = "The Parent Path must be relative to the root: "
+
 
 def process_input_data(
-    input_data: InputData,
+    input_data: 'InputData',
 ) -> Generator[str, None, None]:
     """Process the Input Data and set-up file path generators.
+ - The bytes engine scans the Input file with the Bytes Reader, in this process, unless the file is compressed.
+ - Input files at or above the parallel threshold are parsed by worker processes.
 
 **Parameters:**
  - input_data (InputData): The program input data.
@@ -21,37 +35,223 @@ def process_input_data(
 **Yields:**
  str - The file path strings.
     """
-    yield from generate_treescript_files(
-        treescript_file=input_data.tree_input,
-        parent_path=input_data.parent_path,
-    )
+    if input_data.engine == 'bytes' and input_data.tree_file is not None \
+            and _detect_compression(input_data.tree_file) is None:
+        from treescript_files.bytes_reader import generate_mapped_files
+        yield from generate_mapped_files(
+            file_name=input_data.tree_file,
+            parent_path=input_data.parent_path,
+            tree_filter=input_data.tree_filter,
+            file_size_limit=input_data.file_size_limit,
+        )
+    elif _is_parallel_input(input_data):
+        yield from generate_treescript_files_parallel(
+            treescript_file=input_data.tree_input,
+            parent_path=input_data.parent_path,
+            max_workers=input_data.jobs,
+            tree_filter=input_data.tree_filter,
+        )
+    else:
+        yield from generate_treescript_files(
+            treescript_file=input_data.tree_input,
+            parent_path=input_data.parent_path,
+            tree_filter=input_data.tree_filter,
+        )
 
 
 def generate_treescript_files(
-    treescript_file: str,
-    parent_path: str | None
+    treescript_file: str | Iterable[str],
+    parent_path: str | None,
+    tree_filter: 'TreeFilter | None' = None,
 ) -> Generator[str, None, None]:
     """ Process the Input Data and set-up file path generators.
 
 **Parameters:**
- - treescript_file (str): The Input TreeScript file to translate into file path strings.
+ - treescript_file (str | Iterable[str]): The Input TreeScript text, or its lines, to translate into file path strings.
  - parent_path (str?): The ParentPath to prefix file paths with.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to output every file. Default: None.
 
 **Yields:**
  str - The file path strings.
     """
-    file_generator = _process_tree_data(read_input_tree(treescript_file))
-    if parent_path is not None:
-        file_generator = _prefix_parent(parent_path, file_generator)
-    return file_generator
+    root = '' if parent_path is None else _format_parent_prefix(parent_path)
+    if tree_filter is not None:
+        return _process_filtered_lines(treescript_file, root, tree_filter)
+    return _process_tree_data(read_input_tree(treescript_file), root)
+
+
+def generate_treescript_files_parallel(
+    treescript_file: str | Iterable[str],
+    parent_path: str | None,
+    max_workers: int | None = None,
+    chunk_lines: int = _PARALLEL_CHUNK_LINES,
+    tree_filter: 'TreeFilter | None' = None,
+) -> Generator[str, None, None]:
+    """ Split the Input at top-level lines, and translate the chunks in parallel worker processes.
+ - A line with no indentation resets the PathStack, so each chunk can be parsed independently.
+ - Results are yielded in the input order, and error messages keep the original line numbers.
+ - A limited number of chunks are in progress at once, so memory stays bounded.
+
+**Parameters:**
+ - treescript_file (str | Iterable[str]): The Input TreeScript text, or its lines, to translate into file path strings.
+ - parent_path (str?): The ParentPath to prefix file paths with.
+ - max_workers (int?): The number of worker processes, or None to use the CPU count.
+ - chunk_lines (int): The minimum number of lines in each chunk.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to output every file. Default: None.
+
+**Yields:**
+ str - The file path strings.
+
+**Raises:**
+ SystemExit - When any Line cannot be read as TreeScript successfully.
+    """
+    root = '' if parent_path is None else _format_parent_prefix(parent_path)
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    from os import cpu_count
+    if max_workers is None:
+        max_workers = cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    pending = deque()
+    try:
+        for first_line_number, lines in _split_top_level_chunks(treescript_file, chunk_lines):
+            pending.append(executor.submit(_process_chunk, lines, first_line_number, root, tree_filter))
+            # Keep each worker busy, without reading the whole input ahead
+            if len(pending) > max_workers * 2:
+                yield from _take_chunk_result(pending.popleft())
+        while len(pending) > 0:
+            yield from _take_chunk_result(pending.popleft())
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _split_top_level_chunks(
+    treescript_file: str | Iterable[str],
+    chunk_lines: int,
+) -> Generator[tuple[int, list[str]], None, None]:
+    """ Split the Input lines into chunks that each start at a top-level line.
+ - A chunk is only split once it holds at least chunk_lines lines.
+
+**Parameters:**
+ - treescript_file (str | Iterable[str]): The Input TreeScript text, or its lines.
+ - chunk_lines (int): The minimum number of lines in each chunk.
+
+**Yields:**
+ tuple[int, list[str]] - The line number of the first line, and the lines in the chunk.
+    """
+    if isinstance(treescript_file, str):
+        treescript_file = treescript_file.splitlines()
+    first_line_number = 1
+    chunk = []
+    for line in treescript_file:
+        if len(chunk) >= chunk_lines and _is_top_level_line(line):
+            yield first_line_number, chunk
+            first_line_number += len(chunk)
+            chunk = []
+        chunk.append(line)
+    if len(chunk) > 0:
+        yield first_line_number, chunk
+
+
+def _is_top_level_line(line: str) -> bool:
+    """ Determine whether a line is a TreeNode with no indentation.
+
+**Parameters:**
+ - line (str): A line of TreeScript.
+
+**Returns:**
+ bool - True if the line is a depth 0 TreeNode.
+    """
+    return len(line) > 0 and not line[0].isspace() and line[0] != '#'
+
+
+def _process_chunk(
+    lines: list[str],
+    first_line_number: int,
+    root: str,
+    tree_filter: 'TreeFilter | None' = None,
+) -> tuple[list[str], str | None]:
+    """ Translate a chunk of TreeScript lines into file path strings, in a worker process.
+ - Errors are returned instead of being raised, along with the files before the error.
+
+**Parameters:**
+ - lines (list[str]): The lines in the chunk, which start at a top-level line.
+ - first_line_number (int): The line number of the first line in the Input.
+ - root (str): The prefix for every file path.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None to output every file. Default: None.
+
+**Returns:**
+ tuple[list[str], str?] - The file path strings, and the error message or None.
+    """
+    files = []
+    try:
+        if tree_filter is None:
+            files.extend(_process_tree_data(read_input_tree(lines, first_line_number), root))
+        else:
+            files.extend(_process_filtered_lines(lines, root, tree_filter, first_line_number))
+    except SystemExit as e:
+        return files, str(e.code)
+    return files, None
+
+
+def _take_chunk_result(
+    future,
+) -> Generator[str, None, None]:
+    """ Wait for the result of a chunk, and exit if the chunk failed.
+
+**Parameters:**
+ - future (Future): The Future of a _process_chunk call.
+
+**Yields:**
+ str - The file path strings in the chunk.
+
+**Raises:**
+ SystemExit - After the chunk's files are yielded, if the chunk failed.
+    """
+    files, error = future.result()
+    yield from files
+    if error is not None:
+        exit(error)
+
+
+def _is_parallel_input(
+    input_data: 'InputData',
+) -> bool:
+    """ Determine whether the Input file is large enough to be parsed in parallel.
+ - A single worker process would only add overhead, so it is never used.
+
+**Parameters:**
+ - input_data (InputData): The program input data.
+
+**Returns:**
+ bool - True if the Input file size is at or above the parallel threshold.
+    """
+    if input_data.tree_file is None or input_data.parallel_threshold is None:
+        return False
+    from os import cpu_count
+    if (input_data.jobs or cpu_count() or 1) < 2:
+        return False
+    from os.path import getsize
+    try:
+        return getsize(input_data.tree_file) >= input_data.parallel_threshold
+    except OSError:
+        return False
 
 
 def _process_tree_data(
-    tree_data_generator: Generator[TreeData, None, None]
+    tree_data_generator: Generator[TreeData, None, None],
+    root: str = '',
 ) -> Generator[str, None, None]:
     """ Read the TreeData to determine the File path strings.
+
+**Parameters:**
+ - tree_data_generator (Generator[TreeData]): The TreeData stream to read.
+ - root (str): The prefix for every file path, such as a formatted parent directory. Default: Empty.
+
+**Yields:**
+ str - The file path strings.
     """
-    path_stack = PathStack()
+    path_stack = PathStack(root)
     for tree_node in tree_data_generator:
         # Check Depth Change
         if (delta := tree_node.depth - path_stack.get_depth()) > 0:
@@ -65,20 +265,71 @@ def _process_tree_data(
             yield path_stack.join_stack() + tree_node.name
 
 
-def _prefix_parent(
-    parent: str,
-    input_stream: Generator[str, None, None],
-    path_separator: Literal['\\', '/'] = str(Path('a/b'))[1],
+def _process_filtered_lines(
+    treescript_file: str | Iterable[str],
+    root: str,
+    tree_filter: 'TreeFilter',
+    first_line_number: int = 1,
 ) -> Generator[str, None, None]:
-    """ Append a Prefix Parent Path to each file.
+    """ Translate TreeScript lines into the file path strings selected by the filter.
+ - The lines below an excluded Directory are only scanned for their indentation, until the subtree ends.
+ - Relative paths are only tracked when a pattern contains a slash.
+
+**Parameters:**
+ - treescript_file (str | Iterable[str]): The Input TreeScript text, or its lines.
+ - root (str): The prefix for every file path.
+ - tree_filter (TreeFilter): The Include and Exclude patterns.
+ - first_line_number (int): The line number of the first line. Default: 1.
+
+**Yields:**
+ str - The file path strings that are not excluded.
+
+**Raises:**
+ SystemExit - When a Line outside of an excluded subtree cannot be read as TreeScript, or the depth jumps.
+    """
+    if isinstance(treescript_file, str):
+        treescript_file = treescript_file.splitlines()
+    path_stack = PathStack(root)
+    relative_stack = PathStack(path_separator='/') if tree_filter.needs_paths() else None
+    skip_indent = -1 # The indentation of the excluded Directory, whose subtree is being skipped
+    for line_number, line in enumerate(treescript_file, start=first_line_number):
+        if len(stripped := line.lstrip()) == 0 or stripped[0] == '#':
+            continue
+        if skip_indent >= 0:
+            if len(line) - len(stripped) > skip_indent:
+                continue
+            skip_indent = -1
+        tree_node = _tokenize_line(line_number, line, stripped)
+        if (delta := tree_node.depth - path_stack.get_depth()) > 0:
+            exit(f'You have jumped {delta} steps in the tree on line: {tree_node.line_number}')
+        elif delta < 0:
+            path_stack.reduce_depth(tree_node.depth)
+            if relative_stack is not None:
+                relative_stack.reduce_depth(tree_node.depth)
+        if tree_node.is_dir:
+            if tree_filter.excludes_dir(tree_node.name, relative_stack):
+                skip_indent = len(line) - len(stripped)
+                continue
+            path_stack.push(tree_node.name)
+            if relative_stack is not None:
+                relative_stack.push(tree_node.name)
+        elif tree_filter.includes_file(tree_node.name, relative_stack):
+            yield path_stack.join_stack() + tree_node.name
+
+
+def _format_parent_prefix(
+    parent: str,
+    path_separator: Literal['\\', '/'] = sep,
+) -> str:
+    """ Format a Parent Path so that it can be used as the root prefix of each file.
  - Must first ensure that the parent dir is compatible path-separator-wise.
 
 **Parameters:**
  - parent (str): The prefix string to add to the file paths.
- - input_stream (Generator[str]): A Generator stream of file path strings.
+ - path_separator (str): The path separator used in the output.
 
-**Yields:**
- str - The completed File path strings.
+**Returns:**
+ str - The Parent Path, using the path separator, and ending with it.
     """
     if (slash_char := validate_slash_char(parent)) != path_separator:
         if slash_char is not None:
@@ -86,6 +337,29 @@ def _prefix_parent(
     # Ensure that the Prefix Ends with a Separator.
     if not parent.endswith(path_separator):
         parent += path_separator
-    # Start the Generator.
-    for i in input_stream:
-        yield parent + i
+    return parent
+
+
+def _join_parent_root(
+    root: str,
+    parent: str,
+) -> str:
+    """ Join a Parent Path below a root Directory.
+ - An absolute or rooted Parent Path would replace the root in os.path.join, so it is rejected.
+
+**Parameters:**
+ - root (str): The root Directory.
+ - parent (str): The Parent Path, relative to the root.
+
+**Returns:**
+ str - The Parent Path below the root, ending with the path separator.
+
+**Raises:**
+ SystemExit - If the Parent Path is absolute, or has a drive.
+    """
+    from os import path as os_path
+    prefix = _format_parent_prefix(parent)
+    # The prefix uses the path separator, so a rooted path starts with it
+    if prefix.startswith(sep) or len(os_path.splitdrive(prefix)[0]) > 0:
+        exit(_ABSOLUTE_PARENT_MSG + parent)
+    return os_path.join(root, prefix)
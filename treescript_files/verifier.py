@@ -0,0 +1,287 @@
+""" Verifier.
+
+Checks the Files of a TreeScript against a Directory on disk.
+ - The expected Files are grouped by Directory during the PathStack traversal.
+ - Each Directory is listed once with scandir, instead of calling stat for every File.
+ - Directories are scanned by a pool of threads, because listing a Directory is bound by I/O.
+ - Missing Files and Directories are always reported, and unexpected extra entries optionally.
+ - The command line report streams the mismatches of each Directory to stderr, as it is scanned.
+"""
+from sys import exit
+from typing import TYPE_CHECKING, BinaryIO, Generator, Iterable, NamedTuple, TextIO
+
+from treescript_files.path_stack import PathStack
+from treescript_files.tree_data import TreeData
+
+if TYPE_CHECKING:
+    from treescript_files.input_data import InputData
+    from treescript_files.tree_filter import TreeFilter
+
+
+_SCAN_FAILED_MSG = "Failed to scan: "
+_MISMATCH_MSG = "The Directory does not match the TreeScript: "
+
+
+class VerifyResult(NamedTuple):
+    """ The outcome of a verification.
+
+**Fields:**
+ - dirs_scanned (int): The number of expected Directories.
+ - files_expected (int): The number of expected Files.
+ - missing (list[str]): The paths of the missing Files, and Directories ending with a separator, in TreeScript order.
+ - extra (list[str]): The paths of the unexpected Files, and Directories ending with a separator.
+    """
+    dirs_scanned: int
+    files_expected: int
+    missing: list[str]
+    extra: list[str]
+
+
+class _ExpectedDir:
+    """ The expected Files and subdirectories of one Directory.
+    """
+    __slots__ = ('files', 'dirs', 'relative_path')
+
+    def __init__(self, relative_path: str | None):
+        # Dicts are used as ordered sets, to report in TreeScript order.
+        self.files: dict[str, None] = {}
+        self.dirs: dict[str, None] = {}
+        # The path relative to the root with forward slashes, when the filter matches paths.
+        self.relative_path = relative_path
+
+
+def verify_tree(
+    tree_data: Iterable[TreeData],
+    root: str,
+    check_extra: bool = False,
+    tree_filter: 'TreeFilter | None' = None,
+    max_workers: int | None = None,
+) -> VerifyResult:
+    """ Compare the Files of a Tree with the contents of a root Directory.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The TreeData of each node, in TreeScript order.
+ - root (str): The Directory that should contain the Tree.
+ - check_extra (bool): Whether to report the entries on disk that are not in the Tree. Default: False.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, which apply to both the Tree and the extra entries. Default: None.
+ - max_workers (int?): The number of threads scanning Directories, or None for the ThreadPoolExecutor default.
+
+**Returns:**
+ VerifyResult - The missing and extra paths.
+
+**Raises:**
+ SystemExit - If the depth jumps, or a Directory could not be scanned.
+    """
+    expected_dirs = _expect_dirs(tree_data, root, tree_filter)
+    missing, extra = [], []
+    for dir_missing, dir_extra in _scan_dirs(expected_dirs, check_extra, tree_filter, max_workers):
+        missing.extend(dir_missing)
+        extra.extend(dir_extra)
+    return VerifyResult(
+        dirs_scanned=len(expected_dirs),
+        files_expected=sum(len(expected.files) for expected in expected_dirs.values()),
+        missing=missing,
+        extra=extra,
+    )
+
+
+def write_verify_report(
+    input_data: 'InputData',
+    output_stream: BinaryIO | TextIO,
+    encoding: str = 'utf-8',
+) -> int:
+    """ Verify the Tree of the InputData, report the mismatches on stderr, and write a summary into the output.
+ - The mismatches of each Directory are reported as soon as it is scanned, and only their counts are kept.
+
+**Parameters:**
+ - input_data (InputData): The program input data, with a verify root.
+ - output_stream (BinaryIO | TextIO): The file-like object to write the summary into.
+ - encoding (str): The encoding used when the output stream is binary. Default: utf-8.
+
+**Returns:**
+ int - The number of Files verified.
+
+**Raises:**
+ SystemExit - If the Parent Path is absolute, or the Directory does not match the TreeScript, so the exit status is non-zero.
+    """
+    from io import TextIOBase
+    from sys import stderr
+    from treescript_files.line_reader import read_input_tree
+    root = input_data.verify_root
+    if input_data.parent_path is not None:
+        from treescript_files.tree_reader import _join_parent_root
+        root = _join_parent_root(root, input_data.parent_path)
+    expected_dirs = _expect_dirs(read_input_tree(input_data.tree_input), root, input_data.tree_filter)
+    missing_count = extra_count = 0
+    for dir_missing, dir_extra in _scan_dirs(expected_dirs, input_data.check_extra, input_data.tree_filter, input_data.jobs):
+        if len(dir_missing) > 0 or len(dir_extra) > 0:
+            stderr.write(''.join(f'Missing: {path}\n' for path in dir_missing) + ''.join(f'Extra: {path}\n' for path in dir_extra))
+            missing_count += len(dir_missing)
+            extra_count += len(dir_extra)
+    files_expected = sum(len(expected.files) for expected in expected_dirs.values())
+    report = f'Verified {files_expected} files in {len(expected_dirs)} directories: ' \
+        f'{missing_count} missing' + (f', {extra_count} extra.\n' if input_data.check_extra else '.\n')
+    output_stream.write(report if isinstance(output_stream, TextIOBase) else report.encode(encoding))
+    if missing_count > 0 or extra_count > 0:
+        output_stream.flush()
+        exit(_MISMATCH_MSG + root)
+    return files_expected
+
+
+def _expect_dirs(
+    tree_data: Iterable[TreeData],
+    root: str,
+    tree_filter: 'TreeFilter | None',
+) -> dict[str, _ExpectedDir]:
+    """ Filter the Tree, and group its expected Files and subdirectories by Directory.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The TreeData of each node, in TreeScript order.
+ - root (str): The Directory that should contain the Tree.
+ - tree_filter (TreeFilter?): The Include and Exclude patterns, or None.
+
+**Returns:**
+ dict[str, _ExpectedDir] - The expected contents of each Directory, in TreeScript order.
+
+**Raises:**
+ SystemExit - If the depth jumps.
+    """
+    if tree_filter is not None:
+        from treescript_files.tree_filter import filter_tree_data
+        tree_data = filter_tree_data(tree_data, tree_filter)
+    return _group_by_dir(tree_data, root, tree_filter is not None and tree_filter.needs_paths())
+
+
+def _scan_dirs(
+    expected_dirs: dict[str, _ExpectedDir],
+    check_extra: bool,
+    tree_filter: 'TreeFilter | None',
+    max_workers: int | None,
+) -> Generator[tuple[list[str], list[str]], None, None]:
+    """ Scan the expected Directories in a pool of threads, and generate the mismatches of each one in TreeScript order.
+ - A limited number of Directories are in progress at once, so finished results are not held for long.
+
+**Parameters:**
+ - expected_dirs (dict[str, _ExpectedDir]): The expected contents of each Directory.
+ - check_extra (bool): Whether to report the entries that are not expected.
+ - tree_filter (TreeFilter?): The patterns that hide extra entries, or None.
+ - max_workers (int?): The number of threads scanning Directories, or None for the ThreadPoolExecutor default.
+
+**Yields:**
+ tuple[list[str], list[str]] - The missing paths, and the extra paths, of each Directory.
+
+**Raises:**
+ SystemExit - If a Directory could not be scanned.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    if max_workers is None:
+        from os import cpu_count
+        # The ThreadPoolExecutor default
+        max_workers = min(32, (cpu_count() or 1) + 4)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = deque()
+    try:
+        for dir_path, expected in expected_dirs.items():
+            pending.append(executor.submit(_scan_dir, dir_path, expected, check_extra, tree_filter))
+            if len(pending) > max_workers * 2:
+                yield pending.popleft().result()
+        while len(pending) > 0:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _group_by_dir(
+    tree_data: Iterable[TreeData],
+    root: str,
+    track_relative: bool,
+) -> dict[str, _ExpectedDir]:
+    """ Group the expected Files and subdirectories by the path of their Directory.
+ - Directories with the same path are merged.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The TreeData of each node, in TreeScript order.
+ - root (str): The Directory that should contain the Tree.
+ - track_relative (bool): Whether to record the relative path of each Directory, for the filter.
+
+**Returns:**
+ dict[str, _ExpectedDir] - The expected contents of each Directory, in TreeScript order.
+
+**Raises:**
+ SystemExit - If the depth jumps.
+    """
+    from os import sep
+    path_stack = PathStack(root if root.endswith(sep) else root + sep)
+    relative_stack = PathStack(path_separator='/') if track_relative else None
+    expected_dirs = {path_stack.join_stack(): _ExpectedDir('' if track_relative else None)}
+    # The expected contents of the Directory at each depth
+    current = [expected_dirs[path_stack.join_stack()]]
+    for node in tree_data:
+        if (delta := node.depth - path_stack.get_depth()) > 0:
+            exit(f'You have jumped {delta} steps in the tree on line: {node.line_number}')
+        elif delta < 0:
+            path_stack.reduce_depth(node.depth)
+            del current[node.depth + 1:]
+            if relative_stack is not None:
+                relative_stack.reduce_depth(node.depth)
+        if not node.is_dir:
+            current[-1].files[node.name] = None
+            continue
+        current[-1].dirs[node.name] = None
+        path_stack.push(node.name)
+        if relative_stack is not None:
+            relative_stack.push(node.name)
+        if (expected := expected_dirs.get(dir_path := path_stack.join_stack())) is None:
+            expected_dirs[dir_path] = expected = _ExpectedDir(
+                None if relative_stack is None else relative_stack.join_stack()
+            )
+        current.append(expected)
+    return expected_dirs
+
+
+def _scan_dir(
+    dir_path: str,
+    expected: _ExpectedDir,
+    check_extra: bool,
+    tree_filter: 'TreeFilter | None',
+) -> tuple[list[str], list[str]]:
+    """ List one Directory, and compare its entries with the expected contents, in a worker thread.
+
+**Parameters:**
+ - dir_path (str): The path of the Directory, ending with a separator.
+ - expected (_ExpectedDir): The expected Files and subdirectories.
+ - check_extra (bool): Whether to report the entries that are not expected.
+ - tree_filter (TreeFilter?): The patterns that hide extra entries, or None.
+
+**Returns:**
+ tuple[list[str], list[str]] - The missing paths, and the extra paths.
+
+**Raises:**
+ SystemExit - If the Directory exists, but could not be scanned.
+    """
+    from os import scandir, sep
+    try:
+        with scandir(dir_path) as entries:
+            on_disk = {entry.name: entry.is_dir() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        # The Directory and all of its Files are missing
+        return [dir_path] + [dir_path + name for name in expected.files], []
+    except OSError:
+        exit(_SCAN_FAILED_MSG + dir_path)
+    missing = [dir_path + name for name in expected.files if on_disk.get(name, True)]
+    if not check_extra:
+        return missing, []
+    path_stack = None
+    if tree_filter is not None and expected.relative_path is not None:
+        path_stack = PathStack(expected.relative_path, path_separator='/')
+    extra = []
+    for name, is_dir in on_disk.items():
+        if name in expected.files or name in expected.dirs:
+            continue
+        if tree_filter is not None and (
+            tree_filter.excludes_dir(name, path_stack) if is_dir else not tree_filter.includes_file(name, path_stack)
+        ):
+            continue
+        extra.append(dir_path + name + sep if is_dir else dir_path + name)
+    return missing, sorted(extra)